@@ -1,76 +1,85 @@
 """
 API Dependencies and utilities
 """
-import logging
-from typing import Generator
-from uuid import UUID
-from fastapi import Depends, HTTPException, status, Header, Request
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from functools import lru_cache
+from typing import Tuple
+
+from fastapi import Depends
 from sqlalchemy.orm import Session
-from typing import Optional
 
-from app.core.database import get_db, SessionLocal
-from app.core.auth_client import AuthServiceClient
+from app.core.database import get_db
 from app.repositories import (
-    AIAgentRepository, MCPToolRepository, LLMRepository,
+    AIAgentRepository, AgentJobRepository, MCPToolRepository, LLMRepository,
     RAGConnectorRepository, WorkflowRepository, WorkflowComponentDefinitionRepository,
     SecurityRoleRepository, MetricsRepository, OrganizationRepository, RestAPIRepository,
-    IntentDataRepository
+    RestAPIImportJobRepository, IntentDataRepository
 )
-from app.repositories.intent_data_repository import IntentDataRepository
 from app.services import (
     AIAgentService, MCPToolService, LLMService,
     RAGConnectorService, WorkflowService, WorkflowComponentDefinitionService,
-    SecurityService, OrganizationService, RestAPIService
+    SecurityService, OrganizationService, RestAPIService, IntentDataService
 )
 
-# Security
-security = HTTPBearer(auto_error=False)
-auth_client = AuthServiceClient()
-logger = logging.getLogger(__name__)
+# Shared session dependency, reused by every repository provider below
+_DB_DEP = Depends(get_db)
+
+
+@lru_cache(maxsize=1024)
+def parse_tags(raw: str) -> Tuple[str, ...]:
+    """Split a comma-separated tags query parameter (memoized - clients repeat the same filters)"""
+    return tuple(tag.strip() for tag in raw.split(',') if tag.strip())
+
 
 # Repository Dependencies
-def get_ai_agent_repository(db: Session = Depends(get_db)) -> AIAgentRepository:
+def get_ai_agent_repository(db: Session = _DB_DEP) -> AIAgentRepository:
     return AIAgentRepository(db)
 
 
-def get_mcp_tool_repository(db: Session = Depends(get_db)) -> MCPToolRepository:
+def get_agent_job_repository(db: Session = _DB_DEP) -> AgentJobRepository:
+    return AgentJobRepository(db)
+
+
+def get_mcp_tool_repository(db: Session = _DB_DEP) -> MCPToolRepository:
     return MCPToolRepository(db)
 
 
-def get_llm_repository(db: Session = Depends(get_db)) -> LLMRepository:
+def get_llm_repository(db: Session = _DB_DEP) -> LLMRepository:
     return LLMRepository(db)
 
 
-def get_rag_connector_repository(db: Session = Depends(get_db)) -> RAGConnectorRepository:
+def get_rag_connector_repository(db: Session = _DB_DEP) -> RAGConnectorRepository:
     return RAGConnectorRepository(db)
 
 
-def get_workflow_repository(db: Session = Depends(get_db)) -> WorkflowRepository:
+def get_workflow_repository(db: Session = _DB_DEP) -> WorkflowRepository:
     return WorkflowRepository(db)
 
 
-def get_security_role_repository(db: Session = Depends(get_db)) -> SecurityRoleRepository:
+def get_security_role_repository(db: Session = _DB_DEP) -> SecurityRoleRepository:
     return SecurityRoleRepository(db)
 
 
-def get_metrics_repository(db: Session = Depends(get_db)) -> MetricsRepository:
+def get_metrics_repository(db: Session = _DB_DEP) -> MetricsRepository:
     return MetricsRepository(db)
 
 
-def get_organization_repository(db: Session = Depends(get_db)) -> OrganizationRepository:
+def get_organization_repository(db: Session = _DB_DEP) -> OrganizationRepository:
     return OrganizationRepository(db)
 
 
-def get_rest_api_repository(db: Session = Depends(get_db)) -> RestAPIRepository:
+def get_rest_api_repository(db: Session = _DB_DEP) -> RestAPIRepository:
     return RestAPIRepository(db)
 
 
-def get_intent_data_repository(db: Session = Depends(get_db)) -> IntentDataRepository:
+def get_rest_api_import_job_repository(db: Session = _DB_DEP) -> RestAPIImportJobRepository:
+    return RestAPIImportJobRepository(db)
+
+
+def get_intent_data_repository(db: Session = _DB_DEP) -> IntentDataRepository:
     return IntentDataRepository(db)
 
 
-def get_workflow_component_definition_repository(db: Session = Depends(get_db)) -> WorkflowComponentDefinitionRepository:
+def get_workflow_component_definition_repository(db: Session = _DB_DEP) -> WorkflowComponentDefinitionRepository:
     return WorkflowComponentDefinitionRepository(db)
 
 
@@ -96,9 +105,10 @@ def get_rag_connector_service(
 
 def get_rest_api_service(
     repository: RestAPIRepository = Depends(get_rest_api_repository),
-    intent_data_repository: IntentDataRepository = Depends(get_intent_data_repository)
+    intent_data_repository: IntentDataRepository = Depends(get_intent_data_repository),
+    import_job_repository: RestAPIImportJobRepository = Depends(get_rest_api_import_job_repository)
 ) -> RestAPIService:
-    return RestAPIService(repository, intent_data_repository)
+    return RestAPIService(repository, intent_data_repository, import_job_repository)
 
 
 def get_workflow_service(
@@ -112,9 +122,10 @@ def get_workflow_service(
 
 
 def get_ai_agent_service(
-    repository: AIAgentRepository = Depends(get_ai_agent_repository)
+    repository: AIAgentRepository = Depends(get_ai_agent_repository),
+    job_repository: AgentJobRepository = Depends(get_agent_job_repository)
 ) -> AIAgentService:
-    return AIAgentService(repository)
+    return AIAgentService(repository, job_repository)
 
 
 def get_security_service(
@@ -129,6 +140,12 @@ def get_organization_service(
     return OrganizationService(repository)
 
 
+def get_intent_data_service(
+    repository: IntentDataRepository = Depends(get_intent_data_repository)
+) -> IntentDataService:
+    return IntentDataService(repository)
+
+
 def get_workflow_component_definition_service(
     repository: WorkflowComponentDefinitionRepository = Depends(get_workflow_component_definition_repository)
 ) -> WorkflowComponentDefinitionService:
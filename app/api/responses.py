@@ -0,0 +1,35 @@
+"""
+Response helpers for API endpoints
+"""
+from itertools import chain
+from typing import Iterator
+from fastapi import Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+
+def model_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Serialize an already-validated model straight to a JSON response
+    
+    Returning a Response skips FastAPI's response_model validation, which would
+    otherwise validate the model a second time. The route's response_model
+    still documents the schema.
+    """
+    return Response(content=model.model_dump_json(), status_code=status_code, media_type="application/json")
+
+
+def streaming_json_response(body: Iterator[bytes], db: Session) -> StreamingResponse:
+    """
+    Stream a JSON body that reads through a session of its own
+    
+    The request's session has done its work by now (the permission check), so it
+    is closed first and its connection handed back: the response holds one
+    connection while it streams, not two. The body's first chunk is produced
+    here, after its first batch is fetched, so a failing query still raises
+    before the response starts instead of cutting off a 200 mid-body.
+    """
+    db.close()
+    first_chunk = next(body)
+    return StreamingResponse(chain((first_chunk,), body), media_type="application/json")
@@ -3,10 +3,12 @@ AI Agents API endpoints with authorization
 """
 from typing import List
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 
-from app.schemas import AIAgent, AIAgentCreate, AIAgentUpdate, Workflow, WorkflowCreate, ListResponse
+from app.schemas import AIAgent, AIAgentCreate, AIAgentUpdate, AgentJobResponse, Workflow, WorkflowCreate, ListResponse
 from app.services import AIAgentService, WorkflowService, LLMService
+from app.services.ai_agent_service import run_agent_job
 from app.api.dependencies import get_ai_agent_service, get_workflow_service, get_llm_service
 from app.core.exceptions import NotFoundError, ConflictError
 from app.middleware.authorization import (
@@ -17,27 +19,38 @@ from app.middleware.transaction import get_transaction_manager, TransactionManag
 
 router = APIRouter(prefix="/agents", tags=["AI Agents"])
 
+# Shared dependency markers, reused across the endpoints below
+_AGENT_SERVICE_DEP = Depends(get_ai_agent_service)
+_WORKFLOW_SERVICE_DEP = Depends(get_workflow_service)
+_LLM_SERVICE_DEP = Depends(get_llm_service)
+_TRANSACTION_MANAGER_DEP = Depends(get_transaction_manager)
+_AGENT_CREATE_DEP = Depends(RequireAgentCreate)
+_AGENT_READ_DEP = Depends(RequireAgentRead)
+_AGENT_UPDATE_DEP = Depends(RequireAgentUpdate)
+_AGENT_DELETE_DEP = Depends(RequireAgentDelete)
+_WORKFLOW_READ_DEP = Depends(RequireWorkflowRead)
+_WORKFLOW_CREATE_DEP = Depends(RequireWorkflowCreate)
+
 
 @router.get("", response_model=ListResponse)
-async def list_agents(
-    auth: tuple = Depends(RequireAgentRead),
-    agent_service: AIAgentService = Depends(get_ai_agent_service),
-    workflow_service: WorkflowService = Depends(get_workflow_service)
+def list_agents(
+    auth: tuple = _AGENT_READ_DEP,
+    agent_service: AIAgentService = _AGENT_SERVICE_DEP
 ):
     """List all AI agents for the current user/organization with their default workflow IDs"""
     user_id, organization_id = auth
-    agents = agent_service.list_agents(organization_id, workflow_service)
-    return ListResponse(items=agents, total=len(agents))
+    agents, total = agent_service.list_agents(organization_id)
+    return ListResponse(items=agents, total=total)
 
 
 @router.post("", response_model=AIAgent, status_code=status.HTTP_201_CREATED)
-async def create_agent(
+def create_agent(
     agent: AIAgentCreate,
-    auth: tuple = Depends(RequireAgentCreate),
-    agent_service: AIAgentService = Depends(get_ai_agent_service),
-    workflow_service: WorkflowService = Depends(get_workflow_service),
-    llm_service: LLMService = Depends(get_llm_service),
-    transaction_manager: TransactionManager = Depends(get_transaction_manager)
+    auth: tuple = _AGENT_CREATE_DEP,
+    agent_service: AIAgentService = _AGENT_SERVICE_DEP,
+    workflow_service: WorkflowService = _WORKFLOW_SERVICE_DEP,
+    llm_service: LLMService = _LLM_SERVICE_DEP,
+    transaction_manager: TransactionManager = _TRANSACTION_MANAGER_DEP
 ):
     """Create a new AI agent with a default workflow atomically"""
     user_id, organization_id = auth
@@ -52,65 +65,58 @@ async def create_agent(
         }
         
         # Execute the orchestrated agent creation atomically
-        def atomic_agent_creation():
-            return agent_service.create_agent_with_default_workflow(
-                agent_data=agent_data,
-                organization_id=organization_id,
-                workflow_service=workflow_service,
-                llm_service=llm_service
-            )
-        
-        result = transaction_manager.execute_atomic([atomic_agent_creation])
-        return result
+        return transaction_manager.run_atomic(
+            agent_service.create_agent_with_default_workflow,
+            agent_data=agent_data,
+            organization_id=organization_id,
+            workflow_service=workflow_service,
+            llm_service=llm_service
+        )
         
     except ConflictError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
 
 @router.get("/{agent_id}", response_model=AIAgent)
-async def get_agent(
-    agent_id: str,
-    auth: tuple = Depends(RequireAgentRead),
-    agent_service: AIAgentService = Depends(get_ai_agent_service),
-    workflow_service: WorkflowService = Depends(get_workflow_service)
+def get_agent(
+    agent_id: UUID,
+    auth: tuple = _AGENT_READ_DEP,
+    agent_service: AIAgentService = _AGENT_SERVICE_DEP,
+    workflow_service: WorkflowService = _WORKFLOW_SERVICE_DEP
 ):
     """Get a specific AI agent with its default workflow ID"""
     user_id, organization_id = auth
     try:
-        agent = agent_service.get_agent(UUID(agent_id), organization_id, workflow_service)
+        agent = agent_service.get_agent(agent_id, organization_id, workflow_service)
         return agent
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except ValueError:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid agent ID format")
 
 
 @router.put("/{agent_id}", response_model=AIAgent)
-async def update_agent(
-    agent_id: str,
+def update_agent(
+    agent_id: UUID,
     agent: AIAgentUpdate,
-    auth: tuple = Depends(RequireAgentUpdate),
-    agent_service: AIAgentService = Depends(get_ai_agent_service)
+    auth: tuple = _AGENT_UPDATE_DEP,
+    agent_service: AIAgentService = _AGENT_SERVICE_DEP
 ):
     """Update an AI agent"""
     user_id, organization_id = auth
     try:
-        update_data = agent.dict(exclude_unset=True)
-        updated_agent = agent_service.update_agent(UUID(agent_id), organization_id, **update_data)
+        update_data = agent.model_dump(exclude_unset=True)
+        updated_agent = agent_service.update_agent(agent_id, organization_id, **update_data)
         return updated_agent
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except ValueError:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid agent ID format")
 
 
 @router.delete("/{agent_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_agent(
-    agent_id: str,
-    auth: tuple = Depends(RequireAgentDelete),
-    agent_service: AIAgentService = Depends(get_ai_agent_service),
-    workflow_service: WorkflowService = Depends(get_workflow_service),
-    transaction_manager: TransactionManager = Depends(get_transaction_manager)
+def delete_agent(
+    agent_id: UUID,
+    auth: tuple = _AGENT_DELETE_DEP,
+    agent_service: AIAgentService = _AGENT_SERVICE_DEP,
+    workflow_service: WorkflowService = _WORKFLOW_SERVICE_DEP,
+    transaction_manager: TransactionManager = _TRANSACTION_MANAGER_DEP
 ):
     """Delete an AI agent and all its associated workflows
     
@@ -123,26 +129,22 @@ async def delete_agent(
     
     try:
         # Execute the deletion atomically (workflows are always deleted with the agent)
-        def atomic_agent_deletion():
-            return agent_service.delete_agent_with_workflows(
-                agent_id=UUID(agent_id),
-                organization_id=organization_id,
-                workflow_service=workflow_service
-            )
-        
-        transaction_manager.execute_atomic([atomic_agent_deletion])
+        transaction_manager.run_atomic(
+            agent_service.delete_agent_with_workflows,
+            agent_id=agent_id,
+            organization_id=organization_id,
+            workflow_service=workflow_service
+        )
         
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except ValueError:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid agent ID format")
 
 
 @router.get("/{agent_id}/workflows", response_model=ListResponse)
-async def get_agent_workflows(
-    agent_id: str,
-    auth: tuple = Depends(RequireWorkflowRead),
-    workflow_service: WorkflowService = Depends(get_workflow_service)
+def get_agent_workflows(
+    agent_id: UUID,
+    auth: tuple = _WORKFLOW_READ_DEP,
+    workflow_service: WorkflowService = _WORKFLOW_SERVICE_DEP
 ):
     """Get workflows for an AI agent"""
     user_id, organization_id = auth
@@ -154,79 +156,95 @@ async def get_agent_workflows(
 
 
 @router.post("/{agent_id}/workflows", response_model=Workflow, status_code=status.HTTP_201_CREATED)
-async def create_agent_workflow(
-    agent_id: str,
+def create_agent_workflow(
+    agent_id: UUID,
     workflow: WorkflowCreate,
-    auth: tuple = Depends(RequireWorkflowCreate),
-    workflow_service: WorkflowService = Depends(get_workflow_service)
+    auth: tuple = _WORKFLOW_CREATE_DEP,
+    workflow_service: WorkflowService = _WORKFLOW_SERVICE_DEP
 ):
     """Create a new workflow for an AI agent"""
     user_id, organization_id = auth
     try:
-        # Convert the entire workflow to dict first, then extract nested objects
-        workflow_dict = workflow.dict()
-        
-        # Ensure the agent_id is set to the one from the URL path
-        workflow_dict['agent_id'] = agent_id
-        
         new_workflow = workflow_service.create_workflow(
             organization_id=organization_id,
-            name=workflow_dict['name'],
-            description=workflow_dict.get('description'),
-            agent_id=workflow_dict['agent_id'],
-            nodes=workflow_dict.get('nodes', []),
-            edges=workflow_dict.get('edges', []),
-            status=workflow_dict.get('status', 'draft')
+            name=workflow.name,
+            description=workflow.description,
+            agent_id=agent_id,  # The agent from the URL path always wins
+            nodes=workflow.nodes or [],
+            edges=workflow.edges or [],
+            status=workflow.status or 'draft'
         )
         return new_workflow
     except ConflictError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
 
-@router.get("/{agent_id}/status", response_model=dict)
-async def get_agent_status(
-    agent_id: str,
-    auth: tuple = Depends(RequireAgentRead),
-    agent_service: AIAgentService = Depends(get_ai_agent_service)
+@router.get("/{agent_id}/status")
+def get_agent_status(
+    agent_id: UUID,
+    auth: tuple = _AGENT_READ_DEP,
+    agent_service: AIAgentService = _AGENT_SERVICE_DEP
 ):
     """Get status of an AI agent"""
     user_id, organization_id = auth
     try:
-        status_info = agent_service.get_agent_status(UUID(agent_id), UUID(organization_id))
-        return status_info
+        status_info = agent_service.get_agent_status(agent_id, organization_id)
+        return ORJSONResponse(status_info)
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
-@router.post("/{agent_id}/execute", response_model=dict)
-async def execute_agent(
-    agent_id: str,
+@router.post("/{agent_id}/execute", response_model=AgentJobResponse, status_code=status.HTTP_202_ACCEPTED)
+def execute_agent(
+    agent_id: UUID,
     request_data: dict,
-    auth: tuple = Depends(RequireAgentRead),  # Execute requires read permissions
-    agent_service: AIAgentService = Depends(get_ai_agent_service)
+    background_tasks: BackgroundTasks,
+    auth: tuple = _AGENT_READ_DEP,  # Execute requires read permissions
+    agent_service: AIAgentService = _AGENT_SERVICE_DEP
 ):
-    """Execute an AI agent"""
+    """Queue execution of an AI agent; poll the returned job for its result"""
     user_id, organization_id = auth
     try:
-        result = agent_service.execute_agent(UUID(agent_id), organization_id, request_data)
-        return result
+        job = agent_service.queue_execution(agent_id, organization_id)
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    
+    background_tasks.add_task(run_agent_job, job, request_data)
+    return ORJSONResponse(job, status_code=status.HTTP_202_ACCEPTED)
 
 
-@router.post("/{agent_id}/training/start", response_model=dict)
-async def start_agent_training(
-    agent_id: str,
+@router.post("/{agent_id}/training/start", response_model=AgentJobResponse, status_code=status.HTTP_202_ACCEPTED)
+def start_agent_training(
+    agent_id: UUID,
     training_data: dict,
-    auth: tuple = Depends(RequireAgentUpdate),  # Training requires update permissions
-    agent_service: AIAgentService = Depends(get_ai_agent_service)
+    background_tasks: BackgroundTasks,
+    auth: tuple = _AGENT_UPDATE_DEP,  # Training requires update permissions
+    agent_service: AIAgentService = _AGENT_SERVICE_DEP
 ):
-    """Start training for an AI agent"""
+    """Queue training for an AI agent; poll the returned job for its progress"""
     user_id, organization_id = auth
     try:
-        result = agent_service.start_training(UUID(agent_id), organization_id, training_data)
-        return result
+        job = agent_service.queue_training(agent_id, organization_id)
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except ConflictError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    
+    background_tasks.add_task(run_agent_job, job, training_data)
+    return ORJSONResponse(job, status_code=status.HTTP_202_ACCEPTED)
+
+
+@router.get("/{agent_id}/jobs/{job_id}", response_model=AgentJobResponse)
+def get_agent_job(
+    agent_id: UUID,
+    job_id: UUID,
+    auth: tuple = _AGENT_READ_DEP,
+    agent_service: AIAgentService = _AGENT_SERVICE_DEP
+):
+    """Get the status and result of an AI agent execution or training job"""
+    user_id, organization_id = auth
+    try:
+        job = agent_service.get_job(agent_id, job_id, organization_id)
+        return ORJSONResponse(job)
+    except NotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -16,7 +16,7 @@ router = APIRouter(prefix="/llms", tags=["LLMs"])
 
 
 @router.get("", response_model=ListResponse)
-async def list_llms(
+def list_llms(
     auth: tuple = Depends(RequireLLMRead),
     llm_service: LLMService = Depends(get_llm_service)
 ):
@@ -27,7 +27,7 @@ async def list_llms(
 
 
 @router.post("", response_model=LLM, status_code=status.HTTP_201_CREATED)
-async def create_llm(
+def create_llm(
     llm: LLMCreate,
     auth: tuple = Depends(RequireLLMCreate),
     llm_service: LLMService = Depends(get_llm_service)
@@ -37,7 +37,7 @@ async def create_llm(
     try:
         created_llm = llm_service.create_llm(
             organization_id=organization_id,
-            **llm.dict()
+            **llm.model_dump()
         )
         return created_llm
     except ConflictError as e:
@@ -45,7 +45,7 @@ async def create_llm(
 
 
 @router.get("/{llm_id}", response_model=LLM)
-async def get_llm(
+def get_llm(
     llm_id: str,
     auth: tuple = Depends(RequireLLMRead),
     llm_service: LLMService = Depends(get_llm_service)
@@ -60,7 +60,7 @@ async def get_llm(
 
 
 @router.put("/{llm_id}", response_model=LLM)
-async def update_llm(
+def update_llm(
     llm_id: str,
     llm: LLMUpdate,
     auth: tuple = Depends(RequireLLMUpdate),
@@ -69,7 +69,7 @@ async def update_llm(
     """Update LLM configuration"""
     user_id, organization_id = auth
     try:
-        llm_data = llm.dict(exclude_unset=True)
+        llm_data = llm.model_dump(exclude_unset=True)
         updated_llm = llm_service.update_llm(llm_id, **llm_data)
         return updated_llm
     except NotFoundError as e:
@@ -79,7 +79,7 @@ async def update_llm(
 
 
 @router.delete("/{llm_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_llm(
+def delete_llm(
     llm_id: str,
     auth: tuple = Depends(RequireLLMDelete),
     llm_service: LLMService = Depends(get_llm_service)
@@ -93,7 +93,7 @@ async def delete_llm(
 
 
 @router.post("/{llm_id}/test", response_model=dict)
-async def test_llm_connection(
+def test_llm_connection(
     llm_id: str,
     auth: tuple = Depends(RequireLLMRead),
     llm_service: LLMService = Depends(get_llm_service)
@@ -110,7 +110,7 @@ async def test_llm_connection(
 
 
 @router.get("/{llm_id}/usage", response_model=dict)
-async def get_llm_usage_stats(
+def get_llm_usage_stats(
     llm_id: str,
     auth: tuple = Depends(RequireLLMRead),
     llm_service: LLMService = Depends(get_llm_service)
@@ -2,42 +2,54 @@
 MCP Tools API endpoints
 """
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 
 from app.schemas import MCPTool, MCPToolCreate, MCPToolUpdate, ListResponse
 from app.services import MCPToolService
 from app.api.dependencies import get_mcp_tool_service
 from app.core.exceptions import NotFoundError, ConflictError
+from app.core.etag import version_etag, etag_matches, not_modified
 from app.middleware.authorization import (
     RequireMCPCreate, RequireMCPRead, RequireMCPUpdate, RequireMCPDelete
 )
 
 router = APIRouter(prefix="/mcp-tools", tags=["MCP Tools"])
 
+# Shared dependency markers, reused across the endpoints below
+_MCP_SERVICE_DEP = Depends(get_mcp_tool_service)
+_MCP_CREATE_DEP = Depends(RequireMCPCreate)
+_MCP_READ_DEP = Depends(RequireMCPRead)
+_MCP_UPDATE_DEP = Depends(RequireMCPUpdate)
+_MCP_DELETE_DEP = Depends(RequireMCPDelete)
+
 
 @router.get("", response_model=ListResponse)
-async def list_mcp_tools(
-    auth: tuple = Depends(RequireMCPRead),
-    mcp_service: MCPToolService = Depends(get_mcp_tool_service)
+def list_mcp_tools(
+    auth: tuple = _MCP_READ_DEP,
+    mcp_service: MCPToolService = _MCP_SERVICE_DEP,
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
+    offset: int = Query(0, ge=0, description="Number of results to skip")
 ):
-    """List all MCP tools for the current organization"""
+    """List MCP tools for the current organization"""
     user_id, organization_id = auth
-    tools = mcp_service.list_tools(organization_id)
-    return ListResponse(items=tools, total=len(tools))
+    tools, total = mcp_service.list_tools_page(organization_id, limit, offset)
+    # The service already returns JSON-ready dicts; skip response model re-validation
+    return ORJSONResponse({"items": tools, "total": total, "page": None, "page_size": None})
 
 
 @router.post("", response_model=MCPTool, status_code=status.HTTP_201_CREATED)
-async def create_mcp_tool(
+def create_mcp_tool(
     tool: MCPToolCreate,
-    auth: tuple = Depends(RequireMCPCreate),
-    mcp_service: MCPToolService = Depends(get_mcp_tool_service)
+    auth: tuple = _MCP_CREATE_DEP,
+    mcp_service: MCPToolService = _MCP_SERVICE_DEP
 ):
     """Register a new MCP tool"""
     user_id, organization_id = auth
     try:
         created_tool = mcp_service.create_tool(
             organization_id=organization_id,
-            **tool.dict()
+            **tool.model_dump()
         )
         return created_tool
     except ConflictError as e:
@@ -45,32 +57,38 @@ async def create_mcp_tool(
 
 
 @router.get("/{tool_id}", response_model=MCPTool)
-async def get_mcp_tool(
+def get_mcp_tool(
     tool_id: str,
-    auth: tuple = Depends(RequireMCPRead),
-    mcp_service: MCPToolService = Depends(get_mcp_tool_service)
+    request: Request,
+    response: Response,
+    auth: tuple = _MCP_READ_DEP,
+    mcp_service: MCPToolService = _MCP_SERVICE_DEP
 ):
     """Get a specific MCP tool"""
     user_id, organization_id = auth
     try:
-        tool = mcp_service.get_tool(tool_id)
+        tool = mcp_service.get_tool(tool_id, organization_id)
+        etag = version_etag(tool["id"], tool["updated_at"])
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        response.headers["ETag"] = etag
         return tool
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
 @router.put("/{tool_id}", response_model=MCPTool)
-async def update_mcp_tool(
+def update_mcp_tool(
     tool_id: str,
     tool: MCPToolUpdate,
-    auth: tuple = Depends(RequireMCPUpdate),
-    mcp_service: MCPToolService = Depends(get_mcp_tool_service)
+    auth: tuple = _MCP_UPDATE_DEP,
+    mcp_service: MCPToolService = _MCP_SERVICE_DEP
 ):
     """Update MCP tool configuration"""
     user_id, organization_id = auth
     try:
-        tool_data = tool.dict(exclude_unset=True)
-        updated_tool = mcp_service.update_tool(tool_id, **tool_data)
+        tool_data = tool.model_dump(exclude_unset=True)
+        updated_tool = mcp_service.update_tool(tool_id, organization_id, **tool_data)
         return updated_tool
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -79,15 +97,15 @@ async def update_mcp_tool(
 
 
 @router.delete("/{tool_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_mcp_tool(
+def delete_mcp_tool(
     tool_id: str,
-    auth: tuple = Depends(RequireMCPDelete),
-    mcp_service: MCPToolService = Depends(get_mcp_tool_service)
+    auth: tuple = _MCP_DELETE_DEP,
+    mcp_service: MCPToolService = _MCP_SERVICE_DEP
 ):
     """Unregister an MCP tool"""
     user_id, organization_id = auth
     try:
-        mcp_service.delete_tool(tool_id)
+        mcp_service.delete_tool(tool_id, organization_id)
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
@@ -95,13 +113,13 @@ async def delete_mcp_tool(
 @router.post("/{tool_id}/test", response_model=dict)
 async def test_mcp_tool(
     tool_id: str,
-    auth: tuple = Depends(RequireMCPRead),
-    mcp_service: MCPToolService = Depends(get_mcp_tool_service)
+    auth: tuple = _MCP_READ_DEP,
+    mcp_service: MCPToolService = _MCP_SERVICE_DEP
 ):
     """Test MCP tool connectivity and functionality"""
     user_id, organization_id = auth
     try:
-        result = mcp_service.test_tool_connection(tool_id)
+        result = await mcp_service.test_tool_connection(tool_id, organization_id)
         return {"status": "success", "result": result}
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -113,13 +131,13 @@ async def test_mcp_tool(
 async def execute_mcp_tool(
     tool_id: str,
     parameters: dict,
-    auth: tuple = Depends(RequireMCPRead),
-    mcp_service: MCPToolService = Depends(get_mcp_tool_service)
+    auth: tuple = _MCP_READ_DEP,
+    mcp_service: MCPToolService = _MCP_SERVICE_DEP
 ):
     """Execute an MCP tool with given parameters"""
     user_id, organization_id = auth
     try:
-        result = mcp_service.execute_tool(tool_id, parameters)
+        result = await mcp_service.execute_tool(tool_id, organization_id, parameters)
         return {"status": "success", "result": result}
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -130,13 +148,18 @@ async def execute_mcp_tool(
 @router.get("/{tool_id}/schema", response_model=dict)
 async def get_mcp_tool_schema(
     tool_id: str,
-    auth: tuple = Depends(RequireMCPRead),
-    mcp_service: MCPToolService = Depends(get_mcp_tool_service)
+    request: Request,
+    response: Response,
+    auth: tuple = _MCP_READ_DEP,
+    mcp_service: MCPToolService = _MCP_SERVICE_DEP
 ):
     """Get the input/output schema for an MCP tool"""
     user_id, organization_id = auth
     try:
-        schema = mcp_service.get_tool_schema(tool_id)
+        schema, etag = await mcp_service.get_tool_schema_with_etag(tool_id, organization_id)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        response.headers["ETag"] = etag
         return {"tool_id": tool_id, "schema": schema}
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -1,11 +1,15 @@
 """
 Organization API endpoints for ControlTower service
 """
-from typing import List
+from itertools import islice
+from typing import Iterable, Iterator, List
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_organization_service, get_ai_agent_service, get_workflow_service, get_llm_service
+from app.api.responses import streaming_json_response
 from app.middleware.authorization import get_current_user_id
 from app.services.organization_service import OrganizationService
 from app.services import AIAgentService, WorkflowService, LLMService
@@ -14,14 +18,53 @@ from app.schemas.organization import (
     OrganizationResponse,
     OrganizationUserResponse,
     UserOrganizationResponse,
-    AddUserToOrganizationRequest,
-    OrganizationRole
+    AddUserToOrganizationRequest
 )
+from app.models.organization import OrganizationRole
+from app.repositories.organization_repository import OrganizationRepository
+from app.core.database import get_db, readonly_session
+from app.core.etag import version_etag, etag_matches, not_modified
 
 router = APIRouter(prefix="/organizations", tags=["Organizations"])
 
+# Roles allowed to manage an organization's members (as stored on OrganizationUser)
+_ADMIN_ROLES = frozenset({OrganizationRole.ADMIN, OrganizationRole.OWNER})
+
+# List responses are validated and serialized in one pass by pydantic-core;
+# the routes return the JSON directly so FastAPI does not validate them again
+_ORG_LIST_ADAPTER = TypeAdapter(List[UserOrganizationResponse])
+_USER_LIST_ADAPTER = TypeAdapter(List[OrganizationUserResponse])
+
+
+def _json_list_response(adapter: TypeAdapter, items) -> Response:
+    """Validate rows (ORM objects or dicts) and return them as a JSON response"""
+    rows = adapter.validate_python(items, from_attributes=True)
+    return Response(content=adapter.dump_json(rows), media_type="application/json")
+
+
+def _json_array_stream(adapter: TypeAdapter, items: Iterable, batch_size: int = 500) -> Iterator[bytes]:
+    """
+    Serialize rows as a JSON array a batch at a time, so large lists are never held in full
+    Nothing is yielded until the first batch is fetched.
+    """
+    items = iter(items)
+    head = b"["
+    while batch := list(islice(items, batch_size)):
+        rows = adapter.validate_python(batch, from_attributes=True)
+        yield head + adapter.dump_json(rows)[1:-1]
+        head = b","
+    # On an empty list the opening bracket has not been sent yet
+    yield b"]" if head == b"," else b"[]"
+
+
+def _organization_users_stream(organization_id: UUID) -> Iterator[bytes]:
+    """Stream an organization's users through a session of its own, not the request's"""
+    with readonly_session() as db:
+        users = OrganizationService(OrganizationRepository(db)).iter_organization_users(organization_id)
+        yield from _json_array_stream(_USER_LIST_ADAPTER, users)
+
 @router.post("/", response_model=OrganizationResponse, status_code=status.HTTP_201_CREATED)
-async def create_organization(
+def create_organization(
     organization_data: OrganizationCreate,
     current_user_id: UUID = Depends(get_current_user_id),
     service: OrganizationService = Depends(get_organization_service),
@@ -30,150 +73,115 @@ async def create_organization(
     llm_service: LLMService = Depends(get_llm_service)
 ):
     """Create a new organization"""
-    try:
-        organization = service.create_organization_with_sample_agent(
-            organization_data.name,
-            organization_data.description,
-            current_user_id,  # Already UUID from dependency
-            organization_data.type,
-            agent_service,
-            workflow_service,
-            llm_service
-        )
-        return OrganizationResponse.from_orm(organization)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create organization: {str(e)}"
-        )
+    organization = service.create_organization_with_sample_agent(
+        organization_data.name,
+        organization_data.description,
+        current_user_id,  # Already UUID from dependency
+        organization_data.type,
+        agent_service,
+        workflow_service,
+        llm_service
+    )
+    return OrganizationResponse.from_orm(organization)
 
 @router.get("/", response_model=List[UserOrganizationResponse])
-async def get_user_organizations(
+def get_user_organizations(
     current_user_id: UUID = Depends(get_current_user_id),
     service: OrganizationService = Depends(get_organization_service)
 ):
     """Get all organizations for the current user"""
-    try:
-        organizations = service.get_user_organizations(current_user_id)
-        return [UserOrganizationResponse.from_orm(org) for org in organizations]
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch user organizations: {str(e)}"
-        )
+    organizations = service.get_user_organizations(current_user_id)
+    return _json_list_response(_ORG_LIST_ADAPTER, organizations)
 
 @router.get("/{organization_id}", response_model=OrganizationResponse)
-async def get_organization(
-    organization_id: str,
+def get_organization(
+    organization_id: UUID,
+    request: Request,
+    response: Response,
     current_user_id: UUID = Depends(get_current_user_id),
     service: OrganizationService = Depends(get_organization_service)
 ):
     """Get a specific organization by ID"""
-    try:
-        organization = service.get_organization_by_id(UUID(organization_id))
-        if not organization:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Organization not found"
-            )
-        
-        return OrganizationResponse.from_orm(organization)
-    except HTTPException:
-        raise
-    except Exception as e:
+    organization = service.get_organization_by_id(organization_id)
+    if not organization:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch organization: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Organization not found"
         )
+    
+    etag = version_etag(organization.id, organization.updated_at.isoformat())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return OrganizationResponse.from_orm(organization)
 
 @router.get("/{organization_id}/users", response_model=List[OrganizationUserResponse])
-async def get_organization_users(
-    organization_id: str,
+def get_organization_users(
+    organization_id: UUID,
     current_user_id: UUID = Depends(get_current_user_id),
-    service: OrganizationService = Depends(get_organization_service)
+    service: OrganizationService = Depends(get_organization_service),
+    db: Session = Depends(get_db)
 ):
     """Get all users in an organization"""
-    try:
-        # Check if current user is an admin or owner of the organization
-        user_role = service.get_user_role_in_organization(UUID(organization_id), current_user_id)
-        if user_role not in [OrganizationRole.ADMIN, OrganizationRole.OWNER]:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied: Admin or Owner role required"
-            )
-        
-        users = service.get_organization_users(UUID(organization_id))
-        return [OrganizationUserResponse.from_orm(user) for user in users]
-    except HTTPException:
-        raise
-    except Exception as e:
+    # Check if current user is an admin or owner of the organization
+    user_role = service.get_user_role_in_organization(organization_id, current_user_id)
+    if user_role not in _ADMIN_ROLES:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch organization users: {str(e)}"
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied: Admin or Owner role required"
         )
+    
+    return streaming_json_response(_organization_users_stream(organization_id), db)
 
 @router.post("/{organization_id}/users", status_code=status.HTTP_201_CREATED)
-async def add_user_to_organization(
-    organization_id: str,
+def add_user_to_organization(
+    organization_id: UUID,
     request: AddUserToOrganizationRequest,
     current_user_id: UUID = Depends(get_current_user_id),
     service: OrganizationService = Depends(get_organization_service)
 ):
     """Add a user to an organization"""
-    try:
-        # Check if current user is an admin or owner of the organization
-        user_role = service.get_user_role_in_organization(UUID(organization_id), current_user_id)
-        if user_role not in [OrganizationRole.ADMIN, OrganizationRole.OWNER]:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied: Admin or Owner role required"
-            )
-        
-        service.add_user_to_organization(
-            UUID(organization_id),
-            request.user_id,
-            request.role
-        )
-        
-        return {"message": "User added to organization successfully"}
-    except HTTPException:
-        raise
-    except Exception as e:
+    # Check if current user is an admin or owner of the organization
+    user_role = service.get_user_role_in_organization(organization_id, current_user_id)
+    if user_role not in _ADMIN_ROLES:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to add user to organization: {str(e)}"
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied: Admin or Owner role required"
         )
+    
+    service.add_user_to_organization(
+        organization_id,
+        request.user_id,
+        request.role
+    )
+    
+    return {"message": "User added to organization successfully"}
 
 @router.delete("/{organization_id}/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def remove_user_from_organization(
-    organization_id: str,
-    user_id: str,
+def remove_user_from_organization(
+    organization_id: UUID,
+    user_id: UUID,
     current_user_id: UUID = Depends(get_current_user_id),
     service: OrganizationService = Depends(get_organization_service)
 ):
     """Remove a user from an organization"""
-    try:
-        # Check if current user is an admin or owner of the organization
-        user_role = service.get_user_role_in_organization(UUID(organization_id), current_user_id)
-        if user_role not in [OrganizationRole.ADMIN, OrganizationRole.OWNER]:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied: Admin or Owner role required"
-            )
-        
-        # Don't allow removing the owner
-        target_user_role = service.get_user_role_in_organization(UUID(organization_id), UUID(user_id))
-        if target_user_role == OrganizationRole.OWNER:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Cannot remove organization owner"
-            )
-        
-        service.remove_user_from_organization(UUID(organization_id), UUID(user_id))
-    except HTTPException:
-        raise
-    except Exception as e:
+    # Look up the caller's and the target's roles together
+    roles = service.get_user_roles_in_organization(organization_id, [current_user_id, user_id])
+    
+    # Check if current user is an admin or owner of the organization
+    user_role = roles.get(current_user_id)
+    if user_role not in _ADMIN_ROLES:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied: Admin or Owner role required"
+        )
+    
+    # Don't allow removing the owner
+    target_user_role = roles.get(user_id)
+    if target_user_role == OrganizationRole.OWNER:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to remove user from organization: {str(e)}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot remove organization owner"
         )
+    
+    service.remove_user_from_organization(organization_id, user_id)
@@ -16,7 +16,7 @@ router = APIRouter(prefix="/rag", tags=["RAG Connectors"])
 
 
 @router.get("/connectors", response_model=ListResponse)
-async def list_rag_connectors(
+def list_rag_connectors(
     auth: tuple = Depends(RequireRAGRead),
     rag_service: RAGConnectorService = Depends(get_rag_connector_service)
 ):
@@ -27,7 +27,7 @@ async def list_rag_connectors(
 
 
 @router.post("/connectors", response_model=RAGConnector, status_code=status.HTTP_201_CREATED)
-async def create_rag_connector(
+def create_rag_connector(
     connector: RAGConnectorCreate,
     auth: tuple = Depends(RequireRAGCreate),
     rag_service: RAGConnectorService = Depends(get_rag_connector_service)
@@ -37,7 +37,7 @@ async def create_rag_connector(
     try:
         created_connector = rag_service.create_connector(
             organization_id=organization_id,
-            **connector.dict()
+            **connector.model_dump()
         )
         return created_connector
     except ConflictError as e:
@@ -45,7 +45,7 @@ async def create_rag_connector(
 
 
 @router.get("/connectors/{connector_id}", response_model=RAGConnector)
-async def get_rag_connector(
+def get_rag_connector(
     connector_id: str,
     auth: tuple = Depends(RequireRAGRead),
     rag_service: RAGConnectorService = Depends(get_rag_connector_service)
@@ -60,7 +60,7 @@ async def get_rag_connector(
 
 
 @router.put("/connectors/{connector_id}", response_model=RAGConnector)
-async def update_rag_connector(
+def update_rag_connector(
     connector_id: str,
     connector: RAGConnectorUpdate,
     auth: tuple = Depends(RequireRAGUpdate),
@@ -69,7 +69,7 @@ async def update_rag_connector(
     """Update RAG connector configuration"""
     user_id, organization_id = auth
     try:
-        connector_data = connector.dict(exclude_unset=True)
+        connector_data = connector.model_dump(exclude_unset=True)
         updated_connector = rag_service.update_connector(connector_id, **connector_data)
         return updated_connector
     except NotFoundError as e:
@@ -79,7 +79,7 @@ async def update_rag_connector(
 
 
 @router.delete("/connectors/{connector_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_rag_connector(
+def delete_rag_connector(
     connector_id: str,
     auth: tuple = Depends(RequireRAGDelete),
     rag_service: RAGConnectorService = Depends(get_rag_connector_service)
@@ -93,7 +93,7 @@ async def delete_rag_connector(
 
 
 @router.post("/connectors/{connector_id}/test", response_model=dict)
-async def test_rag_connector(
+def test_rag_connector(
     connector_id: str,
     auth: tuple = Depends(RequireRAGRead),
     rag_service: RAGConnectorService = Depends(get_rag_connector_service)
@@ -110,7 +110,7 @@ async def test_rag_connector(
 
 
 @router.post("/connectors/{connector_id}/index", response_model=dict)
-async def create_index(
+def create_index(
     connector_id: str,
     index_config: dict,
     auth: tuple = Depends(RequireRAGUpdate),
@@ -128,7 +128,7 @@ async def create_index(
 
 
 @router.post("/connectors/{connector_id}/search", response_model=dict)
-async def search_documents(
+def search_documents(
     connector_id: str,
     search_query: dict,
     auth: tuple = Depends(RequireRAGRead),
@@ -146,7 +146,7 @@ async def search_documents(
 
 
 @router.post("/connectors/{connector_id}/documents", response_model=dict)
-async def add_documents(
+def add_documents(
     connector_id: str,
     documents: List[dict],
     auth: tuple = Depends(RequireRAGUpdate),
@@ -164,7 +164,7 @@ async def add_documents(
 
 
 @router.get("/connectors/{connector_id}/stats", response_model=dict)
-async def get_connector_stats(
+def get_connector_stats(
     connector_id: str,
     auth: tuple = Depends(RequireRAGRead),
     rag_service: RAGConnectorService = Depends(get_rag_connector_service)
@@ -179,7 +179,7 @@ async def get_connector_stats(
 
 
 @router.get("/metrics-config", response_model=dict)
-async def get_rag_metrics_config(auth: tuple = Depends(RequireRAGRead)):
+def get_rag_metrics_config(auth: tuple = Depends(RequireRAGRead)):
     """Get RAG metrics configuration"""
     user_id, organization_id = auth
     # Return default RAG metrics configuration
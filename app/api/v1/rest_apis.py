@@ -1,28 +1,66 @@
 """
 REST API management endpoints
 """
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query, BackgroundTasks
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
 from uuid import UUID
 
-from app.api.dependencies import get_rest_api_service
-from app.services.rest_api_service import RestAPIService
+from app.api.dependencies import get_rest_api_service, parse_tags
+from app.api.responses import model_response, streaming_json_response
+from app.core.database import get_db, readonly_session
+from app.core.etag import version_etag, etag_matches, not_modified
+from app.services.rest_api_service import RestAPIService, run_openapi_import_job
+from app.repositories.rest_api_repository import RestAPIRepository
 from app.middleware.authorization import (
     RequireRestAPICreate, RequireRestAPIRead, RequireRestAPIUpdate, RequireRestAPIDelete
 )
 from app.schemas.rest_api import (
     RestAPICreateRequest, RestAPIUpdateRequest, RestAPIResponse,
-    RestAPIBulkCreateRequest, RestAPIBulkDeleteRequest,
+    RestAPIBulkCreateRequest, RestAPIBulkGetRequest, RestAPIBulkDeleteRequest,
     RestAPIFromOpenAPIRequest, RestAPIListResponse,
-    RestAPIBulkCreateResponse, RestAPIBulkDeleteResponse,
+    RestAPIBulkCreateResponse, RestAPIBulkDeleteResponse, RestAPIImportJobResponse,
     RestAPIQueryParams, HTTPMethod, RestAPIStatus
 )
 
 router = APIRouter(prefix="/rest-apis", tags=["REST APIs"])
 
+# Listed APIs are validated and serialized a batch at a time while streaming
+_API_LIST_ADAPTER = TypeAdapter(List[RestAPIResponse])
+_API_LIST_BATCH_SIZE = 200
+
+# Single APIs are re-polled by UIs; the browser may keep a copy but must revalidate it
+# with the ETag on every read, so a client never sees a stale API after its own update
+_SINGLE_API_CACHE_CONTROL = "private, no-cache"
+
+
+def _api_list_stream(organization_id: str, limit: int, offset: int, filters: Dict[str, Any]) -> Iterator[bytes]:
+    """
+    Serialize a page of REST APIs as a RestAPIListResponse without holding the whole page
+    Reads through a session of its own, not the request's, which may be closed
+    before the body is sent. Nothing is yielded until the first batch is fetched.
+    """
+    with readonly_session() as db:
+        rest_api_service = RestAPIService(RestAPIRepository(db))
+        rows = iter(rest_api_service.iter_apis_page(organization_id, limit, offset, **filters))
+        total = None
+        head = b'{"items":['
+        while batch := list(islice(rows, _API_LIST_BATCH_SIZE)):
+            total = batch[0][1]
+            items = _API_LIST_ADAPTER.validate_python([api for api, _ in batch])
+            yield head + _API_LIST_ADAPTER.dump_json(items)[1:-1]
+            head = b","
+        if total is None:
+            # Past the last page there is no row to carry the total
+            total = rest_api_service.count_apis(organization_id, **filters) if offset else 0
+        # On an empty page the opening has not been sent yet
+        yield (b"" if head == b"," else head) + b'],"total":' + str(total).encode() + b"}"
+
 
 @router.post("/", response_model=RestAPIResponse, status_code=status.HTTP_201_CREATED)
-async def create_rest_api(
+def create_rest_api(
     api_data: RestAPICreateRequest,
     auth: tuple = Depends(RequireRestAPICreate),
     rest_api_service: RestAPIService = Depends(get_rest_api_service)
@@ -33,9 +71,9 @@ async def create_rest_api(
     try:
         api = rest_api_service.create_api(
             organization_id=str(organization_id),
-            **api_data.dict()
+            **api_data.model_dump(mode="json")
         )
-        return RestAPIResponse(**api)
+        return model_response(RestAPIResponse(**api), status.HTTP_201_CREATED)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -44,7 +82,7 @@ async def create_rest_api(
 
 
 @router.post("/bulk", response_model=RestAPIBulkCreateResponse, status_code=status.HTTP_201_CREATED)
-async def create_multiple_rest_apis(
+def create_multiple_rest_apis(
     bulk_data: RestAPIBulkCreateRequest,
     auth: tuple = Depends(RequireRestAPICreate),
     rest_api_service: RestAPIService = Depends(get_rest_api_service)
@@ -53,7 +91,7 @@ async def create_multiple_rest_apis(
     user_id, organization_id = auth
     
     try:
-        apis_data = [api.dict() for api in bulk_data.apis]
+        apis_data = bulk_data.model_dump(mode="json")["apis"]
         results = rest_api_service.create_multiple_apis(str(organization_id), apis_data)
         
         created = []
@@ -65,12 +103,12 @@ async def create_multiple_rest_apis(
             else:
                 created.append(RestAPIResponse(**result))
         
-        return RestAPIBulkCreateResponse(
+        return model_response(RestAPIBulkCreateResponse(
             created=created,
             failed=failed,
             total_requested=len(bulk_data.apis),
             total_created=len(created)
-        )
+        ), status.HTTP_201_CREATED)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -78,99 +116,86 @@ async def create_multiple_rest_apis(
         )
 
 
-@router.post("/import/openapi", response_model=RestAPIBulkCreateResponse, status_code=status.HTTP_201_CREATED)
-async def create_from_openapi_spec(
-    openapi_data: RestAPIFromOpenAPIRequest,
-    background_tasks: BackgroundTasks,
-    auth: tuple = Depends(RequireRestAPICreate),
+@router.post("/bulk/get", response_model=Dict[str, Optional[RestAPIResponse]])
+def get_multiple_rest_apis(
+    bulk_data: RestAPIBulkGetRequest,
+    auth: tuple = Depends(RequireRestAPIRead),
     rest_api_service: RestAPIService = Depends(get_rest_api_service)
 ):
-    """Create REST APIs from OpenAPI/Swagger specification"""
+    """Get multiple REST API configurations by ID; IDs not found in the organization map to null"""
     user_id, organization_id = auth
     
     try:
-        # This is an async operation, so we could run it in the background
-        results = await rest_api_service.create_from_openapi_spec(
-            organization_id=str(organization_id),
-            spec_url=str(openapi_data.spec_url),
-            tags_to_attach=openapi_data.tags_filter
-        )
-        
-        created = []
-        failed = []
-        
-        for result in results:
-            if "error" in result:
-                failed.append({"name": result["name"], "error": result["error"]})
-            else:
-                created.append(RestAPIResponse(**result))
-        
-        return RestAPIBulkCreateResponse(
-            created=created,
-            failed=failed,
-            total_requested=len(results),
-            total_created=len(created)
-        )
+        return rest_api_service.get_apis_by_ids(str(organization_id), bulk_data.api_ids)
     except Exception as e:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
         )
 
 
+@router.post("/import/openapi", response_model=RestAPIImportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+def create_from_openapi_spec(
+    openapi_data: RestAPIFromOpenAPIRequest,
+    background_tasks: BackgroundTasks,
+    auth: tuple = Depends(RequireRestAPICreate),
+    rest_api_service: RestAPIService = Depends(get_rest_api_service)
+):
+    """Start importing REST APIs from an OpenAPI/Swagger specification; poll the returned job for progress"""
+    user_id, organization_id = auth
+    
+    spec_url = str(openapi_data.spec_url)
+    job = rest_api_service.start_openapi_import(
+        organization_id=str(organization_id),
+        spec_url=spec_url,
+        tags_to_attach=openapi_data.tags_filter
+    )
+    background_tasks.add_task(
+        run_openapi_import_job, job["id"], str(organization_id), spec_url, openapi_data.tags_filter
+    )
+    return model_response(RestAPIImportJobResponse(**job), status.HTTP_202_ACCEPTED)
+
+
+@router.get("/import/jobs/{job_id}", response_model=RestAPIImportJobResponse)
+def get_openapi_import_job(
+    job_id: str,
+    auth: tuple = Depends(RequireRestAPIRead),
+    rest_api_service: RestAPIService = Depends(get_rest_api_service)
+):
+    """Get the status and progress of an OpenAPI import job"""
+    user_id, organization_id = auth
+    
+    return model_response(RestAPIImportJobResponse(**rest_api_service.get_import_job(job_id, str(organization_id))))
+
+
 @router.get("/", response_model=RestAPIListResponse)
-async def list_rest_apis(
+def list_rest_apis(
     auth: tuple = Depends(RequireRestAPIRead),
-    rest_api_service: RestAPIService = Depends(get_rest_api_service),
     tags: Optional[str] = Query(None, description="Comma-separated list of tags to filter by"),
     method: Optional[HTTPMethod] = Query(None, description="Filter by HTTP method"),
     api_status: Optional[RestAPIStatus] = Query(None, description="Filter by status"),
     enabled: Optional[bool] = Query(None, description="Filter by enabled status"),
     search: Optional[str] = Query(None, description="Search term for API names"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
-    offset: int = Query(0, ge=0, description="Number of results to skip")
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    db: Session = Depends(get_db)
 ):
     """Get all REST APIs for the current organization with optional filters"""
     user_id, organization_id = auth
     
-    try:
-        # Start with all APIs for the organization
-        if tags:
-            tag_list = [tag.strip() for tag in tags.split(',') if tag.strip()]
-            apis = rest_api_service.list_apis_by_tags(str(organization_id), tag_list)
-        else:
-            apis = rest_api_service.list_apis(str(organization_id))
-        
-        # Apply filters
-        if method:
-            apis = [api for api in apis if api.get('method') == method.value]
-        
-        if api_status:
-            apis = [api for api in apis if api.get('status') == api_status.value]
-        
-        if enabled is not None:
-            apis = [api for api in apis if api.get('enabled') == enabled]
-        
-        if search:
-            apis = [api for api in apis if search.lower() in api.get('name', '').lower()]
-        
-        # Apply pagination
-        total = len(apis)
-        apis = apis[offset:offset + limit]
-        
-        return RestAPIListResponse(
-            items=[RestAPIResponse(**api) for api in apis],
-            total=total
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    # Filtering and pagination happen in the database
+    filters = dict(
+        tags=parse_tags(tags) if tags else None,
+        method=method.value if method else None,
+        status=api_status.value if api_status else None,
+        enabled=enabled,
+        search=search
+    )
+    return streaming_json_response(_api_list_stream(str(organization_id), limit, offset, filters), db)
 
 
 @router.delete("/all", response_model=RestAPIBulkDeleteResponse)
-async def delete_all_rest_apis(
+def delete_all_rest_apis(
     auth: tuple = Depends(RequireRestAPIDelete),
     rest_api_service: RestAPIService = Depends(get_rest_api_service)
 ):
@@ -178,31 +203,15 @@ async def delete_all_rest_apis(
     user_id, organization_id = auth
     
     try:
-        # Get all APIs for the current organization
-        all_apis = rest_api_service.list_apis(str(organization_id))
+        deleted = rest_api_service.delete_all_for_org(str(organization_id))
         
-        if not all_apis:
-            return RestAPIBulkDeleteResponse(
-                deleted=[],
-                failed=[],
-                not_found=[],
-                total_requested=0,
-                total_deleted=0
-            )
-        
-        # Extract all API IDs
-        api_ids = [api['id'] for api in all_apis]
-        
-        # Delete all APIs
-        results = rest_api_service.delete_multiple_apis(api_ids)
-        
-        return RestAPIBulkDeleteResponse(
-            deleted=results["deleted"],
-            failed=results["failed"],
-            not_found=results["not_found"],
-            total_requested=len(api_ids),
-            total_deleted=len(results["deleted"])
-        )
+        return model_response(RestAPIBulkDeleteResponse(
+            deleted=deleted,
+            failed=[],
+            not_found=[],
+            total_requested=len(deleted),
+            total_deleted=len(deleted)
+        ))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -211,7 +220,7 @@ async def delete_all_rest_apis(
 
 
 @router.delete("/bulk", response_model=RestAPIBulkDeleteResponse)
-async def delete_multiple_rest_apis(
+def delete_multiple_rest_apis(
     bulk_data: RestAPIBulkDeleteRequest,
     auth: tuple = Depends(RequireRestAPIDelete),
     rest_api_service: RestAPIService = Depends(get_rest_api_service)
@@ -220,33 +229,16 @@ async def delete_multiple_rest_apis(
     user_id, organization_id = auth
     
     try:
-        # Verify all APIs belong to the current organization
-        verified_api_ids = []
-        not_found = []
-        
-        for api_id in bulk_data.api_ids:
-            try:
-                existing_api = rest_api_service.get_api(api_id)
-                if existing_api.get('organization_id') == str(organization_id):
-                    verified_api_ids.append(api_id)
-                else:
-                    not_found.append(api_id)
-            except Exception:
-                not_found.append(api_id)
+        # Ownership is checked and the APIs deleted in one query each
+        results = rest_api_service.verify_and_delete(str(organization_id), bulk_data.api_ids)
         
-        # Delete the verified APIs
-        results = rest_api_service.delete_multiple_apis(verified_api_ids)
-        
-        # Add the not_found APIs to the results
-        results["not_found"].extend(not_found)
-        
-        return RestAPIBulkDeleteResponse(
+        return model_response(RestAPIBulkDeleteResponse(
             deleted=results["deleted"],
             failed=results["failed"],
             not_found=results["not_found"],
             total_requested=len(bulk_data.api_ids),
             total_deleted=len(results["deleted"])
-        )
+        ))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -255,8 +247,9 @@ async def delete_multiple_rest_apis(
 
 
 @router.get("/{api_id}", response_model=RestAPIResponse)
-async def get_rest_api(
+def get_rest_api(
     api_id: str,
+    request: Request,
     auth: tuple = Depends(RequireRestAPIRead),
     rest_api_service: RestAPIService = Depends(get_rest_api_service)
 ):
@@ -264,16 +257,18 @@ async def get_rest_api(
     user_id, organization_id = auth
     
     try:
-        api = rest_api_service.get_api(api_id)
-        
-        # Verify the API belongs to the current organization
-        if api.get('organization_id') != str(organization_id):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="REST API not found"
-            )
+        # Scoped to the organization - APIs of other organizations are not found
+        if request.headers.get("if-none-match"):
+            # Revalidation only needs the version, not the whole row
+            etag = version_etag(*rest_api_service.get_api_version(api_id, str(organization_id)))
+            if etag_matches(request, etag):
+                return not_modified(etag)
         
-        return RestAPIResponse(**api)
+        api = rest_api_service.get_api(api_id, str(organization_id))
+        response = model_response(RestAPIResponse(**api))
+        response.headers["ETag"] = version_etag(api["id"], api["updated_at"])
+        response.headers["Cache-Control"] = _SINGLE_API_CACHE_CONTROL
+        return response
     except Exception as e:
         if "not found" in str(e).lower():
             raise HTTPException(
@@ -287,7 +282,7 @@ async def get_rest_api(
 
 
 @router.put("/{api_id}", response_model=RestAPIResponse)
-async def update_rest_api(
+def update_rest_api(
     api_id: str,
     api_data: RestAPIUpdateRequest,
     auth: tuple = Depends(RequireRestAPIUpdate),
@@ -297,18 +292,10 @@ async def update_rest_api(
     user_id, organization_id = auth
     
     try:
-        # First verify the API exists and belongs to the organization
-        existing_api = rest_api_service.get_api(api_id)
-        if existing_api.get('organization_id') != str(organization_id):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="REST API not found"
-            )
-        
-        # Update the API
-        update_data = api_data.dict(exclude_unset=True)
-        api = rest_api_service.update_api(api_id, **update_data)
-        return RestAPIResponse(**api)
+        # Scoped to the organization - APIs of other organizations are not found
+        update_data = api_data.model_dump(mode="json", exclude_unset=True)
+        api = rest_api_service.update_api(api_id, str(organization_id), **update_data)
+        return model_response(RestAPIResponse(**api))
     except Exception as e:
         if "not found" in str(e).lower():
             raise HTTPException(
@@ -322,7 +309,7 @@ async def update_rest_api(
 
 
 @router.delete("/{api_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_rest_api(
+def delete_rest_api(
     api_id: str,
     auth: tuple = Depends(RequireRestAPIDelete),
     rest_api_service: RestAPIService = Depends(get_rest_api_service)
@@ -331,16 +318,8 @@ async def delete_rest_api(
     user_id, organization_id = auth
     
     try:
-        # First verify the API exists and belongs to the organization
-        existing_api = rest_api_service.get_api(api_id)
-        if existing_api.get('organization_id') != str(organization_id):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="REST API not found"
-            )
-        
-        # Delete the API
-        rest_api_service.delete_api(api_id)
+        # Scoped to the organization - APIs of other organizations are not found
+        rest_api_service.delete_api(api_id, str(organization_id))
     except Exception as e:
         if "not found" in str(e).lower():
             raise HTTPException(
@@ -2,6 +2,7 @@
 Security and RBAC API endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from typing import Dict, Any, Tuple
 from uuid import UUID
 
@@ -15,7 +16,7 @@ router = APIRouter(prefix="/security", tags=["security"])
 
 
 @router.get("/roles", response_model=ListResponse)
-async def list_security_roles(
+def list_security_roles(
     auth: Tuple[UUID, UUID] = Depends(RequireRoleRead),
     security_service: SecurityService = Depends(get_security_service)
 ):
@@ -24,13 +25,14 @@ async def list_security_roles(
     try:
         # Pass organization_id UUID to get system roles + organization-specific roles
         roles = security_service.list_roles(organization_id)
-        return ListResponse(items=roles, total=len(roles))
+        # Cached role dicts are already JSON-ready; skip re-validating them on every call
+        return ORJSONResponse({"items": roles, "total": len(roles), "page": None, "page_size": None})
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
 @router.post("/roles/organization", response_model=SecurityRole, status_code=status.HTTP_201_CREATED)
-async def create_organization_role(
+def create_organization_role(
     role: SecurityRoleCreate,
     auth: Tuple[UUID, UUID] = Depends(RequireRoleCreate),
     security_service: SecurityService = Depends(get_security_service)
@@ -38,7 +40,7 @@ async def create_organization_role(
     """Create a new organization-specific security role"""
     user_id, organization_id = auth
     try:
-        role_data = role.dict()
+        role_data = role.model_dump()
         # Pass organization_id UUID to populate organization_id field
         created_role = security_service.create_organization_role(role_data, organization_id)
         return created_role
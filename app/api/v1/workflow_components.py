@@ -4,7 +4,8 @@ Workflow Component Definition API endpoints
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 
-from app.api.dependencies import get_workflow_component_definition_service
+from app.api.dependencies import get_workflow_component_definition_service, parse_tags
+from app.api.responses import model_response
 from app.services.workflow_component_definition_service import WorkflowComponentDefinitionService
 from app.middleware.authorization import RequireWorkflowRead
 from app.schemas.workflow_component_definition import (
@@ -16,7 +17,7 @@ router = APIRouter(prefix="/workflow-components", tags=["Workflow Components"])
 
 
 @router.get("/", response_model=WorkflowComponentDefinitionListResponse)
-async def list_workflow_components(
+def list_workflow_components(
     auth: tuple = Depends(RequireWorkflowRead),
     service: WorkflowComponentDefinitionService = Depends(get_workflow_component_definition_service),
     category: Optional[str] = Query(None, description="Filter by category"),
@@ -31,17 +32,17 @@ async def list_workflow_components(
         if search:
             components = service.search_components(search)
         elif tags:
-            tag_list = [tag.strip() for tag in tags.split(',') if tag.strip()]
-            components = service.get_components_by_tags(tag_list)
+            components = service.get_components_by_tags(parse_tags(tags))
         elif category:
             components = service.list_components_by_category(category)
         else:
             components = service.list_components(enabled_only=enabled_only)
         
-        return WorkflowComponentDefinitionListResponse(
+        result = WorkflowComponentDefinitionListResponse(
             items=[WorkflowComponentDefinitionResponse(**comp) for comp in components],
             total=len(components)
         )
+        return model_response(result)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -50,7 +51,7 @@ async def list_workflow_components(
 
 
 @router.get("/categories")
-async def get_categories(
+def get_categories(
     auth: tuple = Depends(RequireWorkflowRead),
     service: WorkflowComponentDefinitionService = Depends(get_workflow_component_definition_service)
 ):
@@ -68,7 +69,7 @@ async def get_categories(
 
 
 @router.get("/{component_id}", response_model=WorkflowComponentDefinitionResponse)
-async def get_workflow_component(
+def get_workflow_component(
     component_id: str,
     auth: tuple = Depends(RequireWorkflowRead),
     service: WorkflowComponentDefinitionService = Depends(get_workflow_component_definition_service)
@@ -78,7 +79,7 @@ async def get_workflow_component(
     
     try:
         component = service.get_component(component_id)
-        return WorkflowComponentDefinitionResponse(**component)
+        return model_response(WorkflowComponentDefinitionResponse(**component))
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
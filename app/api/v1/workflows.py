@@ -16,7 +16,7 @@ router = APIRouter(prefix="/workflows", tags=["Workflows"])
 
 
 @router.get("", response_model=ListResponse)
-async def list_workflows(
+def list_workflows(
     auth: tuple = Depends(RequireWorkflowRead),
     workflow_service: WorkflowService = Depends(get_workflow_service)
 ):
@@ -27,7 +27,7 @@ async def list_workflows(
 
 
 @router.post("", response_model=Workflow, status_code=status.HTTP_201_CREATED)
-async def create_workflow(
+def create_workflow(
     workflow: WorkflowCreate,
     auth: tuple = Depends(RequireWorkflowCreate),
     workflow_service: WorkflowService = Depends(get_workflow_service)
@@ -36,7 +36,7 @@ async def create_workflow(
     user_id, organization_id = auth
     try:
         # Convert the entire workflow to dict first, then extract nested objects
-        workflow_dict = workflow.dict()
+        workflow_dict = workflow.model_dump()
         
         new_workflow = workflow_service.create_workflow(
             organization_id=organization_id,
@@ -53,7 +53,7 @@ async def create_workflow(
 
 
 @router.get("/node-options", response_model=dict)
-async def get_workflow_node_options(
+def get_workflow_node_options(
     auth: tuple = Depends(RequireWorkflowRead),
     workflow_service: WorkflowService = Depends(get_workflow_service)
 ):
@@ -67,7 +67,7 @@ async def get_workflow_node_options(
 
 
 @router.get("/{workflow_id}", response_model=Workflow)
-async def get_workflow(
+def get_workflow(
     workflow_id: str,
     auth: tuple = Depends(RequireWorkflowRead),
     workflow_service: WorkflowService = Depends(get_workflow_service)
@@ -82,7 +82,7 @@ async def get_workflow(
 
 
 @router.put("/{workflow_id}", response_model=Workflow)
-async def update_workflow(
+def update_workflow(
     workflow_id: str,
     workflow: WorkflowUpdate,
     auth: tuple = Depends(RequireWorkflowUpdate),
@@ -92,7 +92,7 @@ async def update_workflow(
     user_id, organization_id = auth
     try:
         # Convert Pydantic model to plain dict to avoid serialization issues
-        update_data = workflow.dict(exclude_unset=True)
+        update_data = workflow.model_dump(exclude_unset=True)
         
         updated_workflow = workflow_service.update_workflow(workflow_id, **update_data)
         return updated_workflow
@@ -101,7 +101,7 @@ async def update_workflow(
 
 
 @router.delete("/{workflow_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_workflow(
+def delete_workflow(
     workflow_id: str,
     auth: tuple = Depends(RequireWorkflowDelete),
     workflow_service: WorkflowService = Depends(get_workflow_service)
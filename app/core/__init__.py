@@ -2,7 +2,7 @@
 Core module - Common utilities and base classes
 """
 from .config import settings, get_database_url, get_log_config
-from .database import Base, get_db, create_tables, DatabaseManager
+from .database import Base, get_db, readonly_session, create_tables, DatabaseManager
 from .logging import setup_logging, get_logger
 from .metrics import MetricsCollector, setup_metrics
 from .exceptions import APIException, ValidationException, NotFoundError, UnauthorizedError
@@ -13,6 +13,7 @@ __all__ = [
     "get_log_config",
     "Base",
     "get_db",
+    "readonly_session",
     "create_tables",
     "DatabaseManager",
     "setup_logging",
@@ -2,46 +2,133 @@
 Auth Service Client
 Simple client to communicate with AuthService for token validation
 """
+import asyncio
+import hashlib
+import time
 import httpx
 import logging
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from fastapi import HTTPException
+from app.core.cache import TTLCache
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Seconds shaved off a token's expiry so a cached validation never outlives the token
+TOKEN_EXPIRY_LEEWAY_SECONDS = 10
+
+# Connection pool for AuthService requests, shared by every validation
+AUTH_SERVICE_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+AUTH_SERVICE_TIMEOUT = httpx.Timeout(10.0)
+
 
 class AuthServiceClient:
     """Client for communicating with AuthService"""
-    
+
     def __init__(self):
         self.auth_service_url = settings.auth_service_url
-    
+        self._token_cache = TTLCache(
+            "auth_tokens",
+            maxsize=settings.auth_token_cache_size,
+            ttl=settings.auth_token_cache_ttl_seconds
+        )
+        self._http: Optional[httpx.AsyncClient] = None
+        # Validations currently in flight, so concurrent requests with one token share a call.
+        # Each runs as a task of its own, so no single request's cancellation can stop it.
+        self._inflight: Dict[bytes, asyncio.Task] = {}
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Long-lived HTTP client, so validations reuse kept-alive connections to AuthService"""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                base_url=self.auth_service_url,
+                timeout=AUTH_SERVICE_TIMEOUT,
+                limits=AUTH_SERVICE_LIMITS
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the pooled connections (called on application shutdown)"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    @staticmethod
+    def _token_key(token: str) -> bytes:
+        """Cache key for a token - a digest, so raw tokens are never held in memory"""
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def _token_ttl(self, user_data: Dict[str, Any]) -> float:
+        """How long a validation result may be reused, bounded by the token expiry"""
+        max_ttl = self._token_cache.ttl
+        exp = user_data.get("exp")
+        if isinstance(exp, (int, float)):
+            return min(exp - time.time() - TOKEN_EXPIRY_LEEWAY_SECONDS, max_ttl)
+        return max_ttl
+
     async def validate_token(self, token: str) -> Dict[str, Any]:
         """
         Validate token with AuthService and return user info
         """
-           
+        key = self._token_key(token)
+        user_data = self._token_cache.get(key)
+        if isinstance(user_data, HTTPException):
+            # Recently rejected - answer without asking AuthService again
+            raise HTTPException(status_code=user_data.status_code, detail=user_data.detail)
+        if user_data is not None:
+            return user_data
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._validate_uncached(token, key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._settle(key, done))
+        # Shielded so a cancelled request only stops waiting; the shared call carries on
+        return await asyncio.shield(task)
+
+    async def _validate_uncached(self, token: str, key: bytes) -> Dict[str, Any]:
+        """Ask AuthService and cache the answer (401 rejections briefly)"""
+        try:
+            user_data = await self._fetch_user(token)
+        except HTTPException as e:
+            if e.status_code == 401:
+                self._token_cache.set(key, e, ttl=settings.auth_token_reject_ttl_seconds)
+            raise
+
+        self._token_cache.set(key, user_data, ttl=self._token_ttl(user_data))
+        return user_data
+
+    def _settle(self, key: bytes, task: asyncio.Task) -> None:
+        """Drop a finished validation from the in-flight table"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark any failure retrieved, so asyncio does not warn when every waiter left
+            task.exception()
+
+    def invalidate(self, token: str) -> None:
+        """Forget a cached validation (e.g. when the user logs out)"""
+        self._token_cache.pop(self._token_key(token))
+
+    async def _fetch_user(self, token: str) -> Dict[str, Any]:
+        """Call AuthService to validate the token"""
         try:
-            async with httpx.AsyncClient() as client:
-                headers = {"Authorization": f"Bearer {token}"}
-                response = await client.get(
-                    f"{self.auth_service_url}/auth/userid",
-                    headers=headers,
-                    timeout=10.0
-                )
-                
-                if response.status_code == 401:
-                    raise HTTPException(status_code=401, detail="Invalid token")
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                if not data.get("valid"):
-                    raise HTTPException(status_code=401, detail="Token validation failed")
-                
-                return data.get("user", {})
-                
+            headers = {"Authorization": f"Bearer {token}"}
+            response = await self.http.get("/auth/userid", headers=headers)
+
+            if response.status_code == 401:
+                raise HTTPException(status_code=401, detail="Invalid token")
+
+            response.raise_for_status()
+            data = response.json()
+
+            if not data.get("valid"):
+                raise HTTPException(status_code=401, detail="Token validation failed")
+
+            return data.get("user", {})
+
         except httpx.RequestError as e:
             logger.error(f"Failed to validate token with AuthService: {e}")
             raise HTTPException(status_code=503, detail="Authentication service unavailable")
@@ -50,5 +137,14 @@ class AuthServiceClient:
             raise HTTPException(status_code=401, detail="Token validation failed")
 
 
-# Global instance
-auth_client = AuthServiceClient()
+@lru_cache(maxsize=1)
+def get_auth_client() -> AuthServiceClient:
+    """The process-wide AuthService client, built on first use"""
+    return AuthServiceClient()
+
+
+def __getattr__(name: str) -> Any:
+    # `auth_client` is built on first access instead of at import (PEP 562)
+    if name == "auth_client":
+        return get_auth_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,25 +2,34 @@
 Authentication context module for storing current user information
 across the request lifecycle using contextvars
 """
-from contextvars import ContextVar
-from typing import Optional
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Iterator, Optional
 from uuid import UUID
 
 # Context variables to store the current user ID and organization ID
 current_user_id: ContextVar[Optional[str]] = ContextVar('current_user_id', default=None)
 current_organization_id: ContextVar[Optional[str]] = ContextVar('current_organization_id', default=None)
 
-def set_current_user_id(user_id: str) -> None:
-    """Set the current user ID in the context"""
-    current_user_id.set(user_id)
+def set_current_user_id(user_id: str) -> Token:
+    """Set the current user ID in the context, returning the token that restores the previous value"""
+    return current_user_id.set(user_id)
+
+def reset_current_user_id(token: Token) -> None:
+    """Restore the user ID that was current before the matching set"""
+    current_user_id.reset(token)
 
 def get_current_user_id() -> Optional[str]:
     """Get the current user ID from the context"""
     return current_user_id.get()
 
-def set_current_organization_id(organization_id: str) -> None:
-    """Set the current organization ID in the context"""
-    current_organization_id.set(organization_id)
+def set_current_organization_id(organization_id: str) -> Token:
+    """Set the current organization ID in the context, returning the token that restores the previous value"""
+    return current_organization_id.set(organization_id)
+
+def reset_current_organization_id(token: Token) -> None:
+    """Restore the organization ID that was current before the matching set"""
+    current_organization_id.reset(token)
 
 def get_current_organization_id() -> Optional[str]:
     """Get the current organization ID from the context"""
@@ -31,12 +40,23 @@ def set_current_auth_context(user_id: str, organization_id: str) -> None:
     set_current_user_id(user_id)
     set_current_organization_id(organization_id)
 
+@contextmanager
+def auth_context(user_id: str, organization_id: str) -> Iterator[None]:
+    """Bind user ID and organization ID for the duration of the block, then restore the previous values"""
+    user_token = set_current_user_id(user_id)
+    organization_token = set_current_organization_id(organization_id)
+    try:
+        yield
+    finally:
+        reset_current_organization_id(organization_token)
+        reset_current_user_id(user_token)
+
 def clear_current_user_id() -> None:
-    """Clear the current user ID from the context"""
+    """Clear the current user ID from the context (prefer reset_current_user_id with the token from set)"""
     current_user_id.set(None)
 
 def clear_current_organization_id() -> None:
-    """Clear the current organization ID from the context"""
+    """Clear the current organization ID from the context (prefer reset_current_organization_id with the token from set)"""
     current_organization_id.set(None)
 
 def clear_auth_context() -> None:
@@ -3,29 +3,40 @@ Authorization dependencies for ControlTower
 Uses AuthService for token validation
 """
 from fastapi import HTTPException, Header, Depends
-from typing import Dict, Any
-from app.core.auth_client import auth_client
+from typing import Dict, Any, Optional
+from app.core.auth_client import get_auth_client
 
 
-async def get_current_user(authorization: str = Header(...)) -> Dict[str, Any]:
+async def get_current_user_allow_missing(authorization: Optional[str] = Header(None)) -> Optional[Dict[str, Any]]:
     """
-    Extract and validate user from Authorization header
-    Returns user information from AuthService
+    Validate the Authorization header if one was sent
+    Returns None without an Authorization header. Both get_current_user and
+    get_optional_user depend on this, so FastAPI's per-request dependency
+    cache validates the token once even when a route uses both.
     """
+    if not authorization:
+        return None
+
     if not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Invalid authorization header format")
-    
+
     token = authorization[7:]  # Remove "Bearer " prefix
-    user_info = await auth_client.validate_token(token)
-    
-    return user_info
+    return await get_auth_client().validate_token(token)
 
 
-async def get_optional_user(authorization: str = Header(None)) -> Dict[str, Any]:
+async def get_current_user(user: Optional[Dict[str, Any]] = Depends(get_current_user_allow_missing)) -> Dict[str, Any]:
+    """
+    Extract and validate user from Authorization header
+    Returns user information from AuthService
+    """
+    if user is None:
+        raise HTTPException(status_code=401, detail="Missing authorization header")
+
+    return user
+
+
+async def get_optional_user(user: Optional[Dict[str, Any]] = Depends(get_current_user_allow_missing)) -> Optional[Dict[str, Any]]:
     """
     Optional user extraction - returns None if no auth header
     """
-    if not authorization:
-        return None
-    
-    return await get_current_user(authorization)
+    return user
@@ -3,14 +3,34 @@ Core configuration and settings module
 """
 import os
 import logging
-from typing import Any, Dict, Optional, List, Union
-from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings
-from dotenv import load_dotenv
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+from dotenv import dotenv_values
+
+
+# Set once the env files are loaded; inherited by reload/worker subprocesses so they skip it
+ENV_LOADED_FLAG = "CONTROLTOWER_ENV_LOADED"
+_env_loaded = False
+
+
+def _load_env_file(path: str) -> bool:
+    """Copy a dotenv file into os.environ without overriding variables that are already set"""
+    if not os.path.exists(path):
+        return False
+    for key, value in dotenv_values(path).items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+    return True
 
 
 def load_environment():
-    """Load environment based on ENVIRONMENT variable"""
+    """Load environment based on ENVIRONMENT variable (once per process tree)"""
+    global _env_loaded
+    if _env_loaded or os.environ.get(ENV_LOADED_FLAG):
+        _env_loaded = True
+        return
+    
     # Check for environment from multiple sources
     env = os.getenv("ENVIRONMENT")
     
@@ -24,122 +44,214 @@ def load_environment():
         env_file = ".env.dev"
     
     # Load the environment file if it exists
-    if os.path.exists(env_file):
-        load_dotenv(env_file)
+    if _load_env_file(env_file):
         print(f"Loaded environment from {env_file}")
     else:
         print(f"Environment file {env_file} not found, using defaults")
+    
+    # Plain .env fills in anything still unset (Settings no longer parses it separately)
+    _load_env_file(".env")
+    
+    os.environ[ENV_LOADED_FLAG] = "1"
+    _env_loaded = True
 
 
 # Load environment before creating settings
 load_environment()
 
 
-class Settings(BaseSettings):
-    """Application settings"""
+_TRUE_VALUES = frozenset({"1", "true", "t", "yes", "y", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "f", "no", "n", "off"})
+
+
+def _parse_bool(value: str) -> bool:
+    lowered = value.strip().lower()
+    if lowered in _TRUE_VALUES:
+        return True
+    if lowered in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid boolean value: {value!r}")
+
+
+def _split_csv(value: str) -> Tuple[str, ...]:
+    """Comma-separated setting (e.g. CORS_ORIGINS) as a tuple of stripped items"""
+    return tuple(item.strip() for item in value.split(','))
+
+
+# Parser per field type; fields of any other type are read as plain strings
+_PARSERS: Dict[Any, Callable[[str], Any]] = {
+    bool: _parse_bool,
+    int: int,
+    float: float,
+    Tuple[str, ...]: _split_csv,
+}
+
+
+def env_field(default: Any, *env_names: str) -> Any:
+    """Setting with a default that also reads the given environment variable names"""
+    return field(default=default, metadata={"env": env_names})
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """
+    Application settings
+    Read from the environment (after the env files are loaded) by from_env().
+    Each setting reads the variable named after it, case-insensitively, plus
+    any extra names given to env_field().
+    """
     
     # Application settings
     app_name: str = "AI Platform Backend"
     app_version: str = "1.0.0"
-    debug: bool = Field(default=False, env="DEBUG")
-    environment: str = Field(default="dev", env="ENVIRONMENT")
+    debug: bool = False
+    environment: str = "dev"
     
     # Server settings
-    host: str = Field(default="127.0.0.1", env="HOST")
-    port: int = Field(default=8000, env="PORT")
-    reload: bool = Field(default=True, env="RELOAD")
+    host: str = "127.0.0.1"
+    port: int = 8000
+    reload: bool = True
+    # Server processes; each has its own connection pool and in-process caches
+    workers: int = 1
+    # Worker threads for sync endpoints and dependencies (most hold a DB session)
+    threadpool_max_workers: int = 40
+    # Responses smaller than this are sent uncompressed
+    gzip_minimum_size: int = 1024
+    gzip_compress_level: int = 1
     
     # Database settings
-    database_type: str = Field(default="sqlite", env="DATABASE_TYPE")
-    database_url: str = Field(default="sqlite:///./ai_platform.db", env="DATABASE_URL")
+    database_type: str = "sqlite"
+    database_url: str = "sqlite:///./ai_platform.db"
+    # Connection pool sizing (PostgreSQL only)
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
     
     # Security settings
-    secret_key: str = Field(default="dev-secret-key-not-for-production", env="SECRET_KEY")
-    jwt_secret_key: str = Field(default="dev-jwt-secret-key-not-for-production", env="JWT_SECRET_KEY")
-    jwt_algorithm: str = Field(default="HS256", env="JWT_ALGORITHM")
-    jwt_expiration_hours: int = Field(default=24, env="JWT_EXPIRATION_HOURS")
-    access_token_expire_minutes: int = Field(default=30, env="ACCESS_TOKEN_EXPIRE_MINUTES")
-    resource_app_id: str = Field(default="", env="RESOURCE_APP_ID")  # Application ID of the resource server (for audience validation)
+    secret_key: str = "dev-secret-key-not-for-production"
+    jwt_secret_key: str = "dev-jwt-secret-key-not-for-production"
+    jwt_algorithm: str = "HS256"
+    jwt_expiration_hours: int = 24
+    access_token_expire_minutes: int = 30
+    resource_app_id: str = ""  # Application ID of the resource server (for audience validation)
+    # Like the role cache below, only invalidated in the worker that made the change
+    permission_cache_ttl_seconds: int = 5
+    permission_cache_size: int = 50000
+    # Only the worker that changes a membership drops its cached role, so this is
+    # how long a demoted or removed member keeps the old role on other workers
+    organization_role_cache_ttl_seconds: int = 5
+    organization_role_cache_size: int = 50000
+    # Per-organization listings (MCP tools, intent data, security roles), invalidated on writes only in
+    # the worker that made them, so this is how stale another worker's list can be
+    list_cache_ttl_seconds: int = 120
+    list_cache_size: int = 10000
         
-    # CORS settings
-    cors_origins: Union[str, List[str]] = Field(default="http://localhost:3000,http://localhost:5173", env="CORS_ORIGINS")
-    cors_credentials: bool = Field(default=True, env="CORS_CREDENTIALS")
-    cors_methods: Union[str, List[str]] = Field(default="*", env="CORS_METHODS")
-    cors_headers: Union[str, List[str]] = Field(default="*", env="CORS_HEADERS")
+    # CORS settings (comma-separated in the environment)
+    cors_origins: Tuple[str, ...] = ("http://localhost:3000", "http://localhost:5173")
+    cors_credentials: bool = True
+    cors_methods: Tuple[str, ...] = ("*",)
+    cors_headers: Tuple[str, ...] = ("*",)
     
     # External services
-    openai_api_key: str = Field(default="", env="OPENAI_API_KEY")
-    anthropic_api_key: str = Field(default="", env="ANTHROPIC_API_KEY")
-    azure_openai_endpoint: str = Field(default="", env="AZURE_OPENAI_ENDPOINT")
-    azure_openai_api_key: str = Field(default="", env="AZURE_OPENAI_API_KEY")
-    auth_service_url: str = Field(default="http://authservice:8000", env="AUTH_SERVICE_URL")
+    openai_api_key: str = ""
+    anthropic_api_key: str = ""
+    azure_openai_endpoint: str = ""
+    azure_openai_api_key: str = ""
+    auth_service_url: str = "http://authservice:8000"
+    auth_token_cache_ttl_seconds: int = 300
+    auth_token_cache_size: int = 10000
+    auth_token_reject_ttl_seconds: float = 2
     
     # Logging settings
-    log_level: str = Field(default="INFO", env="LOG_LEVEL")
-    log_file: str = Field(default="./logs/app.log", env="LOG_FILE")
-    log_format: str = Field(default="detailed", env="LOG_FORMAT")
-    sqlalchemy_log_level: str = Field(default="WARNING", env="SQLALCHEMY_LOG_LEVEL")
+    log_level: str = "INFO"
+    log_file: str = "./logs/app.log"
+    log_format: str = "detailed"
+    sqlalchemy_log_level: str = "WARNING"
     
     # Monitoring settings
-    enable_metrics: bool = Field(default=True, env="ENABLE_METRICS", alias="metrics_enabled")
-    metrics_port: int = Field(default=9090, env="METRICS_PORT")
+    enable_metrics: bool = env_field(True, "metrics_enabled")
+    metrics_port: int = 9090
     
     # API settings
     api_v1_prefix: str = "/api/v1"
-
-    @field_validator('cors_origins')
-    @classmethod
-    def parse_cors_origins(cls, v):
-        if isinstance(v, str):
-            return [origin.strip() for origin in v.split(',')]
-        return v
     
-    @field_validator('cors_methods')
-    @classmethod
-    def parse_cors_methods(cls, v):
-        if isinstance(v, str):
-            return [method.strip() for method in v.split(',')]
-        return v
+    @property
+    def metrics_enabled(self) -> bool:
+        return self.enable_metrics
     
-    @field_validator('cors_headers')
     @classmethod
-    def parse_cors_headers(cls, v):
-        if isinstance(v, str):
-            return [header.strip() for header in v.split(',')]
-        return v
-    
-    model_config = {"env_file": ".env", "case_sensitive": False}
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> "Settings":
+        """Build settings from environment variables, falling back to the defaults"""
+        env = {key.lower(): value for key, value in (os.environ if environ is None else environ).items()}
+        values = {}
+        for setting in fields(cls):
+            for name in (setting.name, *setting.metadata.get("env", ())):
+                raw = env.get(name)
+                if raw is not None:
+                    parser = _PARSERS.get(setting.type, str)
+                    try:
+                        values[setting.name] = parser(raw)
+                    except ValueError as e:
+                        raise ValueError(f"Invalid value for {name.upper()}: {e}") from e
+                    break
+        return cls(**values)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Application settings, built once per process on first use"""
+    return Settings.from_env()
 
 
-# Global settings instance
-settings = Settings()
+def __getattr__(name: str) -> Any:
+    # `settings` is built on first access instead of at import (PEP 562)
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
+@lru_cache(maxsize=1)
 def get_database_url() -> str:
-    """Get the appropriate database URL based on configuration"""
+    """Get the appropriate database URL based on configuration (call cache_clear() alongside get_settings.cache_clear())"""
     # Use the configured database URL directly
-    return settings.database_url
+    return get_settings().database_url
+
+
+DETAILED_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
+SIMPLE_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Console format per log_format setting; anything else falls back to SIMPLE_LOG_FORMAT
+LOG_FORMATS = {
+    "detailed": DETAILED_LOG_FORMAT,
+    "json": SIMPLE_LOG_FORMAT,
+}
+
+UVICORN_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+# SQLAlchemy loggers - reduce verbosity ("sqlalchemy" is the catch-all)
+SQLALCHEMY_LOGGERS = ("sqlalchemy.engine", "sqlalchemy.pool", "sqlalchemy.dialects", "sqlalchemy.orm", "sqlalchemy")
 
 
 def get_log_config() -> Dict[str, Any]:
     """Get logging configuration"""
-    # Determine format based on log_format setting
-    if settings.log_format == "detailed":
-        default_format = "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
-    elif settings.log_format == "json":
-        default_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    else:
-        default_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    settings = get_settings()
+    
+    def logger_config(level: str) -> Dict[str, Any]:
+        # A fresh dict per logger - dictConfig mutates what it is given
+        return {"level": level, "handlers": ["console", "file"], "propagate": False}
+    
+    loggers = {name: logger_config("INFO") for name in UVICORN_LOGGERS}
+    loggers.update((name, logger_config(settings.sqlalchemy_log_level)) for name in SQLALCHEMY_LOGGERS)
     
     return {
         "version": 1,
         "disable_existing_loggers": False,
         "formatters": {
             "default": {
-                "format": default_format,
+                "format": LOG_FORMATS.get(settings.log_format, SIMPLE_LOG_FORMAT),
             },
             "detailed": {
-                "format": "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
+                "format": DETAILED_LOG_FORMAT,
             },
         },
         "handlers": {
@@ -162,48 +274,5 @@ def get_log_config() -> Dict[str, Any]:
             "level": settings.log_level,
             "handlers": ["console", "file"],
         },
-        "loggers": {
-            "uvicorn": {
-                "level": "INFO",
-                "handlers": ["console", "file"],
-                "propagate": False,
-            },
-            "uvicorn.error": {
-                "level": "INFO",
-                "handlers": ["console", "file"],
-                "propagate": False,
-            },
-            "uvicorn.access": {
-                "level": "INFO",
-                "handlers": ["console", "file"],
-                "propagate": False,
-            },
-            # SQLAlchemy loggers - reduce verbosity
-            "sqlalchemy.engine": {
-                "level": settings.sqlalchemy_log_level,
-                "handlers": ["console", "file"],
-                "propagate": False,
-            },
-            "sqlalchemy.pool": {
-                "level": settings.sqlalchemy_log_level,
-                "handlers": ["console", "file"],
-                "propagate": False,
-            },
-            "sqlalchemy.dialects": {
-                "level": settings.sqlalchemy_log_level,
-                "handlers": ["console", "file"],
-                "propagate": False,
-            },
-            "sqlalchemy.orm": {
-                "level": settings.sqlalchemy_log_level,
-                "handlers": ["console", "file"],
-                "propagate": False,
-            },
-            # Catch-all SQLAlchemy logger
-            "sqlalchemy": {
-                "level": settings.sqlalchemy_log_level,
-                "handlers": ["console", "file"],
-                "propagate": False,
-            },
-        },
+        "loggers": loggers,
     }
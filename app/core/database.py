@@ -1,16 +1,23 @@
 """
 Database configuration and session management with improved architecture
 """
-from sqlalchemy import create_engine, text, event
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, insert, inspect, select, text, update, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
 from contextlib import contextmanager
-from typing import Generator, Optional
+from typing import Generator, List, Optional
+import hashlib
 import logging
+import orjson
 import os
+import threading
 
 from .config import settings, get_database_url
+from .database_types import UniversalID
 
 logger = logging.getLogger(__name__)
 
@@ -20,55 +27,125 @@ database_url = get_database_url()
 # Handle PostgreSQL URL format conversion for Azure Cosmos DB compatibility
 if not database_url.startswith("sqlite"):
     # Handle different PostgreSQL URL formats
-    if database_url.startswith('postgres://'):
-        if 'cosmos.azure.com' in database_url:
+    url_without_scheme = database_url.removeprefix('postgres://')
+    if len(url_without_scheme) != len(database_url):
+        if 'cosmos.azure.com' in url_without_scheme:
             # Azure Cosmos DB for PostgreSQL - use psycopg2 explicitly
-            database_url = database_url.replace('postgres://', 'postgresql+psycopg2://', 1)
+            database_url = 'postgresql+psycopg2://' + url_without_scheme
             logger.info("Detected Azure Cosmos DB for PostgreSQL - using psycopg2 driver")
         else:
             # Regular PostgreSQL - convert to postgresql://
-            database_url = database_url.replace('postgres://', 'postgresql://', 1)
+            database_url = 'postgresql://' + url_without_scheme
     
     # Validate PostgreSQL URL format
     if not database_url.startswith(('postgresql://', 'postgresql+psycopg2://')):
         raise ValueError(f"Invalid PostgreSQL URL format: {database_url[:30]}...")
 
-if database_url.startswith("sqlite"):
+
+def json_serializer(value) -> str:
+    """
+    orjson encoder for JSON columns (non-string keys are stringified, as the stdlib encoder does)
+    Queries that match against stored JSON text encode their operands with this too.
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# JSON columns (role permissions, workflow graphs, schemas) encode and decode with orjson
+JSON_ENGINE_OPTIONS = {"json_serializer": json_serializer, "json_deserializer": orjson.loads}
+
+# File-backed SQLite runs in WAL mode (see set_sqlite_pragma), where readers don't block
+# each other, so it gets a small pool of connections instead of one shared handle
+SQLITE_POOL_SIZE = 5
+SQLITE_MAX_OVERFLOW = 10
+
+
+def _is_sqlite_memory(url: str) -> bool:
+    """Whether a SQLite URL names an in-memory database (":memory:", a memory URI, or no path at all)"""
+    database = make_url(url).database
+    return not database or ":memory:" in database or "mode=memory" in url
+
+
+if database_url.startswith("sqlite") and _is_sqlite_memory(database_url):
+    # Each connection to an in-memory database is a separate database - keep a single one
     engine = create_engine(
         database_url,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
         echo=settings.debug,
+        **JSON_ENGINE_OPTIONS,
+    )
+elif database_url.startswith("sqlite"):
+    engine = create_engine(
+        database_url,
+        connect_args={"check_same_thread": False},
+        poolclass=QueuePool,
+        pool_size=SQLITE_POOL_SIZE,
+        max_overflow=SQLITE_MAX_OVERFLOW,
+        echo=settings.debug,
+        **JSON_ENGINE_OPTIONS,
     )
 else:
     # PostgreSQL configuration with Azure Cosmos DB optimizations
     engine = create_engine(
         database_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
         pool_pre_ping=True,
-        pool_recycle=300,
+        pool_recycle=settings.db_pool_recycle,
         echo=settings.debug,
         # Azure Cosmos DB specific settings
         connect_args={
             "sslmode": "require",
             "connect_timeout": 30,
-        } if 'cosmos.azure.com' in database_url else {}
+        } if 'cosmos.azure.com' in database_url else {},
+        **JSON_ENGINE_OPTIONS,
     )
-    
-    # Test database connection for PostgreSQL
-    try:
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
-        logger.info("Database connection verified")
-    except Exception as e:
-        logger.error(f"Database connection failed: {e}")
-        raise
+
+# PostgreSQL connectivity is verified on the first session rather than at import,
+# so scripts and tooling that never query don't pay the round-trip
+_verified = database_url.startswith("sqlite")
+_verify_lock = threading.Lock()
+
+
+def _verify_once() -> None:
+    """Run the one-time PostgreSQL connection check before the first session is handed out"""
+    global _verified
+    if _verified:
+        return
+    with _verify_lock:
+        if _verified:
+            return
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            logger.info("Database connection verified")
+        except Exception as e:
+            logger.error(f"Database connection failed: {e}")
+            raise
+        _verified = True
+
 
 # Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: repositories refresh what they write, so expiring every
+# loaded object on commit would only cost a re-SELECT on the next attribute access
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine, class_=Session)
 
 # Create Base class for declarative models
 Base = declarative_base()
 
+# Advisory lock key (PostgreSQL) serializing create_tables() across processes
+SCHEMA_LOCK_KEY = 0x43545343  # "CTSC"
+
+# Fingerprint of the schema create_tables() last created, kept outside Base.metadata
+_schema_metadata = MetaData()
+schema_version_table = Table(
+    "_schema_version",
+    _schema_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("fingerprint", String(64), nullable=False),
+)
+
 
 class DatabaseManager:
     """Database manager for handling connections and operations"""
@@ -88,10 +165,92 @@ class DatabaseManager:
             logger.error(f"Database connection test failed: {e}")
             return False
     
+    def schema_fingerprint(self) -> str:
+        """Hash of the DDL for every model table and index, as compiled for this engine"""
+        statements = []
+        for table in Base.metadata.sorted_tables:
+            statements.append(str(CreateTable(table).compile(self.engine)))
+            statements.extend(str(CreateIndex(index).compile(self.engine)) for index in table.indexes)
+        return hashlib.blake2b("|".join(sorted(statements)).encode(), digest_size=32).hexdigest()
+    
+    def _stored_fingerprint(self) -> Optional[str]:
+        try:
+            with self.engine.connect() as connection:
+                return connection.execute(select(schema_version_table.c.fingerprint)).scalar()
+        except SQLAlchemyError:
+            # No marker table yet (fresh database)
+            return None
+    
+    def find_text_ids(self) -> List[str]:
+        """
+        SQLite ID columns that still hold text IDs ("table.column")
+        Databases created before IDs were stored as 16-byte BLOBs keep the
+        36-character strings, which no longer match any lookup by ID.
+        """
+        if self.engine.dialect.name != "sqlite":
+            return []
+        
+        found = []
+        inspector = inspect(self.engine)
+        existing_tables = set(inspector.get_table_names())
+        with self.engine.connect() as connection:
+            for table in Base.metadata.sorted_tables:
+                if table.name not in existing_tables:
+                    continue
+                existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if not isinstance(column.type, UniversalID) or column.name not in existing_columns:
+                        continue
+                    has_text = connection.execute(text(
+                        f'SELECT 1 FROM "{table.name}" WHERE typeof("{column.name}") = \'text\' LIMIT 1'
+                    )).first()
+                    if has_text:
+                        found.append(f"{table.name}.{column.name}")
+        return found
+    
+    @staticmethod
+    def _lock_schema(connection) -> None:
+        """Hold the database-wide schema lock until the connection's transaction ends"""
+        if connection.dialect.name == "postgresql":
+            connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_LOCK_KEY})
+        elif connection.dialect.name == "sqlite":
+            # Take the write lock now rather than at the first write (pysqlite defers BEGIN)
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+    
     def create_tables(self):
-        """Create all database tables"""
+        """Create all database tables, skipped when the schema is unchanged since the last run"""
         try:
-            Base.metadata.create_all(bind=self.engine)
+            fingerprint = self.schema_fingerprint()
+            if self._stored_fingerprint() == fingerprint:
+                logger.info("Database schema unchanged, skipping table creation")
+                return
+            
+            # Any database stamped with a fingerprint already stores BLOB IDs,
+            # so only an unstamped (or changed) one can still hold text IDs
+            text_ids = self.find_text_ids()
+            if text_ids:
+                raise RuntimeError(
+                    f"SQLite database still stores text IDs in {', '.join(text_ids)}; IDs are now "
+                    "16-byte BLOBs and those rows would never match. Run "
+                    "`python -m scripts.migrate_sqlite_ids` or delete the database file."
+                )
+            
+            with self.engine.begin() as connection:
+                # Workers starting together queue up here; only the first creates
+                # the tables, the others find its fingerprint once they get the lock
+                self._lock_schema(connection)
+                _schema_metadata.create_all(bind=connection)
+                stored = connection.execute(select(schema_version_table.c.fingerprint)).scalar()
+                if stored == fingerprint:
+                    logger.info("Database schema created by another process, skipping table creation")
+                    return
+                
+                Base.metadata.create_all(bind=connection)
+                updated = connection.execute(
+                    update(schema_version_table).where(schema_version_table.c.id == 1).values(fingerprint=fingerprint)
+                ).rowcount
+                if not updated:
+                    connection.execute(insert(schema_version_table).values(id=1, fingerprint=fingerprint))
             logger.info("Database tables created successfully")
         except Exception as e:
             logger.error(f"Failed to create database tables: {e}")
@@ -101,14 +260,37 @@ class DatabaseManager:
         """Drop all database tables (use with caution)"""
         try:
             Base.metadata.drop_all(bind=self.engine)
+            _schema_metadata.drop_all(bind=self.engine)
             logger.info("Database tables dropped successfully")
         except Exception as e:
             logger.error(f"Failed to drop database tables: {e}")
             raise
     
+    def warm_pool(self) -> int:
+        """Open the pool's connections up front so the first requests skip the connect handshake"""
+        pool_size = getattr(self.engine.pool, "size", None)
+        if not callable(pool_size):
+            # StaticPool (in-memory SQLite) keeps a single connection and has nothing to pre-open
+            return 0
+        
+        connections = []
+        try:
+            for _ in range(pool_size()):
+                connections.append(self.engine.connect())
+        except Exception as e:
+            logger.warning(f"Connection pool warm-up stopped early: {e}")
+        finally:
+            # Closing returns each connection to the pool, already established
+            for connection in connections:
+                connection.close()
+        
+        logger.info(f"Connection pool warmed with {len(connections)} connections")
+        return len(connections)
+    
     @contextmanager
     def get_session(self):
         """Get a database session with automatic cleanup"""
+        _verify_once()
         session = self.SessionLocal()
         try:
             yield session
@@ -129,6 +311,7 @@ def get_db() -> Generator[Session, None, None]:
     """
     Database dependency for FastAPI
     """
+    _verify_once()
     db = SessionLocal()
     try:
         yield db
@@ -140,11 +323,31 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+@contextmanager
+def readonly_session() -> Generator[Session, None, None]:
+    """
+    Read-only session owned by the caller rather than by a request dependency
+    Streamed response bodies read through one of these: from FastAPI 0.106
+    the request's dependencies are torn down before the body is sent.
+    """
+    _verify_once()
+    db = SessionLocal(info={"readonly": True})
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 def create_tables():
     """Create all database tables"""
     db_manager.create_tables()
 
 
+def warm_pool() -> int:
+    """Pre-open database pool connections"""
+    return db_manager.warm_pool()
+
+
 def init_db():
     """Initialize database with default data"""
     from scripts.seed_workflow_components import seed_workflow_component_definitions
@@ -182,8 +385,19 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
         cursor.close()
 
 
+@event.listens_for(SessionLocal, "after_flush")
+def mark_flushed(session, flush_context):
+    """Remember that the session wrote, so restart_savepoint knows its objects may be stale"""
+    session.info["flushed"] = True
+
+
 @event.listens_for(SessionLocal, "after_transaction_end")
 def restart_savepoint(session, transaction):
     """Restart savepoint after transaction end for better error handling"""
+    if session.info.get("readonly"):
+        return
     if transaction.nested and not transaction._parent.nested:
-        session.expire_all()
+        # A savepoint that never wrote (no flush, nothing pending) left nothing stale
+        wrote = session.info.pop("flushed", False)
+        if wrote or session.dirty or session.new or session.deleted:
+            session.expire_all()
@@ -1,16 +1,25 @@
 """
 Database-aware column types for cross-database compatibility
 """
-from sqlalchemy import String, TypeDecorator
+from sqlalchemy import LargeBinary, TypeDecorator
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.types import CHAR
+from functools import lru_cache
 import uuid
 import os
 
+from .id_utils import uuid_from_string as _parse_uuid
+
+
+# The 16-byte form SQLite hands back is shared the same way as parsed ID strings
+@lru_cache(maxsize=65536)
+def _uuid_from_bytes(value: bytes) -> uuid.UUID:
+    return uuid.UUID(bytes=value)
+
 
 class UniversalID(TypeDecorator):
     """
-    A database-agnostic ID type that uses UUID for PostgreSQL and String for SQLite.
+    A database-agnostic ID type that uses UUID for PostgreSQL and 16-byte BLOBs for SQLite.
     This allows the same model to work across both development (SQLite) and production (PostgreSQL) environments.
     """
     
@@ -22,45 +31,47 @@ class UniversalID(TypeDecorator):
         if dialect.name == 'postgresql':
             return dialect.type_descriptor(UUID(as_uuid=True))
         else:
-            # For SQLite and other databases, use String(36) to store UUID as string
-            return dialect.type_descriptor(String(36))
+            # For SQLite and other databases, store the 16 raw bytes - less than
+            # half the size of the 36-character text form, in rows and indexes
+            return dialect.type_descriptor(LargeBinary(16))
 
     def process_bind_param(self, value, dialect):
         """Process value when binding to database"""
         if value is None:
             return None
         
+        # Exact type checks - this runs for every bound ID, and the values are
+        # almost always plain UUIDs or strings, so isinstance() is rarely needed
+        value_type = type(value)
         if dialect.name == 'postgresql':
             # PostgreSQL can handle UUID objects directly
-            if isinstance(value, uuid.UUID):
+            if value_type is uuid.UUID or isinstance(value, uuid.UUID):
                 return value
-            elif isinstance(value, str):
-                return uuid.UUID(value)
-        else:
-            # For SQLite, convert UUID to string
-            if isinstance(value, uuid.UUID):
-                return str(value)
-            elif isinstance(value, str):
-                # Validate it's a proper UUID string
-                try:
-                    uuid.UUID(value)
-                    return value
-                except ValueError:
-                    raise ValueError(f"Invalid UUID string: {value}")
+            if isinstance(value, str):
+                return _parse_uuid(value)
+            return value
+        
+        # For SQLite, store the UUID's raw bytes
+        if value_type is uuid.UUID or isinstance(value, uuid.UUID):
+            return value.bytes
+        if isinstance(value, str):
+            try:
+                return _parse_uuid(value).bytes
+            except ValueError:
+                raise ValueError(f"Invalid UUID string: {value}")
         
         return value
 
     def process_result_value(self, value, dialect):
         """Process value when loading from database"""
-        if value is None:
-            return None
-            
-        if dialect.name == 'postgresql':
+        if value is None or type(value) is uuid.UUID:
             # PostgreSQL returns UUID objects
-            return value if isinstance(value, uuid.UUID) else uuid.UUID(value)
-        else:
-            # For SQLite, convert string back to UUID object
-            return uuid.UUID(value) if isinstance(value, str) else value
+            return value
+        
+        # For SQLite, rebuild the UUID from its stored bytes
+        if isinstance(value, bytes):
+            return _uuid_from_bytes(value)
+        return _parse_uuid(value) if isinstance(value, str) else value
 
 
 def get_id_column():
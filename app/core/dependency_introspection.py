@@ -0,0 +1,46 @@
+"""
+Memoized dependency introspection for FastAPI
+FastAPI re-checks on every request whether each dependency callable is a
+coroutine, generator or async generator. The answer never changes for a given
+callable, so the checks are cached per callable here.
+"""
+import weakref
+from typing import Any, Callable
+
+from fastapi.dependencies import utils as dependency_utils
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+_PATCHED_CHECKS = ("is_coroutine_callable", "is_gen_callable", "is_async_gen_callable")
+
+
+def _memoize_check(check: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    """Wrap an introspection check with a per-callable result cache"""
+    results: "weakref.WeakKeyDictionary[Any, bool]" = weakref.WeakKeyDictionary()
+
+    def cached_check(call: Any) -> bool:
+        try:
+            return results[call]
+        except KeyError:
+            result = results[call] = check(call)
+            return result
+        except TypeError:
+            # Not weak-referenceable or unhashable - fall back to the plain check
+            return check(call)
+
+    cached_check.__wrapped__ = check
+    return cached_check
+
+
+def install_dependency_introspection_cache() -> None:
+    """Replace FastAPI's per-request dependency checks with memoized versions"""
+    for name in _PATCHED_CHECKS:
+        check = getattr(dependency_utils, name, None)
+        if check is None:
+            logger.warning(f"FastAPI has no {name}; dependency introspection cache not installed for it")
+            continue
+        if hasattr(check, "__wrapped__"):
+            continue
+        setattr(dependency_utils, name, _memoize_check(check))
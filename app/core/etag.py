@@ -0,0 +1,39 @@
+"""
+ETag helpers for conditional GET requests
+"""
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response, status
+
+
+def version_etag(entity_id: Any, updated_at: Any) -> str:
+    """Weak ETag for an entity, derived from its ID and last update time"""
+    return f'W/"{entity_id}-{updated_at}"'
+
+
+def content_etag(content: Any) -> str:
+    """Strong ETag derived from the content of a JSON-serializable value"""
+    digest = hashlib.blake2b(orjson.dumps(content, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def _opaque_tag(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check the request's If-None-Match header against etag (weak comparison, as RFC 9110 requires)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    target = _opaque_tag(etag)
+    return any(_opaque_tag(candidate.strip()) == target for candidate in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response carrying the current ETag"""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -0,0 +1,35 @@
+"""
+Shared outbound HTTP client
+One pooled client for calls to external tool servers, so repeated calls reuse
+kept-alive connections instead of opening a new one per request
+"""
+from typing import Optional
+
+import httpx
+
+# Connection pool shared by all outbound tool calls
+OUTBOUND_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+OUTBOUND_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+
+class OutboundHTTPClient:
+    """Lazily created, long-lived httpx.AsyncClient"""
+
+    def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=OUTBOUND_TIMEOUT, limits=OUTBOUND_LIMITS)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled connections (called on application shutdown)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# Global instance
+outbound_http = OutboundHTTPClient()
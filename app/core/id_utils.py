@@ -2,9 +2,14 @@
 ID utilities for handling UUIDs consistently across database environments
 """
 import uuid
+from functools import lru_cache
 from typing import Union, Optional
 import os
 
+# IDs repeat heavily across requests and rows (organization IDs above all), so each
+# ID string is parsed once and the immutable UUID shared; failures are not cached
+uuid_from_string = lru_cache(maxsize=65536)(uuid.UUID)
+
 
 def generate_id() -> uuid.UUID:
     """Generate a new UUID"""
@@ -28,12 +33,22 @@ def parse_id(value: Union[str, uuid.UUID, None]) -> Optional[uuid.UUID]:
     if value is None:
         return None
     
+    # Exact-type checks first: the common inputs skip the isinstance MRO walk
+    value_type = type(value)
+    if value_type is uuid.UUID:
+        return value
+    if value_type is str:
+        try:
+            return uuid_from_string(value)
+        except ValueError as e:
+            raise ValueError(f"Invalid UUID string: {value}") from e
+    
     if isinstance(value, uuid.UUID):
         return value
     
     if isinstance(value, str):
         try:
-            return uuid.UUID(value)
+            return uuid_from_string(value)
         except ValueError as e:
             raise ValueError(f"Invalid UUID string: {value}") from e
     
@@ -60,7 +75,7 @@ def id_to_string(value: Union[str, uuid.UUID, None]) -> Optional[str]:
     if isinstance(value, str):
         # Validate it's a proper UUID string
         try:
-            uuid.UUID(value)
+            uuid_from_string(value)
             return value
         except ValueError as e:
             raise ValueError(f"Invalid UUID string: {value}") from e
@@ -68,15 +83,18 @@ def id_to_string(value: Union[str, uuid.UUID, None]) -> Optional[str]:
     raise TypeError(f"ID must be str or UUID, got {type(value)}")
 
 
+@lru_cache(maxsize=1)
 def is_sqlite_database() -> bool:
     """
     Check if we're using SQLite database.
     Useful for conditional logic based on database type.
+    The answer is computed once per process (the database URL doesn't change).
     """
     database_url = os.getenv("DATABASE_URL", "sqlite:///./control_tower.db")
     return database_url.startswith("sqlite")
 
 
+@lru_cache(maxsize=1)
 def is_postgresql_database() -> bool:
     """
     Check if we're using PostgreSQL database.
@@ -1,24 +1,40 @@
 """
 JWT utilities for token validation and user extraction
 """
+import hashlib
 import jwt
 import logging
+import time
 from typing import Optional, Dict, Any
-from datetime import datetime
 import os
+from .cache import TTLCache
 from .config import settings
 
 logger = logging.getLogger(__name__)
 
+# Decoded payloads are reused for a few seconds, never past the token's own expiry
+DECODED_TOKEN_CACHE_SIZE = 4096
+DECODED_TOKEN_CACHE_TTL_SECONDS = 5.0
+
 class JWTManager:
     """JWT token validation and user extraction"""
     
+    __slots__ = ("secret_key", "secret_key_bytes", "algorithm", "_algorithms", "_audience", "_decoded_tokens")
+    
     def __init__(self):
         # In production, this should come from environment variables
         # and be the same secret used by AuthService
         self.secret_key = os.getenv("JWT_SECRET_KEY", "your-jwt-secret-key-change-in-production")
+        self.secret_key_bytes = self.secret_key.encode()
         self.algorithm = "HS256"
-        logger.info(f"🔑 JWT Manager initialized with secret key: {self.secret_key[:10]}...")
+        self._algorithms = [self.algorithm]
+        self._audience = settings.resource_app_id
+        self._decoded_tokens = TTLCache(
+            "decoded_jwts",
+            maxsize=DECODED_TOKEN_CACHE_SIZE,
+            ttl=DECODED_TOKEN_CACHE_TTL_SECONDS
+        )
+        logger.info("🔑 JWT Manager initialized")
     
     def decode_token(self, token: str) -> Optional[Dict[str, Any]]:
         """
@@ -30,29 +46,32 @@ class JWTManager:
             if token.startswith('Bearer '):
                 token = token[7:]
             
-            logger.debug(f"🔑 Decoding token with secret_key: {self.secret_key[:10]}...")
-            logger.debug(f"🔑 Using algorithm: {self.algorithm}")
-            logger.debug(f"🎫 Token (first 20 chars): {token[:20]}...")
+            # Keyed by a digest, so raw tokens are never held in memory
+            cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+            cached = self._decoded_tokens.get(cache_key)
+            if cached is not None:
+                return cached
             
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug(f"🔑 Decoding token with algorithm: {self.algorithm}")
+                logger.debug(f"🎫 Token (first 20 chars): {token[:20]}...")
+            
+            # jwt.decode also rejects expired tokens (ExpiredSignatureError below)
             payload = jwt.decode(
                 token, 
-                self.secret_key, 
-                algorithms=[self.algorithm],
-                audience=settings.resource_app_id
+                self.secret_key_bytes, 
+                algorithms=self._algorithms,
+                audience=self._audience
             )
             
-            logger.debug(f"✅ Token decoded successfully, payload keys: {list(payload.keys())}")
-            
-            # Check if token is expired
-            if 'exp' in payload:
-                exp_timestamp = payload['exp']
-                current_timestamp = datetime.utcnow().timestamp()
-                logger.debug(f"⏰ Token expiry check: exp={exp_timestamp}, now={current_timestamp}")
-                
-                if current_timestamp > exp_timestamp:
-                    logger.warning(f"❌ Token expired: exp={exp_timestamp}, now={current_timestamp}")
-                    return None
+            if debug:
+                logger.debug(f"✅ Token decoded successfully, payload keys: {list(payload.keys())}")
             
+            ttl = DECODED_TOKEN_CACHE_TTL_SECONDS
+            if isinstance(payload.get('exp'), (int, float)):
+                ttl = min(ttl, payload['exp'] - time.time())
+            self._decoded_tokens.set(cache_key, payload, ttl=ttl)
             return payload
             
         except jwt.ExpiredSignatureError as e:
@@ -68,25 +87,25 @@ class JWTManager:
     
     def get_user_id_from_token(self, token: str) -> Optional[str]:
         """Extract user ID from JWT token"""
-        logger.debug(f"🎫 Extracting user ID from token")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("🎫 Extracting user ID from token")
         
         payload = self.decode_token(token)
         if payload:
-            logger.debug(f"🔍 Token payload keys: {list(payload.keys())}")
-            
-            # Log the key claims for debugging
+            # EntraID typically stores email in 'preferred_username' claim
             preferred_username = payload.get('preferred_username')
             user_id = payload.get('user_id')
-            sub = payload.get('sub')
-            email = payload.get('email')
             
-            logger.debug(f"👤 Token claims:")
-            logger.debug(f"  - preferred_username: {preferred_username}")
-            logger.debug(f"  - user_id: {user_id}")
-            logger.debug(f"  - sub: {sub}")
-            logger.debug(f"  - email: {email}")
+            if debug:
+                # Log the key claims for debugging
+                logger.debug(f"🔍 Token payload keys: {list(payload.keys())}")
+                logger.debug("👤 Token claims:")
+                logger.debug(f"  - preferred_username: {preferred_username}")
+                logger.debug(f"  - user_id: {user_id}")
+                logger.debug(f"  - sub: {payload.get('sub')}")
+                logger.debug(f"  - email: {payload.get('email')}")
             
-            # EntraID typically stores email in 'preferred_username' claim
             result = preferred_username or user_id
             logger.info(f"✅ Extracted user ID: {result}")
             return result
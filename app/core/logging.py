@@ -1,15 +1,66 @@
 """
 Logging configuration and utilities
 """
+import atexit
 import logging
 import logging.config
+import logging.handlers
 import os
+import queue
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from pathlib import Path
 
 from .config import settings, get_log_config
 
+# Background thread that writes queued records to the log file
+_file_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _move_file_logging_off_thread() -> None:
+    """
+    Put the rotating file handler behind a QueueHandler/QueueListener pair
+    Logging threads then only enqueue the record; the file write and rotation
+    happen on the listener's thread.
+    """
+    global _file_log_listener
+    
+    loggers = [logging.getLogger()] + [
+        logger for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    ]
+    file_handlers = {
+        handler for logger in loggers for handler in logger.handlers
+        if isinstance(handler, logging.handlers.RotatingFileHandler)
+    }
+    if not file_handlers:
+        return
+    
+    if _file_log_listener is not None:
+        _file_log_listener.stop()
+    
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setLevel(min(handler.level for handler in file_handlers))
+    for logger in loggers:
+        if any(handler in file_handlers for handler in logger.handlers):
+            logger.handlers = [handler for handler in logger.handlers if handler not in file_handlers]
+            logger.addHandler(queue_handler)
+    
+    _file_log_listener = logging.handlers.QueueListener(
+        log_queue, *file_handlers, respect_handler_level=True
+    )
+    _file_log_listener.start()
+
+
+def _stop_file_logging() -> None:
+    """Flush queued records to the log file (registered to run at exit)"""
+    if _file_log_listener is not None:
+        _file_log_listener.stop()
+
+
+atexit.register(_stop_file_logging)
+
 
 def setup_logging() -> None:
     """Setup logging configuration"""
@@ -21,6 +72,7 @@ def setup_logging() -> None:
     # Apply logging configuration
     log_config = get_log_config()
     logging.config.dictConfig(log_config)
+    _move_file_logging_off_thread()
     
     # Log startup information
     logger = logging.getLogger(__name__)
@@ -2,40 +2,55 @@
 Authorization middleware for role-based access control
 """
 from fastapi import Request, HTTPException, status, Depends, Header
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Tuple, Optional
+from functools import lru_cache
+from typing import AsyncIterator, Tuple, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from app.services.authorization_service import AuthorizationService
 from app.core.exceptions import ForbiddenError
 from app.core.database import get_db
-from app.core.auth_client import AuthServiceClient
+from app.core.auth_client import get_auth_client
+from app.core.auth_context import auth_context
+from app.core.id_utils import uuid_from_string
 import logging
+import sys
 
-# Security dependencies
-security = HTTPBearer(auto_error=False)
-auth_client = AuthServiceClient()
 logger = logging.getLogger(__name__)
 
-async def get_current_user_id(
-    x_user_id: str = Header(None, alias="X-User-ID"),
-    x_service: str = Header(None, alias="X-Service"),
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
-) -> UUID:
-    """Validate JWT token or handle internal service calls and return user ID as UUID"""
-    # Handle internal service calls (from AuthService, etc.)
-    if x_user_id and x_service:
-        logger.info(f"Internal service call from {x_service} for user {x_user_id}")
-        try:
-            return UUID(x_user_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid user ID format in X-User-ID header"
-            )
+# Organization used when a request carries no x-organization-id header (development/testing)
+DEFAULT_ORGANIZATION_ID = "bb5a9afd-336a-445e-99ce-e81b9d444b76"
+
+def _internal_user_id(x_user_id: Optional[str], x_service: Optional[str]) -> Optional[UUID]:
+    """Return the user ID for internal service calls (from AuthService, etc.), or None"""
+    if not (x_user_id and x_service):
+        return None
     
-    # Handle regular JWT token validation
-    if not credentials:
+    logger.info("Internal service call from %s for user %s", x_service, x_user_id)
+    try:
+        return uuid_from_string(x_user_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid user ID format in X-User-ID header"
+        )
+
+
+def _bearer_token(request: Request) -> Optional[str]:
+    """Return the token from an 'Authorization: Bearer <token>' header, or None"""
+    authorization = request.headers.get("authorization")
+    if not authorization:
+        return None
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return token
+
+
+async def get_current_user_id_jwt(request: Request) -> UUID:
+    """Validate the bearer token with AuthService and return user ID as UUID"""
+    token = _bearer_token(request)
+    if not token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated",
@@ -43,7 +58,7 @@ async def get_current_user_id(
         )
     
     try:
-        user_data = await auth_client.validate_token(credentials.credentials)
+        user_data = await get_auth_client().validate_token(token)
         # Use 'id' field for user ID, fallback to 'sub' for JWT standard compatibility
         user_id_str = user_data.get("id") or user_data.get("sub")
         if not user_id_str:
@@ -52,7 +67,7 @@ async def get_current_user_id(
                 detail="User ID not found in token"
             )
         try:
-            return UUID(user_id_str)
+            return uuid_from_string(user_id_str)
         except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -68,29 +83,111 @@ async def get_current_user_id(
         )
 
 
+async def get_current_user_id(request: Request) -> UUID:
+    """Validate JWT token or handle internal service calls and return user ID as UUID"""
+    # Headers are read directly rather than through a sub-dependency; internal
+    # service calls never need the bearer token parsed
+    headers = request.headers
+    internal_user_id = _internal_user_id(headers.get("x-user-id"), headers.get("x-service"))
+    if internal_user_id is not None:
+        return internal_user_id
+    return await get_current_user_id_jwt(request)
+
+
 async def get_current_organization_id(
-    request: Request,
+    x_organization_id: Optional[str] = Header(None, alias="x-organization-id"),
     current_user_id: UUID = Depends(get_current_user_id)
-) -> str:
+) -> UUID:
     """Extract organization_id from x-organization-id header"""
+    # Use default test organization for development/testing
+    organization_id = x_organization_id or DEFAULT_ORGANIZATION_ID
+    if logger.isEnabledFor(logging.DEBUG):
+        if x_organization_id:
+            logger.debug("[AUTH] Found organization_id in header: %s", organization_id)
+        else:
+            logger.debug("[AUTH] No x-organization-id header found, using default organization: %s", organization_id)
     
-    organization_id = request.headers.get('x-organization-id')
+    try:
+        return uuid_from_string(organization_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid organization ID format: {organization_id}"
+        )
+
+
+class PermissionChecker:
+    """
+    FastAPI dependency that checks one (resource, action) permission
+    A plain callable object rather than a closure, so every route sharing a
+    permission shares one dependency. Yields (user_id, organization_id) as UUIDs
+    and binds them in the auth context for the rest of the request.
+    """
+    
+    __slots__ = ("resource", "action", "__weakref__")
     
-    if not organization_id:
-        # Use default test organization for development/testing
-        organization_id = "dev-org-001"
-        logger.info(f"No x-organization-id header found, using default organization: {organization_id}")
-    else:
-        logger.info(f"Found organization_id in header: {organization_id}")
+    def __init__(self, resource: str, action: str):
+        self.resource = sys.intern(resource)
+        self.action = sys.intern(action)
     
-    return organization_id
+    def __repr__(self) -> str:
+        return f"PermissionChecker({self.resource!r}, {self.action!r})"
+    
+    async def __call__(
+        self,
+        db: Session = Depends(get_db),
+        current_user_id: UUID = Depends(get_current_user_id),
+        organization_id: UUID = Depends(get_current_organization_id)
+    ) -> AsyncIterator[Tuple[UUID, UUID]]:
+        # The permission check queries the database, so it runs in the threadpool;
+        # the auth context is bound here, on the request task, so the reset on
+        # exit happens in the same context as the set
+        await run_in_threadpool(self._authorize, db, current_user_id, organization_id)
+        with auth_context(str(current_user_id), str(organization_id)):
+            yield current_user_id, organization_id
+    
+    def _authorize(self, db: Session, current_user_id: UUID, organization_id: UUID) -> None:
+        """Check the permission for the user in the organization"""
+        try:
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug(
+                    "[AUTH] Checking permissions for user: %s, org: %s, resource: %s, action: %s",
+                    current_user_id, organization_id, self.resource, self.action
+                )
+            
+            # Create authorization service using the shared database session
+            auth_service = AuthorizationService(db)
+            
+            # Authorize the request using the already-validated user_id
+            user_id = auth_service.authorize_request(
+                user_id=str(current_user_id),  # AuthorizationService expects string
+                organization_id=str(organization_id),  # AuthorizationService expects string
+                resource=self.resource,
+                action=self.action
+            )
+            
+            if debug:
+                logger.debug("[AUTH] Authorization successful for user: %s", user_id)
+            
+        except ForbiddenError as e:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=str(e)
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Authorization error: {str(e)}"
+            )
 
 
 class AuthorizationMiddleware:
     """Middleware for handling authorization checks"""
     
     @staticmethod
-    def create_permission_dependency(resource: str, action: str):
+    @lru_cache(maxsize=None)
+    def create_permission_dependency(resource: str, action: str) -> PermissionChecker:
         """
         Create a FastAPI dependency for checking specific permissions
         
@@ -99,65 +196,10 @@ class AuthorizationMiddleware:
             action: Action to perform (e.g., 'create', 'read', 'update', 'delete')
         
         Returns:
-            FastAPI dependency function that returns (user_id, organization_id) where both are UUIDs
+            FastAPI dependency that returns (user_id, organization_id) where both are UUIDs
+            (the same object for the same permission, so FastAPI resolves it once per request)
         """
-        def check_permission(
-            request: Request,
-            db: Session = Depends(get_db),
-            current_user_id: UUID = Depends(get_current_user_id)
-        ) -> Tuple[UUID, UUID]:
-            try:
-                # Get organization_id from x-organization-id header (consistent with frontend)
-                # Using lowercase as it's the HTTP standard and what FastAPI normalizes to
-                organization_id_str = request.headers.get('x-organization-id')
-                
-                if not organization_id_str:
-                    # Use default test organization for development/testing
-                    organization_id_str = "bb5a9afd-336a-445e-99ce-e81b9d444b76"  # Default UUID format
-                    print(f"[AUTH] No x-organization-id header found, using default organization: {organization_id_str}")
-                else:
-                    print(f"[AUTH] Found organization_id in header: {organization_id_str}")
-                
-                # Convert string to UUID
-                try:
-                    organization_id = UUID(organization_id_str)
-                except ValueError:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail=f"Invalid organization ID format: {organization_id_str}"
-                    )
-                
-                # Convert user_id to UUID as well (it's already a UUID from get_current_user_id)
-                user_id_uuid = current_user_id
-                
-                print(f"[AUTH] Checking permissions for user: {user_id_uuid}, org: {organization_id}, resource: {resource}, action: {action}")
-                
-                # Create authorization service using the shared database session
-                auth_service = AuthorizationService(db)
-                
-                # Authorize the request using the already-validated user_id
-                user_id = auth_service.authorize_request(
-                    user_id=str(current_user_id),  # AuthorizationService expects string
-                    organization_id=str(organization_id),  # AuthorizationService expects string
-                    resource=resource,
-                    action=action
-                )
-                
-                print(f"[AUTH] Authorization successful for user: {user_id}")
-                return user_id_uuid, organization_id  # Return both as UUIDs
-                
-            except ForbiddenError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=str(e)
-                )
-            except Exception as e:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Authorization error: {str(e)}"
-                )
-        
-        return check_permission
+        return PermissionChecker(resource, action)
 
 
 # Pre-defined permission dependencies for common operations
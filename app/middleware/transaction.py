@@ -106,12 +106,28 @@ class TransactionManager:
         Raises:
             HTTPException: If any operation fails
         """
+        def run_operations():
+            result = None
+            for operation in operations:
+                result = operation()
+            return result
+        
+        return self.run_atomic(run_operations)
+    
+    def run_atomic(self, operation: Callable, *args, **kwargs) -> Any:
+        """
+        Execute a single operation atomically, passing through its arguments.
+        If the operation fails, all changes are rolled back.
+        
+        Returns:
+            Result of the operation
+            
+        Raises:
+            HTTPException: If the operation fails
+        """
         try:
             with db_transaction(self.db):
-                result = None
-                for operation in operations:
-                    result = operation()
-                return result
+                return operation(*args, **kwargs)
         except ConflictError as e:
             # Re-raise business logic conflicts
             logger.warning(f"Conflict during atomic operation: {str(e)}")
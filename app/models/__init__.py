@@ -4,6 +4,7 @@ Database models for the AI Platform
 from .base import BaseModel
 from .organization import Organization, OrganizationUser, OrganizationRole, OrganizationStatus
 from .ai_agent import AIAgent
+from .agent_job import AgentJob
 from .mcp_tool import MCPTool
 from .llm import LLM
 from .rag_connector import RAGConnector
@@ -12,6 +13,7 @@ from .workflow_component_definition import WorkflowComponentDefinition
 from .security_role import SecurityRole
 from .metrics import Metrics
 from .rest_api import RestAPI
+from .rest_api_import_job import RestAPIImportJob
 from .intent_data import IntentData
 
 __all__ = [
@@ -21,6 +23,7 @@ __all__ = [
     "OrganizationRole",
     "OrganizationStatus",
     "AIAgent",
+    "AgentJob",
     "MCPTool", 
     "LLM",
     "RAGConnector",
@@ -29,5 +32,6 @@ __all__ = [
     "SecurityRole",
     "Metrics",
     "RestAPI",
+    "RestAPIImportJob",
     "IntentData"
 ]
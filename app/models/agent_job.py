@@ -0,0 +1,23 @@
+"""
+AI Agent Job Model
+"""
+from sqlalchemy import Column, String, Text, JSON
+from .base import BaseModel
+from app.core.database_types import UniversalID
+
+
+class AgentJob(BaseModel):
+    """Background execution or training run of an AI agent"""
+    __tablename__ = "agent_jobs"
+    
+    organization_id = Column(UniversalID(), nullable=False, index=True)
+    agent_id = Column(UniversalID(), nullable=False, index=True)
+    kind = Column(String(50), nullable=False)  # execution, training
+    
+    # Progress
+    status = Column(String(50), default="queued", nullable=False)  # queued, running, completed, failed
+    result = Column(JSON, nullable=True)  # What the run produced, once completed
+    error = Column(Text, nullable=True)  # Why the run failed
+    
+    def __repr__(self):
+        return f"<AgentJob(id='{self.id}', kind='{self.kind}', status='{self.status}', agent_id='{self.agent_id}')>"
@@ -1,7 +1,7 @@
 """
 REST API Entity Model
 """
-from sqlalchemy import Column, String, Text, Boolean, JSON
+from sqlalchemy import Column, String, Text, Boolean, JSON, Index
 from .base import BaseModel
 from app.core.database_types import UniversalID
 
@@ -56,5 +56,11 @@ class RestAPI(BaseModel):
     documentation_url = Column(String(500), nullable=True)  # Link to API documentation
     examples = Column(JSON, nullable=True, default={})  # Request/response examples
     
+    # Indexes
+    __table_args__ = (
+        # Every listing is scoped to an organization and ordered by creation time
+        Index("ix_rest_apis_organization_id_created_at", "organization_id", "created_at"),
+    )
+    
     def __repr__(self):
         return f"<RestAPI(id='{self.id}', name='{self.name}', method='{self.method}', base_url='{self.base_url}')>"
@@ -0,0 +1,26 @@
+"""
+REST API Import Job Model
+"""
+from sqlalchemy import Column, String, Text, Integer, JSON
+from .base import BaseModel
+from app.core.database_types import UniversalID
+
+
+class RestAPIImportJob(BaseModel):
+    """Background import of REST APIs from an OpenAPI/Swagger specification"""
+    __tablename__ = "rest_api_import_jobs"
+    
+    organization_id = Column(UniversalID(), nullable=False, index=True)
+    spec_url = Column(String(500), nullable=False)
+    tags = Column(JSON, nullable=True, default=[])  # Tags attached to every imported API
+    
+    # Progress
+    status = Column(String(50), default="pending", nullable=False)  # pending, running, completed, failed
+    total_requested = Column(Integer, default=0, nullable=False)  # Operations found in the spec
+    total_created = Column(Integer, default=0, nullable=False)
+    created = Column(JSON, nullable=True, default=[])  # IDs of the APIs created so far
+    failed = Column(JSON, nullable=True, default=[])  # [{"name": ..., "error": ...}]
+    error = Column(Text, nullable=True)  # Why the whole import failed
+    
+    def __repr__(self):
+        return f"<RestAPIImportJob(id='{self.id}', status='{self.status}', spec_url='{self.spec_url}')>"
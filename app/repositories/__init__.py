@@ -3,6 +3,7 @@ Repository module - Data Access Layer
 """
 from .base import IRepository, BaseRepository
 from .ai_agent_repository import AIAgentRepository
+from .agent_job_repository import AgentJobRepository
 from .mcp_tool_repository import MCPToolRepository
 from .llm_repository import LLMRepository
 from .rag_connector_repository import RAGConnectorRepository
@@ -12,12 +13,14 @@ from .security_role_repository import SecurityRoleRepository
 from .metrics_repository import MetricsRepository
 from .organization_repository import OrganizationRepository
 from .rest_api_repository import RestAPIRepository
+from .rest_api_import_job_repository import RestAPIImportJobRepository
 from .intent_data_repository import IntentDataRepository
 
 __all__ = [
     "IRepository",
     "BaseRepository",
     "AIAgentRepository",
+    "AgentJobRepository",
     "MCPToolRepository",
     "LLMRepository", 
     "RAGConnectorRepository",
@@ -27,5 +30,6 @@ __all__ = [
     "MetricsRepository",
     "OrganizationRepository",
     "RestAPIRepository",
+    "RestAPIImportJobRepository",
     "IntentDataRepository",
 ]
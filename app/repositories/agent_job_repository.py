@@ -0,0 +1,23 @@
+"""
+AI Agent Job Repository implementation
+"""
+from sqlalchemy.orm import Session
+from typing import Optional, Union
+from uuid import UUID
+
+from app.models.agent_job import AgentJob
+from .base import BaseRepository
+
+
+class AgentJobRepository(BaseRepository):
+    """Repository for AI agent execution and training jobs"""
+    
+    def __init__(self, db: Session):
+        super().__init__(db, AgentJob)
+    
+    def get_by_id_in_organization(self, job_id: Union[str, UUID], organization_id: UUID) -> Optional[AgentJob]:
+        """Get an agent job, only if it belongs to the organization"""
+        return self.db.query(AgentJob).filter(
+            AgentJob.id == job_id,
+            AgentJob.organization_id == organization_id
+        ).first()
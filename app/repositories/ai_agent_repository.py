@@ -1,11 +1,12 @@
 """
 AI Agent Repository implementation
 """
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from uuid import UUID
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
-from app.models import AIAgent
+from app.models import AIAgent, Workflow
 from .base import BaseRepository
 
 
@@ -38,6 +39,29 @@ class AIAgentRepository(BaseRepository):
         org_uuid = UUID(organization_id) if isinstance(organization_id, str) else organization_id
         return self.db.query(AIAgent).filter(AIAgent.organization_id == org_uuid).all()
     
+    def get_by_organization_with_default_workflow(
+        self, organization_id: UUID
+    ) -> Tuple[List[Tuple[AIAgent, Optional[UUID]]], int]:
+        """
+        Get all AI agents for an organization in one query, each paired with the ID of its
+        default workflow (or None), together with the total agent count
+        """
+        org_uuid = UUID(organization_id) if isinstance(organization_id, str) else organization_id
+        default_workflow_id = self.db.query(Workflow.id).filter(
+            Workflow.agent_id == AIAgent.id,
+            Workflow.organization_id == org_uuid,
+            Workflow.is_default == True
+        ).order_by(Workflow.execution_order).limit(1).correlate(AIAgent).scalar_subquery()
+        
+        rows = self.db.query(
+            AIAgent,
+            default_workflow_id.label("default_workflow_id"),
+            func.count().over().label("total")
+        ).filter(AIAgent.organization_id == org_uuid).all()
+        
+        total = rows[0].total if rows else 0
+        return [(row.AIAgent, row.default_workflow_id) for row in rows], total
+    
     def get_enabled_agents_by_organization(self, organization_id: UUID) -> List[AIAgent]:
         """Get all enabled AI agents for a specific organization"""
         # Convert organization_id string to UUID for database query
@@ -2,7 +2,7 @@
 Repository interfaces and base implementations following SOLID principles
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any, Type, TypeVar
+from typing import Iterator, List, Optional, Dict, Any, Type, TypeVar
 from uuid import UUID
 from sqlalchemy.orm import Session
 
@@ -13,6 +13,15 @@ import time
 
 T = TypeVar('T', bound=Base)
 
+# IDs per IN (...) clause, well under PostgreSQL's 65535 bind parameter limit
+IN_CLAUSE_CHUNK_SIZE = 10000
+
+
+def chunked(items: List[Any], size: int = IN_CLAUSE_CHUNK_SIZE) -> Iterator[List[Any]]:
+    """Split a list of IDs into slices small enough for one IN (...) clause"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
 # Import transaction context checker
 from app.middleware.transaction import is_in_transaction
 
@@ -1,12 +1,12 @@
 """
 IntentData repository for database operations
 """
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, insert, or_
 
 from app.models.intent_data import IntentData
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, chunked
 
 
 class IntentDataRepository(BaseRepository):
@@ -104,6 +104,41 @@ class IntentDataRepository(BaseRepository):
         )
         return deleted_count
     
+    def delete_by_source_type(self, organization_id: str, source_type: str) -> int:
+        """Delete all intent data of one source type, returns count of deleted records"""
+        return (
+            self.db.query(self.model)
+            .filter(
+                and_(
+                    self.model.organization_id == organization_id,
+                    self.model.source_type == source_type
+                )
+            )
+            .delete(synchronize_session=False)
+        )
+    
+    def delete_by_sources(self, organization_id: str, source_type: str, source_ids: List[str]) -> int:
+        """Delete intent data for several sources of one type, returns count of deleted records"""
+        deleted_count = 0
+        for chunk in chunked(source_ids):
+            deleted_count += (
+                self.db.query(self.model)
+                .filter(
+                    and_(
+                        self.model.organization_id == organization_id,
+                        self.model.source_type == source_type,
+                        self.model.source_id.in_(chunk)
+                    )
+                )
+                .delete(synchronize_session=False)
+            )
+        return deleted_count
+    
+    def insert_many(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert intent data rows in one executemany round trip (left for the caller to commit)"""
+        if rows:
+            self.db.execute(insert(IntentData), rows)
+    
     def bulk_create(self, intent_data_list: List[IntentData]) -> List[IntentData]:
         """Bulk create intent data"""
         self.db.add_all(intent_data_list)
@@ -1,8 +1,9 @@
 """
 MCP Tool Repository implementation
 """
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from app.models import MCPTool
 from .base import BaseRepository
@@ -22,10 +23,64 @@ class MCPToolRepository(BaseRepository):
         """Get MCP tools by transport"""
         return self.filter_by(transport=transport)
     
+    def get_by_id_in_organization(self, tool_id: str, organization_id: str) -> Optional[MCPTool]:
+        """Get an MCP tool by ID, only if it belongs to the organization"""
+        return self.db.query(MCPTool).filter(
+            MCPTool.id == tool_id,
+            MCPTool.organization_id == organization_id
+        ).first()
+    
+    def update_in_organization(self, tool_id: str, organization_id: str, **kwargs) -> Optional[MCPTool]:
+        """Update an MCP tool of the organization; returns None if there is no such tool"""
+        tool = self.get_by_id_in_organization(tool_id, organization_id)
+        if tool is None:
+            return None
+        try:
+            for field, value in kwargs.items():
+                if value is not None:  # Only update non-None values, as BaseRepository.update does
+                    setattr(tool, field, value)
+            self.db.commit()
+            return tool
+        except Exception:
+            self.db.rollback()
+            raise
+    
+    def delete_in_organization(self, tool_id: str, organization_id: str) -> bool:
+        """Delete an MCP tool of the organization with a single scoped DELETE"""
+        try:
+            deleted_count = self.db.query(MCPTool).filter(
+                MCPTool.id == tool_id,
+                MCPTool.organization_id == organization_id
+            ).delete(synchronize_session=False)
+            if deleted_count:
+                self.db.commit()
+            else:
+                self.db.rollback()
+            return deleted_count > 0
+        except Exception:
+            self.db.rollback()
+            raise
+    
     def get_by_organization(self, organization_id: str) -> List[MCPTool]:
         """Get all MCP tools for a specific organization"""
         return self.db.query(MCPTool).filter(MCPTool.organization_id == organization_id).all()
     
+    def get_page_by_organization(
+        self, organization_id: str, limit: int, offset: int = 0
+    ) -> Tuple[List[MCPTool], int]:
+        """Get one page of an organization's MCP tools together with the total count"""
+        rows = self.db.query(MCPTool, func.count().over().label("total"))\
+            .filter(MCPTool.organization_id == organization_id)\
+            .order_by(MCPTool.created_at, MCPTool.id)\
+            .limit(limit).offset(offset).all()
+        if rows:
+            return [row.MCPTool for row in rows], rows[0].total
+        
+        # Past the last page there is no row to carry the window count
+        total = self.db.query(func.count(MCPTool.id))\
+            .filter(MCPTool.organization_id == organization_id).scalar() if offset else 0
+        return [], total
+    
     def get_by_name_and_organization(self, name: str, organization_id: str) -> Optional[MCPTool]:
         """Get MCP tool by name within a specific organization"""
         return self.db.query(MCPTool).filter(
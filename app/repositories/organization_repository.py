@@ -1,7 +1,7 @@
 """
 Organization Repository for data access operations
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from uuid import uuid4, UUID
 from datetime import datetime
 from sqlalchemy.orm import Session, selectinload
@@ -92,6 +92,12 @@ class OrganizationRepository(BaseRepository):
             .options(selectinload(OrganizationUser.organization))\
             .all()
     
+    def iter_organization_users(self, organization_id: UUID, batch_size: int = 500) -> Iterator[OrganizationUser]:
+        """Iterate over an organization's users, fetching them from the database in batches"""
+        return self.db.query(OrganizationUser)\
+            .filter(OrganizationUser.organization_id == organization_id)\
+            .yield_per(batch_size)
+    
     def get_user_role_in_organization(
         self, 
         organization_id: UUID, 
@@ -104,6 +110,18 @@ class OrganizationRepository(BaseRepository):
             .first()
         return result[0] if result else None
     
+    def get_user_roles_in_organization(
+        self, 
+        organization_id: UUID, 
+        user_ids: List[UUID]
+    ) -> Dict[UUID, OrganizationRole]:
+        """Get the roles of several users in an organization with a single query"""
+        rows = self.db.query(OrganizationUser.user_id, OrganizationUser.role)\
+            .filter(OrganizationUser.organization_id == organization_id)\
+            .filter(OrganizationUser.user_id.in_(user_ids))\
+            .all()
+        return {user_id: role for user_id, role in rows}
+    
     def remove_user_from_organization(self, organization_id: UUID, user_id: UUID):
         """Remove a user from an organization"""
         org_user = self.db.query(OrganizationUser)\
@@ -0,0 +1,23 @@
+"""
+REST API Import Job Repository implementation
+"""
+from sqlalchemy.orm import Session
+from typing import Optional, Union
+from uuid import UUID
+
+from app.models.rest_api_import_job import RestAPIImportJob
+from .base import BaseRepository
+
+
+class RestAPIImportJobRepository(BaseRepository):
+    """Repository for OpenAPI import jobs"""
+    
+    def __init__(self, db: Session):
+        super().__init__(db, RestAPIImportJob)
+    
+    def get_by_id_in_organization(self, job_id: Union[str, UUID], organization_id: str) -> Optional[RestAPIImportJob]:
+        """Get an import job, only if it belongs to the organization"""
+        return self.db.query(RestAPIImportJob).filter(
+            RestAPIImportJob.id == job_id,
+            RestAPIImportJob.organization_id == organization_id
+        ).first()
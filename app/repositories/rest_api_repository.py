@@ -1,10 +1,14 @@
 """
 REST API Repository implementation
 """
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import Iterator, List, Optional, Dict, Any, Sequence, Set, Tuple
+from uuid import UUID
+from sqlalchemy import String, cast, delete, func, insert
 from sqlalchemy.orm import Session
+from app.core.database import json_serializer
 from app.models.rest_api import RestAPI
-from .base import BaseRepository
+from .base import BaseRepository, chunked
 
 
 class RestAPIRepository(BaseRepository):
@@ -13,6 +17,58 @@ class RestAPIRepository(BaseRepository):
     def __init__(self, session: Session):
         super().__init__(session, RestAPI)
     
+    @staticmethod
+    def _has_tag(tag: str):
+        """Match rows whose JSON tags array contains tag (portable across PostgreSQL json and SQLite)"""
+        # Encoded as the engine stores it (raw UTF-8, not json.dumps' \uXXXX escapes)
+        return cast(RestAPI.tags, String).contains(json_serializer(tag), autoescape=True)
+    
+    def get_by_id_in_organization(self, api_id: str, organization_id: str) -> Optional[RestAPI]:
+        """Get a REST API by ID, only if it belongs to the organization"""
+        return self.db.query(RestAPI).filter(
+            RestAPI.id == api_id,
+            RestAPI.organization_id == organization_id
+        ).first()
+    
+    def get_version_in_organization(self, api_id: str, organization_id: str) -> Optional[Tuple[UUID, datetime]]:
+        """Get just the ID and last update time of an organization's REST API (primary key lookup, no row body)"""
+        row = self.db.query(RestAPI.id, RestAPI.updated_at).filter(
+            RestAPI.id == api_id,
+            RestAPI.organization_id == organization_id
+        ).first()
+        return (row.id, row.updated_at) if row else None
+    
+    def update_in_organization(self, api_id: str, organization_id: str, **kwargs) -> Optional[RestAPI]:
+        """Update a REST API of the organization; returns None if there is no such API"""
+        api = self.get_by_id_in_organization(api_id, organization_id)
+        if api is None:
+            return None
+        try:
+            for field, value in kwargs.items():
+                if value is not None:  # Only update non-None values, as BaseRepository.update does
+                    setattr(api, field, value)
+            self.db.commit()
+            return api
+        except Exception:
+            self.db.rollback()
+            raise
+    
+    def delete_in_organization(self, api_id: str, organization_id: str) -> bool:
+        """Delete a REST API of the organization with a single scoped DELETE"""
+        try:
+            deleted_count = self.db.query(RestAPI).filter(
+                RestAPI.id == api_id,
+                RestAPI.organization_id == organization_id
+            ).delete(synchronize_session=False)
+            if deleted_count:
+                self.db.commit()
+            else:
+                self.db.rollback()
+            return deleted_count > 0
+        except Exception:
+            self.db.rollback()
+            raise
+    
     def get_by_name_and_organization(self, name: str, organization_id: str) -> Optional[RestAPI]:
         """Get REST API by name within an organization"""
         return self.db.query(RestAPI).filter(
@@ -34,10 +90,58 @@ class RestAPIRepository(BaseRepository):
         
         # Filter by tags (using JSON containment)
         for tag in tags:
-            query = query.filter(RestAPI.tags.contains([tag]))
+            query = query.filter(self._has_tag(tag))
         
         return query.all()
     
+    def _list_criteria(
+        self,
+        organization_id: str,
+        *,
+        tags: Optional[Sequence[str]] = None,
+        method: Optional[str] = None,
+        status: Optional[str] = None,
+        enabled: Optional[bool] = None,
+        search: Optional[str] = None
+    ) -> list:
+        """WHERE criteria for a filtered listing of an organization's REST APIs"""
+        criteria = [RestAPI.organization_id == organization_id]
+        for tag in tags or ():
+            criteria.append(self._has_tag(tag))
+        if method:
+            criteria.append(RestAPI.method == method.upper())
+        if status:
+            criteria.append(RestAPI.status == status)
+        if enabled is not None:
+            criteria.append(RestAPI.enabled == enabled)
+        if search:
+            criteria.append(func.lower(RestAPI.name).contains(search.lower(), autoescape=True))
+        return criteria
+    
+    def iter_page_by_organization(
+        self,
+        organization_id: str,
+        limit: int,
+        offset: int = 0,
+        batch_size: int = 200,
+        **filters
+    ) -> Iterator[Tuple[RestAPI, int]]:
+        """
+        Iterate over one filtered page of an organization's REST APIs, fetching
+        rows from the database in batches. Each row carries the filtered total.
+        """
+        return self.db.query(RestAPI, func.count().over().label("total"))\
+            .filter(*self._list_criteria(organization_id, **filters))\
+            .order_by(RestAPI.created_at, RestAPI.id)\
+            .limit(limit).offset(offset)\
+            .yield_per(batch_size)
+    
+    def count_by_organization(self, organization_id: str, **filters) -> int:
+        """Count an organization's REST APIs matching the filters"""
+        return self.db.query(func.count(RestAPI.id))\
+            .filter(*self._list_criteria(organization_id, **filters))\
+            .scalar()
+    
     def get_by_method(self, organization_id: str, method: str) -> List[RestAPI]:
         """Get REST APIs by HTTP method within an organization"""
         return self.db.query(RestAPI).filter(
@@ -80,3 +184,80 @@ class RestAPIRepository(BaseRepository):
             RestAPI.organization_id == organization_id,
             RestAPI.openapi_spec_url == spec_url
         ).all()
+    
+    def get_by_ids_in_organization(self, organization_id: str, api_ids: List[UUID]) -> List[RestAPI]:
+        """Get the organization's REST APIs with the given IDs"""
+        apis = []
+        for chunk in chunked(api_ids):
+            apis.extend(self.db.query(RestAPI).filter(
+                RestAPI.id.in_(chunk),
+                RestAPI.organization_id == organization_id
+            ).all())
+        return apis
+    
+    def get_names_in_organization(self, organization_id: str, names: List[str]) -> Set[str]:
+        """Return which of names are already used by REST APIs of the organization"""
+        found = set()
+        for chunk in chunked(names):
+            rows = self.db.query(RestAPI.name).filter(
+                RestAPI.name.in_(chunk),
+                RestAPI.organization_id == organization_id
+            ).all()
+            found.update(row.name for row in rows)
+        return found
+    
+    def insert_many(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert REST APIs in one executemany round trip and commit once"""
+        try:
+            self.db.execute(insert(RestAPI), rows)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+    
+    def get_ids_in_organization(self, organization_id: str, api_ids: List[UUID]) -> Set[UUID]:
+        """Return which of api_ids exist within the organization"""
+        found = set()
+        for chunk in chunked(api_ids):
+            rows = self.db.query(RestAPI.id).filter(
+                RestAPI.id.in_(chunk),
+                RestAPI.organization_id == organization_id
+            ).all()
+            found.update(row.id for row in rows)
+        return found
+    
+    def delete_by_ids(self, organization_id: str, api_ids: List[UUID]) -> int:
+        """Delete the organization's REST APIs with the given IDs, returns count of deleted records"""
+        try:
+            deleted_count = 0
+            for chunk in chunked(api_ids):
+                deleted_count += self.db.query(RestAPI).filter(
+                    RestAPI.id.in_(chunk),
+                    RestAPI.organization_id == organization_id
+                ).delete(synchronize_session=False)
+            self.db.commit()
+            return deleted_count
+        except Exception:
+            self.db.rollback()
+            raise
+    
+    def delete_by_organization(self, organization_id: str) -> List[UUID]:
+        """Delete every REST API of an organization, returns the deleted IDs"""
+        try:
+            if self.db.get_bind().dialect.full_returning:
+                result = self.db.execute(
+                    delete(RestAPI)
+                    .where(RestAPI.organization_id == organization_id)
+                    .returning(RestAPI.id)
+                )
+                deleted_ids = [row.id for row in result]
+            else:
+                # No DELETE ... RETURNING on this backend (SQLite in development)
+                query = self.db.query(RestAPI).filter(RestAPI.organization_id == organization_id)
+                deleted_ids = [row.id for row in query.with_entities(RestAPI.id)]
+                query.delete(synchronize_session=False)
+            self.db.commit()
+            return deleted_ids
+        except Exception:
+            self.db.rollback()
+            raise
@@ -1,8 +1,9 @@
 """
 Security Role Repository implementation
 """
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from app.models import SecurityRole
@@ -39,3 +40,15 @@ class SecurityRoleRepository(BaseRepository):
     def get_by_name(self, name: str) -> Optional[SecurityRole]:
         """Get security role by name"""
         return self.get_by_field("name", name)
+    
+    def insert_missing(self, rows: List[Dict[str, Any]]) -> int:
+        """Insert roles in one statement, skipping names that already exist; returns count inserted"""
+        dialect = postgresql if self.db.get_bind().dialect.name == "postgresql" else sqlite
+        statement = dialect.insert(self.model).on_conflict_do_nothing(index_elements=["name"])
+        try:
+            inserted = self.db.execute(statement, rows).rowcount
+            self.db.commit()
+            return inserted
+        except Exception:
+            self.db.rollback()
+            raise
@@ -1,7 +1,7 @@
 """
 Workflow Component Definition Repository
 """
-from typing import List, Optional, Dict, Any, TYPE_CHECKING
+from typing import List, Optional, Dict, Any, Sequence, TYPE_CHECKING
 from uuid import UUID
 from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
@@ -95,7 +95,7 @@ class WorkflowComponentDefinitionRepository(BaseRepositoryType):
         
         self.db.commit()
     
-    def get_by_tags(self, tags: List[str]) -> List[WorkflowComponentDefinition]:
+    def get_by_tags(self, tags: Sequence[str]) -> List[WorkflowComponentDefinition]:
         """Get component definitions that have any of the specified tags"""
         # Since tags is stored as JSON, we need to check if any of the provided tags exist
         results = []
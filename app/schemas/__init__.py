@@ -14,7 +14,7 @@ from .organization import (
 
 # Model schemas  
 from .ai_agent import (
-    AIAgentBase, AIAgentCreate, AIAgentUpdate, AIAgent
+    AIAgentBase, AIAgentCreate, AIAgentUpdate, AIAgent, AgentJobResponse
 )
 from .mcp_tool import (
     MCPToolBase, MCPToolCreate, MCPToolUpdate, MCPTool
@@ -36,9 +36,9 @@ from .metrics import (
 )
 from .rest_api import (
     RestAPICreateRequest, RestAPIUpdateRequest, RestAPIResponse,
-    RestAPIBulkCreateRequest, RestAPIBulkDeleteRequest,
+    RestAPIBulkCreateRequest, RestAPIBulkGetRequest, RestAPIBulkDeleteRequest,
     RestAPIFromOpenAPIRequest, RestAPIListResponse,
-    RestAPIBulkCreateResponse, RestAPIBulkDeleteResponse,
+    RestAPIBulkCreateResponse, RestAPIBulkDeleteResponse, RestAPIImportJobResponse,
     RestAPIQueryParams, HTTPMethod, RestAPIStatus
 )
 from .workflow_component_definition import (
@@ -72,6 +72,7 @@ __all__ = [
     "AIAgentCreate", 
     "AIAgentUpdate",
     "AIAgent",
+    "AgentJobResponse",
     
     # MCP Tool
     "MCPToolBase",
@@ -114,11 +115,13 @@ __all__ = [
     "RestAPIUpdateRequest",
     "RestAPIResponse",
     "RestAPIBulkCreateRequest",
+    "RestAPIBulkGetRequest",
     "RestAPIBulkDeleteRequest", 
     "RestAPIFromOpenAPIRequest",
     "RestAPIListResponse",
     "RestAPIBulkCreateResponse",
     "RestAPIBulkDeleteResponse",
+    "RestAPIImportJobResponse",
     "RestAPIQueryParams",
     "HTTPMethod",
     "RestAPIStatus",
@@ -2,7 +2,7 @@
 AI Agent schemas with organization support
 """
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Any, Optional
 from datetime import datetime
 
 
@@ -36,3 +36,16 @@ class AIAgent(AIAgentBase):
 
     class Config:
         from_attributes = True
+
+
+class AgentJobResponse(BaseModel):
+    """Schema for an AI agent execution or training job"""
+    id: str = Field(..., description="Job ID")
+    organization_id: str = Field(..., description="Organization ID")
+    agent_id: str = Field(..., description="AI agent ID")
+    kind: str = Field(..., description="Job kind: execution or training")
+    status: str = Field(..., description="Job status: queued, running, completed or failed")
+    result: Optional[Any] = Field(None, description="What the run produced, once completed")
+    error: Optional[str] = Field(None, description="Why the run failed")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
@@ -143,6 +143,11 @@ class RestAPIUpdateRequest(BaseModel):
     examples: Optional[Dict[str, Any]] = Field(None, description="Request/response examples")
 
 
+class RestAPIBulkGetRequest(BaseModel):
+    """Schema for fetching multiple REST APIs by ID"""
+    api_ids: List[str] = Field(..., min_items=1, max_items=1000, description="List of API IDs to fetch")
+
+
 class RestAPIBulkDeleteRequest(BaseModel):
     """Schema for deleting multiple REST APIs"""
     api_ids: List[str] = Field(..., min_items=1, description="List of API IDs to delete")
@@ -224,6 +229,22 @@ class RestAPIBulkDeleteResponse(BaseModel):
     total_deleted: int = Field(..., description="Total number of APIs successfully deleted")
 
 
+class RestAPIImportJobResponse(BaseModel):
+    """Schema for an OpenAPI import job"""
+    id: str = Field(..., description="Import job ID")
+    organization_id: str = Field(..., description="Organization ID")
+    spec_url: str = Field(..., description="URL of the imported OpenAPI/Swagger specification")
+    tags: List[str] = Field(default_factory=list, description="Tags attached to every imported API")
+    status: str = Field(..., description="Job status: pending, running, completed or failed")
+    total_requested: int = Field(..., description="Number of operations found in the specification")
+    total_created: int = Field(..., description="Number of APIs created so far")
+    created: List[str] = Field(default_factory=list, description="IDs of the APIs created so far")
+    failed: List[Dict[str, str]] = Field(default_factory=list, description="Failed API creations with errors")
+    error: Optional[str] = Field(None, description="Why the import as a whole failed")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+
+
 # Query Parameter Schemas
 class RestAPIQueryParams(BaseModel):
     """Query parameters for REST API listing"""
@@ -11,6 +11,7 @@ from .workflow_component_definition_service import WorkflowComponentDefinitionSe
 from .security_service import SecurityService
 from .organization_service import OrganizationService
 from .rest_api_service import RestAPIService
+from .intent_data_service import IntentDataService
 
 __all__ = [
     "IService",
@@ -24,4 +25,5 @@ __all__ = [
     "SecurityService",
     "OrganizationService",
     "RestAPIService",
+    "IntentDataService",
 ]
@@ -3,8 +3,9 @@ AI Agent Service implementation
 """
 import uuid
 from uuid import UUID
-from typing import List, Optional, Dict, Any
-from app.repositories import AIAgentRepository
+from typing import Callable, List, Optional, Dict, Any, Tuple
+from app.repositories import AIAgentRepository, AgentJobRepository
+from app.core.database import db_manager
 from app.core.exceptions import NotFoundError, ConflictError
 from .base import BaseService
 
@@ -12,8 +13,9 @@ from .base import BaseService
 class AIAgentService(BaseService):
     """Service for AI Agent business logic"""
     
-    def __init__(self, repository: AIAgentRepository):
+    def __init__(self, repository: AIAgentRepository, job_repository: Optional[AgentJobRepository] = None):
         super().__init__(repository)
+        self.job_repository = job_repository
     
     def create_agent(self, name: str, organization_id: UUID, description: str = None, 
                     enabled: bool = True, preview_enabled: bool = False) -> Dict[str, Any]:
@@ -69,30 +71,17 @@ class AIAgentService(BaseService):
         agents = self.repository.get_by_organization(organization_id)
         return [self._to_dict(agent) for agent in agents]
     
-    def list_agents(self, organization_id: UUID, workflow_service=None) -> List[Dict[str, Any]]:
-        """Get all AI agents for organization with their default workflow IDs"""
-        agents = self.repository.get_by_organization(organization_id)
+    def list_agents(self, organization_id: UUID) -> Tuple[List[Dict[str, Any]], int]:
+        """Get all AI agents for organization with their default workflow IDs, plus the total count"""
+        rows, total = self.repository.get_by_organization_with_default_workflow(organization_id)
         result = []
         
-        for agent in agents:
+        for agent, default_workflow_id in rows:
             agent_dict = self._to_dict(agent)
-            
-            # Add workflow_id if workflow_service is provided
-            if workflow_service:
-                try:
-                    default_workflow = workflow_service.get_default_workflow_for_agent(
-                        str(agent.id), organization_id
-                    )
-                    agent_dict['workflow_id'] = default_workflow['id'] if default_workflow else None
-                except Exception as e:
-                    self.logger.warning(f"Failed to get default workflow for agent {agent.id}: {e}")
-                    agent_dict['workflow_id'] = None
-            else:
-                agent_dict['workflow_id'] = None
-            
+            agent_dict['workflow_id'] = str(default_workflow_id) if default_workflow_id else None
             result.append(agent_dict)
         
-        return result
+        return result, total
     
     def update_agent(self, agent_id: UUID, organization_id: UUID, **kwargs) -> Optional[Dict[str, Any]]:
         """Update AI agent within organization (automatically detects transaction context)"""
@@ -231,8 +220,8 @@ class AIAgentService(BaseService):
         # Get all workflows for this agent
         return workflow_service.get_workflows_for_agent(agent_id, organization_id)
 
-    def execute_agent(self, agent_id: UUID, organization_id: UUID, request_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute an AI agent within organization"""
+    def _queue_job(self, kind: str, agent_id: UUID, organization_id: UUID) -> Dict[str, Any]:
+        """Record a queued job for an AI agent within organization; the run itself happens in the background"""
         # First verify the agent exists and belongs to the organization
         agent = self.repository.get_by_id(agent_id)
         if not agent:
@@ -240,30 +229,52 @@ class AIAgentService(BaseService):
         if agent.organization_id != organization_id:
             raise NotFoundError("AI Agent", agent_id)
         
+        job = self.job_repository.create(
+            organization_id=organization_id,
+            agent_id=agent_id,
+            kind=kind,
+            status="queued"
+        )
+        self.logger.info(f"Queued {kind} {job.id} of AI agent: {agent_id} in organization: {organization_id}")
+        return self._to_dict(job)
+    
+    def queue_execution(self, agent_id: UUID, organization_id: UUID) -> Dict[str, Any]:
+        """Accept an execution request for an AI agent within organization and return its job"""
+        return self._queue_job("execution", agent_id, organization_id)
+    
+    def queue_training(self, agent_id: UUID, organization_id: UUID) -> Dict[str, Any]:
+        """Accept a training request for an AI agent within organization and return its job"""
+        return self._queue_job("training", agent_id, organization_id)
+    
+    def get_job(self, agent_id: UUID, job_id: UUID, organization_id: UUID) -> Dict[str, Any]:
+        """Get an execution or training job of an AI agent within organization"""
+        job = self.job_repository.get_by_id_in_organization(job_id, organization_id)
+        if not job or job.agent_id != agent_id:
+            raise NotFoundError("Agent job", job_id)
+        return self._to_dict(job)
+    
+    def run_job(self, job_id: UUID, work: Callable[[], Any]) -> None:
+        """Run a queued job's work, recording its result or failure on the job"""
+        self.job_repository.update(job_id, status="running")
+        try:
+            result = work()
+        except Exception as e:
+            self.logger.error(f"Agent job {job_id} failed: {e}")
+            self.job_repository.update(job_id, status="failed", error=str(e))
+            return
+        self.job_repository.update(job_id, status="completed", result=result)
+    
+    def execute_agent(self, agent_id: UUID, organization_id: UUID, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute an AI agent within organization"""
         # Placeholder implementation
         self.logger.info(f"Executing AI agent: {agent_id} in organization: {organization_id}")
-        return {
-            "execution_id": f"exec_{agent_id}",
-            "status": "completed",
-            "result": "Agent execution placeholder"
-        }
+        return {"result": "Agent execution placeholder"}
     
     def start_training(self, agent_id: UUID, organization_id: UUID, training_data: Dict[str, Any]) -> Dict[str, Any]:
         """Start training for an AI agent within organization"""
-        # First verify the agent exists and belongs to the organization
-        agent = self.repository.get_by_id(agent_id)
-        if not agent:
-            raise NotFoundError("AI Agent", agent_id)
-        if agent.organization_id != organization_id:
-            raise NotFoundError("AI Agent", agent_id)
-        
         # Placeholder implementation
         self.logger.info(f"Starting training for AI agent: {agent_id} in organization: {organization_id}")
-        return {
-            "training_id": f"train_{agent_id}",
-            "status": "started",
-            "estimated_duration": "2 hours"
-        }
+        return {"estimated_duration": "2 hours"}
     
     def create_agent_with_default_workflow(self, agent_data: Dict[str, Any], 
                                          organization_id: UUID, 
@@ -410,3 +421,16 @@ class AIAgentService(BaseService):
             is_default=True,  # Mark as default workflow
             execution_order=0  # Highest priority
         )
+
+
+def run_agent_job(job: Dict[str, Any], request_data: Dict[str, Any]) -> None:
+    """
+    Background task for an execution or training job
+    Runs after the response has been sent, so it opens its own session
+    instead of relying on the request's
+    """
+    with db_manager.get_session() as db:
+        service = AIAgentService(AIAgentRepository(db), AgentJobRepository(db))
+        agent_id, organization_id = UUID(job["agent_id"]), UUID(job["organization_id"])
+        run = service.execute_agent if job["kind"] == "execution" else service.start_training
+        service.run_job(UUID(job["id"]), lambda: run(agent_id, organization_id, request_data))
@@ -7,9 +7,76 @@ from sqlalchemy.orm import Session
 from app.repositories import OrganizationRepository, SecurityRoleRepository
 from app.core.exceptions import UnauthorizedError, ForbiddenError
 from app.core.database import SessionLocal
+from app.core.cache import TTLCache
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Authorization decisions keyed by (user_id, organization_id, resource, action).
+# A cached value is True for an allowed request, or the denial message otherwise.
+# Only decisions reached without an error are cached, and invalidation only
+# reaches this process, so the TTL is kept to a few seconds.
+permission_cache = TTLCache(
+    "permissions",
+    maxsize=settings.permission_cache_size,
+    ttl=settings.permission_cache_ttl_seconds
+)
+
+
+def invalidate_permission_cache(organization_id: Optional[Any] = None) -> None:
+    """
+    Drop cached authorization decisions
+    
+    Membership changes only affect one organization, so pass its ID to keep the
+    other organizations' decisions warm. Without an ID (e.g. after a role
+    change) everything is dropped.
+    """
+    if organization_id is None:
+        permission_cache.clear()
+        role_permission_masks.clear()
+        return
+    
+    organization_id = str(organization_id)
+    permission_cache.discard_where(lambda key: key[1] == organization_id)
+
+
+# One bit per action, so a role's permissions on a resource fit in one int
+# and a permission check is a single bitwise AND
+ACTION_BITS = {
+    "create": 1,
+    "read": 2,
+    "update": 4,
+    "delete": 8,
+    "execute": 16,
+    "configure": 32,
+    "deploy": 64,
+}
+
+# Role name -> {resource: action bitmask}, compiled from the stored role permissions
+role_permission_masks = TTLCache(
+    "role_permission_masks",
+    maxsize=settings.permission_cache_size,
+    ttl=settings.permission_cache_ttl_seconds
+)
+
+
+def permission_masks(permissions: Any) -> Dict[str, int]:
+    """Compile stored role permissions ({resource: [action, ...]}) into {resource: bitmask}"""
+    if not isinstance(permissions, dict):
+        return {}
+    masks = {}
+    for resource, actions in permissions.items():
+        mask = 0
+        for action in actions or ():
+            mask |= ACTION_BITS.get(action, 0)
+        masks[resource] = mask
+    return masks
+
+
+def permission_actions(mask: int) -> List[str]:
+    """Expand an action bitmask back into action names"""
+    return [action for action, bit in ACTION_BITS.items() if mask & bit]
+
 
 class AuthorizationService:
     """Service for handling authorization and permission checks"""
@@ -36,7 +103,7 @@ class AuthorizationService:
                     self.db.rollback()
                 self.db.close()
             except Exception as e:
-                print(f"Error closing database session: {e}")
+                logger.error(f"Error closing database session: {e}")
     
     def close(self):
         """Manually close the database session if needed"""
@@ -44,12 +111,17 @@ class AuthorizationService:
             try:
                 self.db.close()
             except Exception as e:
-                print(f"Error closing database session: {e}")
+                logger.error(f"Error closing database session: {e}")
     
     # Removed validate_token_and_get_user method - token validation is now handled by the API dependency layer
     
     def get_user_role_in_organization(self, user_id: str, organization_id: str) -> Optional[str]:
-        """Get user's role in the specified organization"""
+        """
+        Get user's role in the specified organization
+        
+        Returns None for a malformed ID or a non-member. Database errors are
+        raised, so a failed lookup is never mistaken (and cached) as a denial.
+        """
         logger.debug(f" Looking up role for user '{user_id}' in organization '{organization_id}'")
         
         try:
@@ -68,48 +140,47 @@ class AuthorizationService:
         except ValueError as e:
             logger.error(f" Invalid UUID format: {e}")
             return None
-        except Exception as e:
-            logger.error(f" Error looking up user role: {e}")
-            logger.exception("Full traceback:")
-            return None
     
     def get_role_permissions(self, role_name: str) -> Dict[str, List[str]]:
         """Get permissions for a role"""
         logger.debug(f" Looking up permissions for role '{role_name}'")
         
-        try:
-            # First try exact match
-            role = self.role_repo.get_by_name(role_name)
-            
-            # If no exact match, try case-insensitive search
-            if not role:
-                logger.debug(f" Exact match not found for '{role_name}', trying case-insensitive search...")
-                # Try with capitalized first letter (e.g., "owner" -> "Owner")
-                capitalized_name = role_name.capitalize()
-                role = self.role_repo.get_by_name(capitalized_name)
-                
-                if role:
-                    logger.debug(f" Found role with capitalized name: '{capitalized_name}'")
-                else:
-                    # Try uppercase (e.g., "owner" -> "OWNER")
-                    upper_name = role_name.upper()
-                    role = self.role_repo.get_by_name(upper_name)
-                    if role:
-                        logger.debug(f" Found role with uppercase name: '{upper_name}'")
+        # Database errors are raised rather than returned as "no permissions",
+        # which would be cached as a denial. First try exact match
+        role = self.role_repo.get_by_name(role_name)
+        
+        # If no exact match, try case-insensitive search
+        if not role:
+            logger.debug(f" Exact match not found for '{role_name}', trying case-insensitive search...")
+            # Try with capitalized first letter (e.g., "owner" -> "Owner")
+            capitalized_name = role_name.capitalize()
+            role = self.role_repo.get_by_name(capitalized_name)
             
             if role:
-                permissions = role.permissions
-                logger.debug(f" Found permissions for role '{role_name}': {permissions}")
-                return permissions
+                logger.debug(f" Found role with capitalized name: '{capitalized_name}'")
             else:
-                logger.warning(f" Role '{role_name}' not found in database (tried: '{role_name}', '{role_name.capitalize()}', '{role_name.upper()}')")
-                return {}
-                
-        except Exception as e:
-            logger.error(f" Error looking up role permissions for '{role_name}': {e}")
-            logger.exception("Full traceback:")
+                # Try uppercase (e.g., "owner" -> "OWNER")
+                upper_name = role_name.upper()
+                role = self.role_repo.get_by_name(upper_name)
+                if role:
+                    logger.debug(f" Found role with uppercase name: '{upper_name}'")
+        
+        if role:
+            permissions = role.permissions
+            logger.debug(f" Found permissions for role '{role_name}': {permissions}")
+            return permissions
+        else:
+            logger.warning(f" Role '{role_name}' not found in database (tried: '{role_name}', '{role_name.capitalize()}', '{role_name.upper()}')")
             return {}
     
+    def get_role_permission_masks(self, role_name: str) -> Dict[str, int]:
+        """Get a role's permissions as {resource: action bitmask}, compiled once per role"""
+        masks = role_permission_masks.get(role_name)
+        if masks is None:
+            masks = permission_masks(self.get_role_permissions(role_name))
+            role_permission_masks.set(role_name, masks)
+        return masks
+    
     def check_permission(self, user_id: str, organization_id: str, 
                         resource: str, action: str) -> bool:
         """
@@ -135,18 +206,18 @@ class AuthorizationService:
             return False
         
         # Get permissions for the role
-        permissions = self.get_role_permissions(role_name)
-        logger.debug(f" Role '{role_name}' permissions: {permissions}")
+        masks = self.get_role_permission_masks(role_name)
+        logger.debug(f" Role '{role_name}' permission masks: {masks}")
         
-        if not permissions:
+        if not masks:
             logger.warning(f" Role '{role_name}' has no permissions defined")
             return False
         
         # Check if role has permission for the resource and action
-        resource_permissions = permissions.get(resource, [])
-        logger.debug(f" Permissions for resource '{resource}': {resource_permissions}")
+        resource_mask = masks.get(resource, 0)
+        logger.debug(f" Permissions for resource '{resource}': {permission_actions(resource_mask)}")
         
-        has_permission = action in resource_permissions
+        has_permission = bool(resource_mask & ACTION_BITS.get(action, 0))
         logger.info(f"{'success' if has_permission else 'failed'} Permission check result: user='{user_id}', role='{role_name}', resource='{resource}', action='{action}' -> {has_permission}")
         
         return has_permission
@@ -168,43 +239,44 @@ class AuthorizationService:
         Raises:
             ForbiddenError: If user doesn't have permission
         """
+        cache_key = (user_id, organization_id, resource, action)
+        decision = permission_cache.get(cache_key)
+        if decision is True:
+            return user_id
+        if decision is not None:
+            raise ForbiddenError(decision)
+        
         logger.info(f"Starting authorization check for user='{user_id}', organization='{organization_id}', resource='{resource}', action='{action}'")
         
         # Check permissions - user is already authenticated by the API dependency layer
         logger.debug(" Checking user permissions...")
-        try:
-            has_permission = self.check_permission(user_id, organization_id, resource, action)
+        # Only decisions are cached; database errors propagate uncached
+        has_permission = self.check_permission(user_id, organization_id, resource, action)
+        
+        if not has_permission:
+            logger.warning(f" Permission denied for user '{user_id}'")
+            
+            # Get more detailed information for error message
+            user_role = self.get_user_role_in_organization(user_id, organization_id)
+            logger.debug(f" User role for error context: {user_role}")
             
-            if not has_permission:
-                logger.warning(f" Permission denied for user '{user_id}'")
+            if not user_role:
+                error_msg = f"User is not a member of organization {organization_id}"
+                logger.error(f" Authorization failed: {error_msg}")
+                permission_cache.set(cache_key, error_msg)
+                raise ForbiddenError(error_msg)
+            else:
+                # Get role permissions for debugging
+                masks = self.get_role_permission_masks(user_role)
                 
-                # Get more detailed information for error message
-                user_role = self.get_user_role_in_organization(user_id, organization_id)
-                logger.debug(f" User role for error context: {user_role}")
+                error_msg = f"User with role '{user_role}' does not have '{action}' permission for '{resource}'"
+                logger.error(f" Authorization failed: {error_msg}")
+                logger.debug(f" Available permissions for resource '{resource}': {permission_actions(masks.get(resource, 0))}")
                 
-                if not user_role:
-                    error_msg = f"User is not a member of organization {organization_id}"
-                    logger.error(f" Authorization failed: {error_msg}")
-                    raise ForbiddenError(error_msg)
-                else:
-                    # Get role permissions for debugging
-                    role_permissions = self.get_role_permissions(user_role)
-                    resource_permissions = role_permissions.get(resource, [])
-                    
-                    error_msg = f"User with role '{user_role}' does not have '{action}' permission for '{resource}'"
-                    logger.error(f" Authorization failed: {error_msg}")
-                    logger.debug(f" Available permissions for resource '{resource}': {resource_permissions}")
-                    logger.debug(f" All role permissions: {role_permissions}")
-                    
-                    raise ForbiddenError(error_msg)
-            
-            logger.info(f" Authorization successful for user '{user_id}' on resource '{resource}' with action '{action}'")
-            return user_id
-            
-        except ForbiddenError:
-            # Re-raise authorization errors
-            raise
-        except Exception as e:
-            logger.error(f" Unexpected error during permission check: {e}")
-            logger.exception("Full traceback:")
-            raise ForbiddenError(f"Authorization check failed due to system error: {str(e)}")
+                permission_cache.set(cache_key, error_msg)
+                raise ForbiddenError(error_msg)
+        
+        logger.info(f" Authorization successful for user '{user_id}' on resource '{resource}' with action '{action}'")
+        permission_cache.set(cache_key, True)
+        return user_id
+
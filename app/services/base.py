@@ -20,9 +20,15 @@ class BaseService:
     Following Single Responsibility Principle
     """
     
+    logger = get_logger("BaseService")
+    
+    def __init_subclass__(cls, **kwargs):
+        """Resolve each service's logger once per class rather than per request"""
+        super().__init_subclass__(**kwargs)
+        cls.logger = get_logger(cls.__name__)
+    
     def __init__(self, repository):
         self.repository = repository
-        self.logger = get_logger(self.__class__.__name__)
     
     def _validate_data(self, data: Dict[str, Any], required_fields: List[str]) -> None:
         """Validate required fields in data"""
@@ -7,9 +7,24 @@ from app.models.intent_data import IntentData
 from app.core.exceptions import NotFoundError
 from app.services.base import BaseService
 from app.core.logging import get_logger
+from app.core.cache import TTLCache
+from app.core.config import settings
 
 logger = get_logger(__name__)
 
+# Intent data listings keyed by (organization_id, enabled_only, source_type, category, search)
+intent_data_list_cache = TTLCache(
+    "intent_data_lists",
+    maxsize=settings.list_cache_size,
+    ttl=settings.list_cache_ttl_seconds
+)
+
+
+def invalidate_intent_data_cache(organization_id: Any) -> None:
+    """Drop an organization's cached intent data listings after a write"""
+    organization_id = str(organization_id)
+    intent_data_list_cache.discard_where(lambda key: key[0] == organization_id)
+
 
 class IntentDataService(BaseService):
     """Service for IntentData business logic"""
@@ -31,6 +46,7 @@ class IntentDataService(BaseService):
         )
         
         created_intent_data = self.repository.create(intent_data)
+        invalidate_intent_data_cache(organization_id)
         return self._to_dict(created_intent_data)
     
     def update_intent_data(self, intent_data_id: str, organization_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -52,6 +68,7 @@ class IntentDataService(BaseService):
             intent_data.enabled = data["enabled"]
         
         updated_intent_data = self.repository.update(intent_data)
+        invalidate_intent_data_cache(organization_id)
         return self._to_dict(updated_intent_data)
     
     def get_intent_data(self, intent_data_id: str, organization_id: str) -> Dict[str, Any]:
@@ -61,6 +78,27 @@ class IntentDataService(BaseService):
             raise NotFoundError(f"IntentData with ID '{intent_data_id}' not found")
         return self._to_dict(intent_data)
     
+    def query_intent_data(self, organization_id: str, enabled_only: bool = False,
+                          source_type: Optional[str] = None, category: Optional[str] = None,
+                          search: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List intent data using the first given filter (search, source type, category), cached per organization"""
+        cache_key = (organization_id, enabled_only, source_type, category, search)
+        intent_data_list = intent_data_list_cache.get(cache_key)
+        if intent_data_list is not None:
+            return intent_data_list
+        
+        if search:
+            intent_data_list = self.search_intent_data(organization_id, search)
+        elif source_type:
+            intent_data_list = self.list_by_source_type(organization_id, source_type)
+        elif category:
+            intent_data_list = self.get_by_category(organization_id, category)
+        else:
+            intent_data_list = self.list_intent_data(organization_id, enabled_only)
+        
+        intent_data_list_cache.set(cache_key, intent_data_list)
+        return intent_data_list
+    
     def list_intent_data(self, organization_id: str, enabled_only: bool = False) -> List[Dict[str, Any]]:
         """List all intent data for an organization"""
         if enabled_only:
@@ -90,7 +128,9 @@ class IntentDataService(BaseService):
         if not intent_data:
             raise NotFoundError(f"IntentData with ID '{intent_data_id}' not found")
         
-        return self.repository.delete(intent_data_id)
+        deleted = self.repository.delete(intent_data_id)
+        invalidate_intent_data_cache(organization_id)
+        return deleted
     
     def create_from_rest_api(self, organization_id: str, rest_api_id: str, name: str, description: str = None, category: str = None) -> Dict[str, Any]:
         """Create intent data from a REST API"""
@@ -120,7 +160,8 @@ class IntentDataService(BaseService):
         """Sync intent data from a source (REST API or MCP tool)"""
         # Delete existing intent data for this source
         deleted_count = self.repository.delete_by_source(organization_id, source_type, source_id)
-        logger.info(f"Deleted {deleted_count} existing intent data records for {source_type}:{source_id}")
+        invalidate_intent_data_cache(organization_id)
+        logger.info("Deleted %s existing intent data records for %s:%s", deleted_count, source_type, source_id)
         
         # Create new intent data records
         created_intents = []
@@ -140,7 +181,7 @@ class IntentDataService(BaseService):
                 created_intent = self.create_intent_data(organization_id, data)
                 created_intents.append(created_intent)
             except Exception as e:
-                logger.error(f"Failed to create intent data for {intent.get('name', 'unknown')}: {e}")
+                logger.error("Failed to create intent data for %s: %s", intent.get('name', 'unknown'), e)
                 failed_intents.append({
                     "name": intent.get("name", "unknown"),
                     "error": str(e)
@@ -164,7 +205,7 @@ class IntentDataService(BaseService):
                 created_intent = self.create_intent_data(organization_id, data)
                 created_intents.append(created_intent)
             except Exception as e:
-                logger.error(f"Failed to create intent data for {data.get('name', 'unknown')}: {e}")
+                logger.error("Failed to create intent data for %s: %s", data.get('name', 'unknown'), e)
                 failed_intents.append({
                     "name": data.get("name", "unknown"),
                     "error": str(e)
@@ -1,11 +1,42 @@
 """
 MCP Tool Service implementation
 """
-from typing import List, Optional, Dict, Any
+import json
+import time
+from typing import List, Optional, Dict, Any, Tuple
+from uuid import uuid4
+import httpx
+from starlette.concurrency import run_in_threadpool
 from app.repositories import MCPToolRepository
 from app.repositories.intent_data_repository import IntentDataRepository
-from app.core.exceptions import NotFoundError, ConflictError
+from app.core.exceptions import NotFoundError, ConflictError, ExternalServiceError
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.http_client import outbound_http
+from app.core.etag import content_etag
 from .base import BaseService
+from .intent_data_service import invalidate_intent_data_cache
+
+# Tool listings keyed by (organization_id,) for the full list or (organization_id, limit, offset)
+# for a page, dropped whenever one of the organization's tools changes
+tool_list_cache = TTLCache(
+    "mcp_tool_lists",
+    maxsize=settings.list_cache_size,
+    ttl=settings.list_cache_ttl_seconds
+)
+
+
+# Tool server schemas keyed by (organization_id, tool_id), stored together with their ETag
+tool_schema_cache = TTLCache(
+    "mcp_tool_schemas",
+    maxsize=settings.list_cache_size,
+    ttl=settings.list_cache_ttl_seconds
+)
+
+
+def _invalidate_tool_lists(organization_id: Any) -> None:
+    organization_id = str(organization_id)
+    tool_list_cache.discard_where(lambda key: key[0] == organization_id)
 
 
 class MCPToolService(BaseService):
@@ -28,9 +59,10 @@ class MCPToolService(BaseService):
                     category="Tool",
                     enabled=True
                 )
-                self.logger.info(f"Created intent data for MCP tool: {tool_name}")
+                self.logger.info("Created intent data for MCP tool: %s", tool_name)
             except Exception as e:
-                self.logger.error(f"Failed to create intent data for MCP tool {tool_name}: {e}")
+                self.logger.error("Failed to create intent data for MCP tool %s: %s", tool_name, e)
+            invalidate_intent_data_cache(organization_id)
     
     def _update_intent_data_for_tool(self, organization_id: str, tool_id: str, tool_name: str, tool_description: str = None):
         """Helper method to update intent data for MCP tool"""
@@ -43,10 +75,11 @@ class MCPToolService(BaseService):
                         intent_data.name = f"Tool: {tool_name}"
                         intent_data.description = tool_description or f"Intent data for MCP tool: {tool_name}"
                         self.intent_data_repository.update(intent_data)
-                        self.logger.info(f"Updated intent data for MCP tool: {tool_name}")
+                        self.logger.info("Updated intent data for MCP tool: %s", tool_name)
                         break
             except Exception as e:
-                self.logger.error(f"Failed to update intent data for MCP tool {tool_name}: {e}")
+                self.logger.error("Failed to update intent data for MCP tool %s: %s", tool_name, e)
+            invalidate_intent_data_cache(organization_id)
     
     def _delete_intent_data_for_tool(self, organization_id: str, tool_id: str):
         """Helper method to delete intent data for MCP tool"""
@@ -54,9 +87,10 @@ class MCPToolService(BaseService):
             try:
                 deleted_count = self.intent_data_repository.delete_by_source(organization_id, "mcp_tool", tool_id)
                 if deleted_count > 0:
-                    self.logger.info(f"Deleted {deleted_count} intent data records for MCP tool: {tool_id}")
+                    self.logger.info("Deleted %s intent data records for MCP tool: %s", deleted_count, tool_id)
             except Exception as e:
-                self.logger.error(f"Failed to delete intent data for MCP tool {tool_id}: {e}")
+                self.logger.error("Failed to delete intent data for MCP tool %s: %s", tool_id, e)
+            invalidate_intent_data_cache(organization_id)
     
     def create_tool(self, organization_id: str, name: str, description: str = None, enabled: bool = True,
                    endpoint_url: str = None, transport: str = "Streamable HTTP", 
@@ -71,7 +105,7 @@ class MCPToolService(BaseService):
         if existing_tool:
             raise ConflictError(f"MCP Tool with name '{name}' already exists in this organization")
         
-        self.logger.info(f"Creating MCP tool: {name} for organization: {organization_id}")
+        self.logger.info("Creating MCP tool: %s for organization: %s", name, organization_id)
         
         tool = self.repository.create(
             name=name,
@@ -84,14 +118,16 @@ class MCPToolService(BaseService):
             auth_headers=auth_headers or {}
         )
         
+        _invalidate_tool_lists(organization_id)
+        
         # Create intent data for the new MCP tool
         self._create_intent_data_for_tool(organization_id, str(tool.id), name, description)
         
         return self._to_dict(tool)
     
-    def get_tool(self, tool_id: str) -> Optional[Dict[str, Any]]:
-        """Get MCP tool by ID"""
-        tool = self.repository.get_by_id(tool_id)
+    def get_tool(self, tool_id: str, organization_id: str) -> Optional[Dict[str, Any]]:
+        """Get MCP tool by ID within organization"""
+        tool = self.repository.get_by_id_in_organization(tool_id, organization_id)
         if not tool:
             raise NotFoundError("MCP Tool", tool_id)
         return self._to_dict(tool)
@@ -103,39 +139,112 @@ class MCPToolService(BaseService):
     
     def list_tools(self, organization_id: str) -> List[Dict[str, Any]]:
         """Get all MCP tools for a specific organization"""
-        tools = self.repository.get_by_organization(organization_id)
-        return [self._to_dict(tool) for tool in tools]
+        cache_key = (str(organization_id),)
+        tools = tool_list_cache.get(cache_key)
+        if tools is None:
+            tools = [self._to_dict(tool) for tool in self.repository.get_by_organization(organization_id)]
+            tool_list_cache.set(cache_key, tools)
+        return tools
     
-    def update_tool(self, tool_id: str, **kwargs) -> Optional[Dict[str, Any]]:
-        """Update MCP tool"""
-        self.logger.info(f"Updating MCP tool: {tool_id}")
+    def list_tools_page(self, organization_id: str, limit: int, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """Get one page of an organization's MCP tools and the organization's total tool count"""
+        cache_key = (str(organization_id), limit, offset)
+        page = tool_list_cache.get(cache_key)
+        if page is None:
+            tools, total = self.repository.get_page_by_organization(organization_id, limit, offset)
+            page = ([self._to_dict(tool) for tool in tools], total)
+            tool_list_cache.set(cache_key, page)
+        return page
+    
+    def update_tool(self, tool_id: str, organization_id: str, **kwargs) -> Optional[Dict[str, Any]]:
+        """Update MCP tool within organization"""
+        self.logger.info("Updating MCP tool: %s in organization: %s", tool_id, organization_id)
         
-        tool = self.repository.update(tool_id, **kwargs)
+        tool = self.repository.update_in_organization(tool_id, organization_id, **kwargs)
         if not tool:
             raise NotFoundError("MCP Tool", tool_id)
         
+        _invalidate_tool_lists(organization_id)
+        tool_schema_cache.pop((str(organization_id), str(tool_id)))
+        
         # Update intent data if name or description changed
         if 'name' in kwargs or 'description' in kwargs:
-            self._update_intent_data_for_tool(tool.organization_id, tool_id, tool.name, tool.description)
+            self._update_intent_data_for_tool(organization_id, tool_id, tool.name, tool.description)
         
         return self._to_dict(tool)
     
-    def delete_tool(self, tool_id: str) -> bool:
-        """Delete MCP tool"""
-        self.logger.info(f"Deleting MCP tool: {tool_id}")
-        
-        # Get the tool first to retrieve organization_id
-        tool = self.repository.get_by_id(tool_id)
-        if not tool:
-            raise NotFoundError("MCP Tool", tool_id)
-        
-        organization_id = tool.organization_id
+    def delete_tool(self, tool_id: str, organization_id: str) -> bool:
+        """Delete MCP tool within organization"""
+        self.logger.info("Deleting MCP tool: %s in organization: %s", tool_id, organization_id)
         
-        success = self.repository.delete(tool_id)
+        success = self.repository.delete_in_organization(tool_id, organization_id)
         if not success:
             raise NotFoundError("MCP Tool", tool_id)
         
+        _invalidate_tool_lists(organization_id)
+        tool_schema_cache.pop((str(organization_id), str(tool_id)))
+        
         # Delete associated intent data
         self._delete_intent_data_for_tool(organization_id, tool_id)
         
         return success
+    
+    async def test_tool_connection(self, tool_id: str, organization_id: str) -> Dict[str, Any]:
+        """Ping the tool's MCP server and report the round-trip time"""
+        started = time.perf_counter()
+        await self._call_tool_server(tool_id, organization_id, "ping")
+        return {"reachable": True, "latency_ms": round((time.perf_counter() - started) * 1000, 2)}
+    
+    async def execute_tool(self, tool_id: str, organization_id: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Invoke a tool on the MCP server (parameters: name, arguments)"""
+        return await self._call_tool_server(tool_id, organization_id, "tools/call", {
+            "name": parameters.get("name"),
+            "arguments": parameters.get("arguments", {})
+        })
+    
+    async def get_tool_schema(self, tool_id: str, organization_id: str) -> List[Dict[str, Any]]:
+        """List the tools, with their input schemas, exposed by the MCP server"""
+        result = await self._call_tool_server(tool_id, organization_id, "tools/list")
+        return result.get("tools", [])
+    
+    async def get_tool_schema_with_etag(self, tool_id: str, organization_id: str) -> Tuple[List[Dict[str, Any]], str]:
+        """Get the tool server's schema and its ETag, served from cache while it is fresh"""
+        cache_key = (str(organization_id), str(tool_id))
+        cached = tool_schema_cache.get(cache_key)
+        if cached is None:
+            schema = await self.get_tool_schema(tool_id, organization_id)
+            cached = (schema, content_etag(schema))
+            tool_schema_cache.set(cache_key, cached)
+        return cached
+    
+    async def _call_tool_server(self, tool_id: str, organization_id: str, method: str,
+                                params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send a JSON-RPC request to the endpoint of one of the organization's tools over the shared HTTP client"""
+        # The repository is synchronous - keep the lookup off the event loop
+        tool = await run_in_threadpool(self.repository.get_by_id_in_organization, tool_id, organization_id)
+        if not tool:
+            raise NotFoundError("MCP Tool", tool_id)
+        
+        payload = {"jsonrpc": "2.0", "id": str(uuid4()), "method": method}
+        if params is not None:
+            payload["params"] = params
+        headers = {"Accept": "application/json, text/event-stream", **(tool.auth_headers or {})}
+        
+        try:
+            response = await outbound_http.client.post(tool.endpoint_url, json=payload, headers=headers)
+            response.raise_for_status()
+            message = self._parse_rpc_response(response)
+        except (httpx.HTTPError, ValueError) as e:
+            raise ExternalServiceError(tool.name, str(e))
+        
+        if message.get("error"):
+            raise ExternalServiceError(tool.name, message["error"].get("message", "Unknown error"))
+        return message.get("result", {})
+    
+    @staticmethod
+    def _parse_rpc_response(response: httpx.Response) -> Dict[str, Any]:
+        """Read a JSON-RPC reply sent either as plain JSON or as a Streamable HTTP event stream"""
+        if response.headers.get("content-type", "").startswith("text/event-stream"):
+            events = [line[5:].strip() for line in response.text.splitlines() if line.startswith("data:")]
+            return json.loads(events[-1]) if events else {}
+        return response.json()
@@ -1,12 +1,24 @@
 """
 Organization service for managing organizations and memberships
 """
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 from uuid import UUID
 
 from app.models.organization import Organization, OrganizationUser, OrganizationRole
 from app.repositories.organization_repository import OrganizationRepository
 from app.services.base import BaseService
+from app.services.authorization_service import invalidate_permission_cache
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+# Membership roles keyed by (organization_id, user_id). Only members are cached,
+# so a user added elsewhere is never hidden behind a stale "not a member". Changes
+# are only invalidated in this process, so the TTL is kept to a few seconds.
+role_cache = TTLCache(
+    "organization_roles",
+    maxsize=settings.organization_role_cache_size,
+    ttl=settings.organization_role_cache_ttl_seconds
+)
 
 
 class OrganizationService(BaseService):
@@ -116,6 +128,10 @@ class OrganizationService(BaseService):
         """Get all users in an organization"""
         return self.repository.get_organization_users(organization_id)
     
+    def iter_organization_users(self, organization_id: UUID) -> Iterator[OrganizationUser]:
+        """Iterate over all users in an organization without loading them all at once"""
+        return self.repository.iter_organization_users(organization_id)
+    
     def add_user_to_organization(
         self, 
         organization_id: UUID, 
@@ -133,7 +149,10 @@ class OrganizationService(BaseService):
         if existing_role:
             raise ValueError("User is already a member of this organization")
         
-        return self.repository.add_user_to_organization(organization_id, user_id, role)
+        membership = self.repository.add_user_to_organization(organization_id, user_id, role)
+        role_cache.pop((organization_id, user_id))
+        invalidate_permission_cache(organization_id)
+        return membership
     
     def get_user_role_in_organization(
         self, 
@@ -141,12 +160,33 @@ class OrganizationService(BaseService):
         user_id: UUID
     ) -> Optional[OrganizationRole]:
         """Get user's role in an organization"""
-        return self.repository.get_user_role_in_organization(organization_id, user_id)
+        key = (organization_id, user_id)
+        role = role_cache.get(key)
+        if role is None:
+            role = self.repository.get_user_role_in_organization(organization_id, user_id)
+            if role is not None:
+                role_cache.set(key, role)
+        return role
+    
+    def get_user_roles_in_organization(
+        self, 
+        organization_id: UUID, 
+        user_ids: List[UUID]
+    ) -> Dict[UUID, Optional[OrganizationRole]]:
+        """Get several users' roles in an organization, querying only for uncached ones"""
+        roles = {user_id: role_cache.get((organization_id, user_id)) for user_id in user_ids}
+        missing = [user_id for user_id, role in roles.items() if role is None]
+        if missing:
+            found = self.repository.get_user_roles_in_organization(organization_id, missing)
+            for user_id, role in found.items():
+                role_cache.set((organization_id, user_id), role)
+            roles.update(found)
+        return roles
     
     def remove_user_from_organization(self, organization_id: UUID, user_id: UUID):
         """Remove a user from an organization"""
-        # Check if user is in organization
-        role = self.repository.get_user_role_in_organization(organization_id, user_id)
+        # Check if user is in organization (usually answered by the role cache the caller just warmed)
+        role = self.get_user_role_in_organization(organization_id, user_id)
         if not role:
             raise ValueError("User is not a member of this organization")
         
@@ -155,6 +195,8 @@ class OrganizationService(BaseService):
             raise ValueError("Cannot remove organization owner")
         
         self.repository.remove_user_from_organization(organization_id, user_id)
+        role_cache.pop((organization_id, user_id))
+        invalidate_permission_cache(organization_id)
     
     def user_has_access_to_organization(
         self, 
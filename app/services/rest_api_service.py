@@ -4,20 +4,30 @@ REST API Service implementation
 import json
 import asyncio
 import aiohttp
-from typing import List, Optional, Dict, Any, Union
-from uuid import UUID
-from app.repositories import RestAPIRepository
+from starlette.concurrency import run_in_threadpool
+from typing import Callable, Iterator, List, Optional, Dict, Any, Tuple, Union
+from datetime import datetime
+from uuid import UUID, uuid4
+from app.repositories import RestAPIRepository, RestAPIImportJobRepository
 from app.repositories.intent_data_repository import IntentDataRepository
+from app.models.rest_api import RestAPI
+from app.core.database import db_manager
 from app.core.exceptions import NotFoundError, ConflictError, ValidationException
 from .base import BaseService
+from .intent_data_service import invalidate_intent_data_cache
+
+# OpenAPI imports record their progress after every this many APIs
+IMPORT_PROGRESS_BATCH_SIZE = 50
 
 
 class RestAPIService(BaseService):
     """Service for REST API business logic"""
     
-    def __init__(self, repository: RestAPIRepository, intent_data_repository: Optional[IntentDataRepository] = None):
+    def __init__(self, repository: RestAPIRepository, intent_data_repository: Optional[IntentDataRepository] = None,
+                 import_job_repository: Optional[RestAPIImportJobRepository] = None):
         super().__init__(repository)
         self.intent_data_repository = intent_data_repository
+        self.import_job_repository = import_job_repository
     
     def _create_intent_data_for_api(self, organization_id: str, api_id: str, api_name: str, api_description: str = None):
         """Helper method to create intent data for REST API"""
@@ -35,6 +45,7 @@ class RestAPIService(BaseService):
                 self.logger.info(f"Created intent data for REST API: {api_name}")
             except Exception as e:
                 self.logger.error(f"Failed to create intent data for REST API {api_name}: {e}")
+            invalidate_intent_data_cache(organization_id)
     
     def _update_intent_data_for_api(self, organization_id: str, api_id: str, api_name: str, api_description: str = None):
         """Helper method to update intent data for REST API"""
@@ -51,6 +62,7 @@ class RestAPIService(BaseService):
                         break
             except Exception as e:
                 self.logger.error(f"Failed to update intent data for REST API {api_name}: {e}")
+            invalidate_intent_data_cache(organization_id)
     
     def _delete_intent_data_for_api(self, organization_id: str, api_id: str):
         """Helper method to delete intent data for REST API"""
@@ -61,6 +73,56 @@ class RestAPIService(BaseService):
                     self.logger.info(f"Deleted {deleted_count} intent data records for REST API: {api_id}")
             except Exception as e:
                 self.logger.error(f"Failed to delete intent data for REST API {api_id}: {e}")
+            invalidate_intent_data_cache(organization_id)
+    
+    def _delete_intent_data_for_apis(self, organization_id: str, api_ids: List[UUID]):
+        """Helper method to delete intent data for several REST APIs (left for the caller to commit)"""
+        if self.intent_data_repository:
+            try:
+                deleted_count = self.intent_data_repository.delete_by_sources(organization_id, "rest_api", api_ids)
+                if deleted_count > 0:
+                    self.logger.info(f"Deleted {deleted_count} intent data records for {len(api_ids)} REST APIs")
+            except Exception as e:
+                self.logger.error(f"Failed to delete intent data for REST APIs: {e}")
+                self.intent_data_repository.db.rollback()
+            invalidate_intent_data_cache(organization_id)
+    
+    def _api_values(self, organization_id: str, api_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate a REST API definition and return its column values with defaults applied"""
+        self._validate_data(api_data, ['name', 'base_url', 'method'])
+        
+        # Validate HTTP method
+        method = api_data['method']
+        valid_methods = ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS']
+        if method.upper() not in valid_methods:
+            raise ValidationException(f"Invalid HTTP method. Must be one of: {', '.join(valid_methods)}")
+        
+        return {
+            'name': api_data['name'],
+            'description': api_data.get('description'),
+            'base_url': api_data['base_url'],
+            'version': api_data.get('version', "v1"),
+            'method': method.upper(),
+            'resource_path': api_data.get('resource_path'),
+            'request_schema': api_data.get('request_schema'),
+            'response_schema': api_data.get('response_schema'),
+            'headers': api_data.get('headers') or {},
+            'auth_headers': api_data.get('auth_headers') or {},
+            'cookies': api_data.get('cookies') or {},
+            'query_params': api_data.get('query_params') or {},
+            'path_params': api_data.get('path_params') or {},
+            'openapi_spec_url': api_data.get('openapi_spec_url'),
+            'operation_id': api_data.get('operation_id'),
+            'tags': api_data.get('tags') or [],
+            'organization_id': organization_id,
+            'auth_method': api_data.get('auth_method'),
+            'enabled': api_data.get('enabled', True),
+            'status': "active",
+            'rate_limit': api_data.get('rate_limit'),
+            'timeout': api_data.get('timeout') or {"connect": 30, "read": 60},
+            'documentation_url': api_data.get('documentation_url'),
+            'examples': api_data.get('examples') or {}
+        }
     
     def create_api(self, organization_id: str, name: str, base_url: str, method: str = "GET",
                    description: str = None, version: str = "v1", resource_path: str = None,
@@ -73,50 +135,26 @@ class RestAPIService(BaseService):
                    rate_limit: Dict[str, Any] = None, timeout: Dict[str, int] = None,
                    documentation_url: str = None, examples: Dict[str, Any] = None) -> Dict[str, Any]:
         """Create a new REST API configuration"""
-        self._validate_data({'name': name, 'base_url': base_url, 'method': method}, 
-                          ['name', 'base_url', 'method'])
-        
-        # Validate HTTP method
-        valid_methods = ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS']
-        if method.upper() not in valid_methods:
-            raise ValidationException(f"Invalid HTTP method. Must be one of: {', '.join(valid_methods)}")
+        values = self._api_values(organization_id, {
+            'name': name, 'description': description, 'base_url': base_url, 'version': version,
+            'method': method, 'resource_path': resource_path,
+            'request_schema': request_schema, 'response_schema': response_schema,
+            'headers': headers, 'auth_headers': auth_headers, 'cookies': cookies,
+            'query_params': query_params, 'path_params': path_params, 'tags': tags,
+            'auth_method': auth_method, 'enabled': enabled,
+            'openapi_spec_url': openapi_spec_url, 'operation_id': operation_id,
+            'rate_limit': rate_limit, 'timeout': timeout,
+            'documentation_url': documentation_url, 'examples': examples
+        })
         
         # Check if REST API with same name exists in this organization
         existing_api = self.repository.get_by_name_and_organization(name, organization_id)
         if existing_api:
             raise ConflictError(f"REST API with name '{name}' already exists in this organization")
         
-        self.logger.info(f"Creating REST API: {name} ({method} {base_url}) for organization: {organization_id}")
-        
-        # Set defaults
-        timeout = timeout or {"connect": 30, "read": 60}
-        
-        api = self.repository.create(
-            name=name,
-            description=description,
-            base_url=base_url,
-            version=version,
-            method=method.upper(),
-            resource_path=resource_path,
-            request_schema=request_schema,
-            response_schema=response_schema,
-            headers=headers or {},
-            auth_headers=auth_headers or {},
-            cookies=cookies or {},
-            query_params=query_params or {},
-            path_params=path_params or {},
-            openapi_spec_url=openapi_spec_url,
-            operation_id=operation_id,
-            tags=tags or [],
-            organization_id=organization_id,
-            auth_method=auth_method,
-            enabled=enabled,
-            status="active",
-            rate_limit=rate_limit,
-            timeout=timeout,
-            documentation_url=documentation_url,
-            examples=examples or {}
-        )
+        self.logger.info(f"Creating REST API: {name} ({values['method']} {base_url}) for organization: {organization_id}")
+        
+        api = self.repository.create(**values)
         
         # Create intent data for the new REST API
         self._create_intent_data_for_api(organization_id, str(api.id), name, description)
@@ -124,61 +162,149 @@ class RestAPIService(BaseService):
         return self._to_dict(api)
     
     def create_multiple_apis(self, organization_id: str, apis: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Create multiple REST API configurations"""
-        created_apis = []
+        """
+        Create multiple REST API configurations in one transaction
+        
+        Every API is validated up front (including one name-conflict query for
+        the whole batch); the valid ones are then inserted together with their
+        intent data in a single executemany and commit. Invalid APIs are
+        reported per item, in request order.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(apis)
+        pending: List[Tuple[int, Dict[str, Any]]] = []
+        for index, api_data in enumerate(apis):
+            try:
+                pending.append((index, self._api_values(organization_id, api_data)))
+            except Exception as e:
+                results[index] = self._failed_api(api_data, e)
+        
+        # Names already taken in the organization, plus those claimed earlier in this batch
+        taken = self.repository.get_names_in_organization(organization_id, [values['name'] for _, values in pending])
+        rows: List[Tuple[int, Dict[str, Any]]] = []
+        now = datetime.utcnow()
+        for index, values in pending:
+            name = values['name']
+            if name in taken:
+                results[index] = self._failed_api(
+                    values, ConflictError(f"REST API with name '{name}' already exists in this organization")
+                )
+                continue
+            taken.add(name)
+            values.update(id=uuid4(), created_at=now, updated_at=now)
+            rows.append((index, values))
         
-        for api_data in apis:
+        if rows:
+            self.logger.info(f"Creating {len(rows)} REST APIs for organization: {organization_id}")
             try:
-                # Add organization_id to each API data
-                api_data['organization_id'] = organization_id
-                api = self.create_api(**api_data)
-                created_apis.append(api)
+                if self.intent_data_repository:
+                    # Not committed on its own - the REST API insert below commits both
+                    self.intent_data_repository.insert_many([
+                        self._intent_data_values(organization_id, values) for _, values in rows
+                    ])
+                self.repository.insert_many([values for _, values in rows])
             except Exception as e:
-                self.logger.error(f"Failed to create API {api_data.get('name', 'Unknown')}: {e}")
-                # Continue with other APIs, but log the error
-                created_apis.append({
-                    "name": api_data.get('name', 'Unknown'),
-                    "error": str(e),
-                    "status": "failed"
-                })
-        
-        return created_apis
-    
-    async def create_from_openapi_spec(self, organization_id: str, spec_url: str, 
-                                     tags_to_attach: List[str] = None) -> List[Dict[str, Any]]:
-        """Create multiple REST APIs from OpenAPI/Swagger specification"""
+                self.logger.error(f"Failed to create {len(rows)} REST APIs: {e}")
+                self.repository.db.rollback()
+                for index, values in rows:
+                    results[index] = self._failed_api(values, e)
+            else:
+                for index, values in rows:
+                    results[index] = self._to_dict(RestAPI(**values))
+            if self.intent_data_repository:
+                invalidate_intent_data_cache(organization_id)
+        
+        return results
+    
+    def _failed_api(self, api_data: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        """Result entry for an API that could not be created"""
+        self.logger.error(f"Failed to create API {api_data.get('name', 'Unknown')}: {error}")
+        return {
+            "name": api_data.get('name', 'Unknown'),
+            "error": str(error),
+            "status": "failed"
+        }
+    
+    @staticmethod
+    def _intent_data_values(organization_id: str, api_values: Dict[str, Any]) -> Dict[str, Any]:
+        """Intent data row for a REST API about to be inserted"""
+        name = api_values['name']
+        return {
+            'id': uuid4(),
+            'organization_id': organization_id,
+            'name': f"API: {name}",
+            'description': api_values['description'] or f"Intent data for REST API: {name}",
+            'source_type': "rest_api",
+            'source_id': api_values['id'],
+            'category': "API",
+            'enabled': True,
+            'created_at': api_values['created_at'],
+            'updated_at': api_values['created_at']
+        }
+    
+    @staticmethod
+    async def _fetch_openapi_spec(spec_url: str) -> str:
+        """Download an OpenAPI/Swagger specification"""
+        async with aiohttp.ClientSession() as session:
+            async with session.get(spec_url) as response:
+                if response.status != 200:
+                    raise ValidationException(f"Failed to fetch OpenAPI spec: HTTP {response.status}")
+                
+                return await response.text()
+    
+    def start_openapi_import(self, organization_id: str, spec_url: str,
+                             tags_to_attach: List[str] = None) -> Dict[str, Any]:
+        """Record a pending OpenAPI import job; the import itself runs in the background"""
+        job = self.import_job_repository.create(
+            organization_id=organization_id,
+            spec_url=spec_url,
+            tags=tags_to_attach or [],
+            status="pending"
+        )
+        self.logger.info(f"Queued OpenAPI import {job.id} of {spec_url} for organization: {organization_id}")
+        return self._to_dict(job)
+    
+    def get_import_job(self, job_id: str, organization_id: str) -> Dict[str, Any]:
+        """Get an OpenAPI import job of the organization"""
         try:
-            # Download the OpenAPI specification
-            async with aiohttp.ClientSession() as session:
-                async with session.get(spec_url) as response:
-                    if response.status != 200:
-                        raise ValidationException(f"Failed to fetch OpenAPI spec: HTTP {response.status}")
-                    
-                    spec_content = await response.text()
-                    openapi_spec = json.loads(spec_content)
-            
-            # Parse the OpenAPI specification and create API configurations
-            apis = self._parse_openapi_spec(openapi_spec, spec_url, tags_to_attach)
-            
-            # Create the APIs
-            created_apis = []
-            for api_data in apis:
-                api_data['organization_id'] = organization_id
-                try:
-                    api = self.create_api(**api_data)
-                    created_apis.append(api)
-                except Exception as e:
-                    self.logger.error(f"Failed to create API from OpenAPI spec: {e}")
-                    created_apis.append({
-                        "name": api_data.get('name', 'Unknown'),
-                        "error": str(e),
-                        "status": "failed"
-                    })
-            
-            return created_apis
+            key = UUID(job_id)
+        except ValueError:
+            raise NotFoundError("Import job", job_id)
+        job = self.import_job_repository.get_by_id_in_organization(key, organization_id)
+        if not job:
+            raise NotFoundError("Import job", job_id)
+        return self._to_dict(job)
+    
+    def do_openapi_import(self, job_id: str, organization_id: str, spec_content: str, spec_url: str,
+                          tags_to_attach: List[str] = None) -> None:
+        """Parse a downloaded OpenAPI specification and create its APIs, recording progress on the job"""
+        self.import_job_repository.update(job_id, status="running")
+        try:
+            apis = self._parse_openapi_spec(json.loads(spec_content), spec_url, tags_to_attach)
+            self.import_job_repository.update(job_id, total_requested=len(apis))
             
+            created, failed = [], []
+            for start in range(0, len(apis), IMPORT_PROGRESS_BATCH_SIZE):
+                batch = apis[start:start + IMPORT_PROGRESS_BATCH_SIZE]
+                for result in self.create_multiple_apis(organization_id, batch):
+                    if "error" in result:
+                        failed.append({"name": result["name"], "error": result["error"]})
+                    else:
+                        created.append(result["id"])
+                # Publish progress after every batch, so pollers see partial results
+                self.import_job_repository.update(
+                    job_id, total_created=len(created), created=list(created), failed=list(failed)
+                )
         except Exception as e:
-            raise ValidationException(f"Failed to process OpenAPI specification: {e}")
+            self.fail_import_job(job_id, f"Failed to process OpenAPI specification: {e}")
+            return
+        
+        self.import_job_repository.update(job_id, status="completed")
+        self.logger.info(f"OpenAPI import {job_id} completed: {len(created)} of {len(apis)} APIs created")
+    
+    def fail_import_job(self, job_id: str, error: str) -> None:
+        """Mark an OpenAPI import job as failed"""
+        self.logger.error(f"OpenAPI import {job_id} failed: {error}")
+        self.import_job_repository.update(job_id, status="failed", error=error)
     
     def _parse_openapi_spec(self, spec: Dict[str, Any], spec_url: str, 
                            tags_to_attach: List[str] = None) -> List[Dict[str, Any]]:
@@ -324,13 +450,24 @@ class RestAPIService(BaseService):
         
         return examples
     
-    def get_api(self, api_id: str) -> Optional[Dict[str, Any]]:
-        """Get REST API by ID"""
-        api = self.repository.get_by_id(api_id)
+    def get_api(self, api_id: str, organization_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Get REST API by ID (scoped to the organization when one is given)"""
+        if organization_id is not None:
+            api = self.repository.get_by_id_in_organization(api_id, organization_id)
+        else:
+            api = self.repository.get_by_id(api_id)
         if not api:
             raise NotFoundError("REST API", api_id)
         return self._to_dict(api)
     
+    def get_api_version(self, api_id: str, organization_id: str) -> Tuple[str, str]:
+        """Get the ID and last update time of an organization's REST API, formatted as get_api returns them"""
+        version = self.repository.get_version_in_organization(api_id, organization_id)
+        if not version:
+            raise NotFoundError("REST API", api_id)
+        entity_id, updated_at = version
+        return str(entity_id), updated_at.isoformat()
+    
     def get_all_apis(self) -> List[Dict[str, Any]]:
         """Get all REST APIs"""
         apis = self.repository.get_all()
@@ -341,13 +478,28 @@ class RestAPIService(BaseService):
         apis = self.repository.get_by_organization(organization_id)
         return [self._to_dict(api) for api in apis]
     
+    def iter_apis_page(
+        self,
+        organization_id: str,
+        limit: int,
+        offset: int = 0,
+        **filters
+    ) -> Iterator[Tuple[Dict[str, Any], int]]:
+        """Iterate over one filtered page of an organization's REST APIs, each paired with the filtered total"""
+        for api, total in self.repository.iter_page_by_organization(organization_id, limit, offset, **filters):
+            yield self._to_dict(api), total
+    
+    def count_apis(self, organization_id: str, **filters) -> int:
+        """Count an organization's REST APIs matching the filters"""
+        return self.repository.count_by_organization(organization_id, **filters)
+    
     def list_apis_by_tags(self, organization_id: str, tags: List[str]) -> List[Dict[str, Any]]:
         """Get REST APIs by tags for a specific organization"""
         apis = self.repository.get_by_tags(organization_id, tags)
         return [self._to_dict(api) for api in apis]
     
-    def update_api(self, api_id: str, **kwargs) -> Optional[Dict[str, Any]]:
-        """Update REST API"""
+    def update_api(self, api_id: str, organization_id: Optional[str] = None, **kwargs) -> Optional[Dict[str, Any]]:
+        """Update REST API (scoped to the organization when one is given)"""
         self.logger.info(f"Updating REST API: {api_id}")
         
         # Validate HTTP method if provided
@@ -357,7 +509,10 @@ class RestAPIService(BaseService):
                 raise ValidationException(f"Invalid HTTP method. Must be one of: {', '.join(valid_methods)}")
             kwargs['method'] = kwargs['method'].upper()
         
-        api = self.repository.update(api_id, **kwargs)
+        if organization_id is not None:
+            api = self.repository.update_in_organization(api_id, organization_id, **kwargs)
+        else:
+            api = self.repository.update(api_id, **kwargs)
         if not api:
             raise NotFoundError("REST API", api_id)
         
@@ -367,10 +522,17 @@ class RestAPIService(BaseService):
         
         return self._to_dict(api)
     
-    def delete_api(self, api_id: str) -> bool:
-        """Delete REST API"""
+    def delete_api(self, api_id: str, organization_id: Optional[str] = None) -> bool:
+        """Delete REST API (scoped to the organization when one is given)"""
         self.logger.info(f"Deleting REST API: {api_id}")
         
+        if organization_id is not None:
+            # Intent data goes first so both deletes commit together
+            self._delete_intent_data_for_api(organization_id, api_id)
+            if not self.repository.delete_in_organization(api_id, organization_id):
+                raise NotFoundError("REST API", api_id)
+            return True
+        
         # Get the API first to retrieve organization_id
         api = self.repository.get_by_id(api_id)
         if not api:
@@ -408,3 +570,93 @@ class RestAPIService(BaseService):
                 results["failed"].append(api_id)
         
         return results
+    
+    def get_apis_by_ids(self, organization_id: str, api_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get several REST APIs of an organization at once; IDs that are not found map to None"""
+        keys: Dict[str, Optional[UUID]] = {}
+        for api_id in api_ids:
+            try:
+                keys[api_id] = UUID(api_id)
+            except ValueError:
+                keys[api_id] = None
+        
+        wanted = list({key for key in keys.values() if key is not None})
+        found = {}
+        if wanted:
+            found = {api.id: self._to_dict(api) for api in self.repository.get_by_ids_in_organization(organization_id, wanted)}
+        return {api_id: found.get(key) for api_id, key in keys.items()}
+    
+    def verify_and_delete(self, organization_id: str, api_ids: List[str]) -> Dict[str, Any]:
+        """Delete the given REST APIs that belong to the organization; the rest are reported as not found"""
+        results = {
+            "deleted": [],
+            "failed": [],
+            "not_found": []
+        }
+        
+        # Map each well-formed ID to the string the caller sent
+        requested: Dict[UUID, str] = {}
+        for api_id in api_ids:
+            try:
+                requested.setdefault(UUID(api_id), api_id)
+            except ValueError:
+                results["not_found"].append(api_id)
+        
+        verified = self.repository.get_ids_in_organization(organization_id, list(requested))
+        results["not_found"].extend(api_id for key, api_id in requested.items() if key not in verified)
+        if not verified:
+            return results
+        
+        verified_ids = list(verified)
+        try:
+            self._delete_intent_data_for_apis(organization_id, verified_ids)
+            self.repository.delete_by_ids(organization_id, verified_ids)
+            results["deleted"].extend(requested[api_id] for api_id in verified_ids)
+        except Exception as e:
+            self.logger.error(f"Failed to delete {len(verified_ids)} REST APIs: {e}")
+            results["failed"].extend(requested[api_id] for api_id in verified_ids)
+        
+        return results
+    
+    def delete_all_for_org(self, organization_id: str) -> List[str]:
+        """Delete every REST API of an organization, returns the deleted IDs"""
+        self.logger.info(f"Deleting all REST APIs for organization: {organization_id}")
+        
+        if self.intent_data_repository:
+            try:
+                self.intent_data_repository.delete_by_source_type(organization_id, "rest_api")
+            except Exception as e:
+                self.logger.error(f"Failed to delete intent data for REST APIs: {e}")
+                self.intent_data_repository.db.rollback()
+        
+        deleted_ids = self.repository.delete_by_organization(organization_id)
+        invalidate_intent_data_cache(organization_id)
+        return [str(api_id) for api_id in deleted_ids]
+
+
+def _run_with_import_service(work: Callable[[RestAPIService], None]) -> None:
+    """Run work against a RestAPIService bound to a fresh session"""
+    with db_manager.get_session() as db:
+        work(RestAPIService(RestAPIRepository(db), IntentDataRepository(db), RestAPIImportJobRepository(db)))
+
+
+async def run_openapi_import_job(job_id: str, organization_id: str, spec_url: str,
+                                 tags_to_attach: List[str] = None) -> None:
+    """
+    Background task for an OpenAPI import job
+    Runs after the response has been sent, so it opens its own session
+    instead of relying on the request's
+    """
+    try:
+        spec_content = await RestAPIService._fetch_openapi_spec(spec_url)
+    except Exception as e:
+        error = str(e) if isinstance(e, ValidationException) else f"Failed to fetch OpenAPI spec: {e}"
+        await run_in_threadpool(_run_with_import_service, lambda service: service.fail_import_job(job_id, error))
+        return
+    
+    # Parsing a large spec is CPU-bound and the session is synchronous -
+    # keep both off the event loop
+    await run_in_threadpool(
+        _run_with_import_service,
+        lambda service: service.do_openapi_import(job_id, organization_id, spec_content, spec_url, tags_to_attach)
+    )
@@ -4,10 +4,21 @@ Security Service implementation
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from app.repositories import SecurityRoleRepository
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.core.exceptions import NotFoundError, ConflictError
 from app.models.security_role import RoleType
+from .authorization_service import invalidate_permission_cache
 from .base import BaseService
 
+# Role lists per organization (None = all active roles); roles change rarely. Other
+# workers see a role change once their entry expires (LIST_CACHE_TTL_SECONDS)
+role_list_cache = TTLCache(
+    "security_role_lists",
+    maxsize=settings.list_cache_size,
+    ttl=settings.list_cache_ttl_seconds
+)
+
 
 class SecurityService(BaseService):
     """Service for Security and RBAC operations"""
@@ -28,6 +39,8 @@ class SecurityService(BaseService):
         self.logger.info(f"Creating role: {role_data['name']}")
         
         role = self.role_repo.create(**role_data)
+        invalidate_permission_cache()
+        role_list_cache.clear()
         return self._to_dict(role)
 
     def create_organization_role(self, role_data: Dict[str, Any], organization_id: UUID) -> Dict[str, Any]:
@@ -46,10 +59,21 @@ class SecurityService(BaseService):
         self.logger.info(f"Creating organization role: {role_data['name']} for organization: {organization_id}")
         
         role = self.role_repo.create(**role_data)
+        invalidate_permission_cache()
+        role_list_cache.pop(str(organization_id))
+        role_list_cache.pop(None)
         return self._to_dict(role)
 
     def list_roles(self, organization_id: Optional[UUID] = None) -> List[Dict[str, Any]]:
         """List security roles filtered by organization context"""
+        cache_key = str(organization_id) if organization_id else None
+        roles = role_list_cache.get(cache_key)
+        if roles is None:
+            roles = self._load_roles(organization_id)
+            role_list_cache.set(cache_key, roles)
+        return roles
+
+    def _load_roles(self, organization_id: Optional[UUID]) -> List[Dict[str, Any]]:
         if organization_id:
             self.logger.info(f"Fetching active security roles for organization: {organization_id}")
             # Get system roles (no organization_id) and organization roles for this organization
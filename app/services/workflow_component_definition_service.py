@@ -1,12 +1,22 @@
 """
 Workflow Component Definition Service
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 
 from app.repositories.workflow_component_definition_repository import WorkflowComponentDefinitionRepository
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.core.exceptions import NotFoundError
 from app.services.base import BaseService
 
+# Distinct component categories; definitions are seeded, so this rarely changes
+category_cache = TTLCache("workflow_component_categories", maxsize=1, ttl=settings.list_cache_ttl_seconds)
+
+
+def invalidate_category_cache() -> None:
+    """Drop the cached categories (call after component definitions are written)"""
+    category_cache.clear()
+
 
 class WorkflowComponentDefinitionService(BaseService):
     """Service for workflow component definition business logic"""
@@ -36,14 +46,18 @@ class WorkflowComponentDefinitionService(BaseService):
     
     def get_categories(self) -> List[str]:
         """Get all unique categories"""
-        return self.repository.get_categories()
+        categories = category_cache.get("categories")
+        if categories is None:
+            categories = self.repository.get_categories()
+            category_cache.set("categories", categories)
+        return list(categories)
     
     def search_components(self, search_term: str) -> List[Dict[str, Any]]:
         """Search component definitions by name or description"""
         components = self.repository.search_by_name_or_description(search_term)
         return [self._to_dict(component) for component in components]
     
-    def get_components_by_tags(self, tags: List[str]) -> List[Dict[str, Any]]:
+    def get_components_by_tags(self, tags: Sequence[str]) -> List[Dict[str, Any]]:
         """Get components that have any of the specified tags"""
         components = self.repository.get_by_tags(tags)
         return [self._to_dict(component) for component in components]
\ No newline at end of file
@@ -3,17 +3,24 @@ Main application entry point with SOLID architecture
 """
 import os
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+from anyio import to_thread
 
 # Set default environment for direct Python execution
 if not os.getenv("ENVIRONMENT"):
     os.environ["ENVIRONMENT"] = "dev"
 
 from app.core.config import settings
-from app.core.database import engine, create_tables, init_db, get_db
+from app.core.database import engine, create_tables, init_db, get_db, warm_pool
+from app.core.auth_client import get_auth_client
+from app.core.exceptions import APIException
+from app.core.http_client import outbound_http
 from app.core.logging import setup_logging, get_logger
+from app.core.dependency_introspection import install_dependency_introspection_cache
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from app.middleware import LoggingMiddleware, MetricsMiddleware
 from app.api.v1 import api_router
 # Import models to ensure they're registered with SQLAlchemy
@@ -29,24 +36,64 @@ async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
     logger.info("Starting AI Platform application...")
+    # Sync endpoints run in anyio's default thread pool; bound it to what the DB pool can serve
+    to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_max_workers
     create_tables()
     logger.info("Database tables created/verified")
     init_db()
     logger.info("Database initialized with default data")
+    warm_pool()
+    app.state.auth_client = get_auth_client()
+    app.state.outbound_http = outbound_http
     yield
     # Shutdown
     logger.info("Shutting down AI Platform application...")
+    await get_auth_client().aclose()
+    await outbound_http.aclose()
+
+
+def ensure_unique_routes(app: FastAPI) -> None:
+    """Fail fast if two routes claim the same method and path (route matching scans every route)"""
+    seen = set()
+    for route in app.routes:
+        for method in getattr(route, "methods", None) or {None}:
+            key = (method, route.path)
+            if key in seen:
+                raise RuntimeError(f"Duplicate route registered: {method} {route.path}")
+            seen.add(key)
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """Map uncaught exceptions to JSON error responses, so routes need no catch-all try/except"""
+
+    @app.exception_handler(APIException)
+    async def api_exception_handler(request: Request, exc: APIException):
+        # NotFoundError -> 404, ConflictError -> 409, etc.
+        return ORJSONResponse(status_code=exc.status_code, content={"detail": exc.message})
+
+    @app.exception_handler(Exception)
+    async def unhandled_exception_handler(request: Request, exc: Exception):
+        logger.error("Unhandled error on %s %s", request.method, request.url.path, exc_info=exc)
+        return ORJSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content={"detail": "Internal server error"}
+        )
 
 
 def create_application() -> FastAPI:
     """Create and configure FastAPI application"""
+    install_dependency_introspection_cache()
+
     app = FastAPI(
         title="AI Platform API",
         description="A comprehensive platform for managing AI agents, LLMs, and workflows",
         version="1.0.0",
+        default_response_class=ORJSONResponse,
         lifespan=lifespan
     )
 
+    register_exception_handlers(app)
+
     # Add CORS middleware using settings
     app.add_middleware(
         CORSMiddleware,
@@ -56,6 +103,13 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Compress larger responses (list endpoints) for clients that accept gzip
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=settings.gzip_minimum_size,
+        compresslevel=settings.gzip_compress_level
+    )
+
     # Add custom middleware
     app.add_middleware(LoggingMiddleware)
     app.add_middleware(MetricsMiddleware)
@@ -80,6 +134,7 @@ def create_application() -> FastAPI:
         """Health check endpoint"""
         return {"status": "healthy"}
 
+    ensure_unique_routes(app)
     return app
 
 
@@ -93,5 +148,7 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.reload,
+        # uvicorn picks uvloop and httptools automatically when they are installed
+        workers=None if settings.reload else settings.workers,
         log_level=settings.log_level.lower()
     )
\ No newline at end of file
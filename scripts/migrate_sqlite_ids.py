@@ -0,0 +1,70 @@
+"""
+Script to convert the IDs of an existing SQLite database to 16-byte BLOBs.
+Databases created before IDs were stored as BLOBs keep them as 36-character
+text, which no longer matches any lookup by ID; the application refuses to
+start until they are converted.
+"""
+
+import logging
+import uuid
+from sqlalchemy import text
+from app.core.database import db_manager
+
+logger = logging.getLogger(__name__)
+
+
+def migrate_sqlite_ids() -> int:
+    """Rewrite every text ID as the UUID's 16 raw bytes, returns the number of values converted"""
+    import app.models  # noqa: F401 - registers the model tables on Base.metadata
+
+    columns = db_manager.find_text_ids()
+    if not columns:
+        logger.info("No text IDs found, nothing to migrate")
+        return 0
+
+    converted = 0
+    with db_manager.engine.connect() as connection:
+        # Primary and foreign keys are rewritten one column at a time, so the
+        # references only line up again once every column is done
+        connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        try:
+            with connection.begin():
+                for qualified_name in columns:
+                    table, column = qualified_name.split(".")
+                    rows = connection.execute(text(
+                        f'SELECT rowid, "{column}" FROM "{table}" WHERE typeof("{column}") = \'text\''
+                    )).all()
+                    update = text(f'UPDATE "{table}" SET "{column}" = :value WHERE rowid = :rowid')
+                    connection.execute(update, [
+                        {"value": uuid.UUID(value).bytes, "rowid": rowid} for rowid, value in rows
+                    ])
+                    converted += len(rows)
+                    logger.info(f"Converted {len(rows)} IDs in {qualified_name}")
+
+                violations = connection.exec_driver_sql("PRAGMA foreign_key_check").all()
+                if violations:
+                    raise RuntimeError(f"Foreign key check failed after conversion: {violations[:5]}")
+        finally:
+            connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+
+    return converted
+
+
+if __name__ == "__main__":
+    """Run the migration script directly"""
+    import sys
+    import os
+
+    # Add the project root to Python path
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, project_root)
+
+    # Configure logging
+    logging.basicConfig(level=logging.INFO)
+
+    try:
+        converted = migrate_sqlite_ids()
+        print(f"SQLite ID migration completed successfully ({converted} IDs converted)!")
+    except Exception as e:
+        print(f"Error during SQLite ID migration: {e}")
+        sys.exit(1)
@@ -12,6 +12,62 @@ from app.models.security_role import RoleType
 logger = logging.getLogger(__name__)
 
 
+FULL_ACCESS_PERMISSIONS = {
+    "agents": ["create", "read", "update", "delete", "execute"],
+    "llms": ["create", "read", "update", "delete", "configure"],
+    "mcp-tools": ["create", "read", "update", "delete", "configure"],
+    "rag": ["create", "read", "update", "delete", "configure"],
+    "workflows": ["create", "read", "update", "delete", "deploy"],
+    "rest-apis": ["create", "read", "update", "delete"],
+    "intent-data": ["read"],
+    "metrics": ["read", "configure"],
+    "roles": ["create", "read", "update", "delete"]
+}
+
+SYSTEM_ROLES = [
+    {
+        "name": "OWNER",
+        "description": "Organization owner with full administrative privileges",
+        "permissions": FULL_ACCESS_PERMISSIONS
+    },
+    {
+        "name": "ADMIN",
+        "description": "Full system administrator with all permissions",
+        "permissions": FULL_ACCESS_PERMISSIONS
+    },
+    {
+        # Standard user with limited permissions
+        "name": "USER",
+        "description": "Standard user with basic permissions",
+        "permissions": {
+            "agents": ["read", "execute"],
+            "llms": ["read"],
+            "mcp-tools": ["read"],
+            "rag": ["read"],
+            "workflows": ["read", "execute"],
+            "rest-apis": ["read"],
+            "intent-data": ["read"],
+            "metrics": ["read"]
+        }
+    },
+    {
+        # Read-only permissions
+        "name": "VIEWER",
+        "description": "Read-only access to system resources",
+        "permissions": {
+            "agents": ["read"],
+            "llms": ["read"],
+            "mcp-tools": ["read"],
+            "rag": ["read"],
+            "workflows": ["read"],
+            "rest-apis": ["read"],
+            "intent-data": ["read"],
+            "metrics": ["read"]
+        }
+    },
+]
+
+
 def seed_security_roles():
     """Seed default security roles into the database"""
     logger.info("Starting security roles seeding...")
@@ -23,94 +79,20 @@ def seed_security_roles():
         # Initialize repository
         role_repo = SecurityRoleRepository(db)
         
-        # Check if security roles already exist
-        existing_roles = role_repo.get_all()
-        if existing_roles:
-            logger.info("Security roles already exist, skipping security role initialization")
-            return
-            
-        logger.info("Creating system security roles...")
-        
-        # Create OWNER role
-        role_repo.create(
-            name="OWNER",
-            description="Organization owner with full administrative privileges",
-            status="active",
-            type=RoleType.SYSTEM,
-            permissions={
-                "agents": ["create", "read", "update", "delete", "execute"],
-                "llms": ["create", "read", "update", "delete", "configure"],
-                "mcp-tools": ["create", "read", "update", "delete", "configure"],
-                "rag": ["create", "read", "update", "delete", "configure"],
-                "workflows": ["create", "read", "update", "delete", "deploy"],
-                "rest-apis": ["create", "read", "update", "delete"],
-                "intent-data": ["read"],
-                "metrics": ["read", "configure"],
-                "roles": ["create", "read", "update", "delete"]
-            }
-        )
+        # One INSERT ... ON CONFLICT DO NOTHING for all roles; roles that already exist are left alone
+        rows = [
+            {**role, "status": "active", "type": RoleType.SYSTEM}
+            for role in SYSTEM_ROLES
+        ]
+        inserted = role_repo.insert_missing(rows)
         
-        # Create ADMIN role
-        role_repo.create(
-            name="ADMIN",
-            description="Full system administrator with all permissions",
-            status="active",
-            type=RoleType.SYSTEM,
-            permissions={
-                "agents": ["create", "read", "update", "delete", "execute"],
-                "llms": ["create", "read", "update", "delete", "configure"],
-                "mcp-tools": ["create", "read", "update", "delete", "configure"],
-                "rag": ["create", "read", "update", "delete", "configure"],
-                "workflows": ["create", "read", "update", "delete", "deploy"],
-                "rest-apis": ["create", "read", "update", "delete"],
-                "intent-data": ["read"],
-                "metrics": ["read", "configure"],
-                "roles": ["create", "read", "update", "delete"]
-            }
-        )
-        
-        # Create USER role with limited permissions
-        role_repo.create(
-            name="USER",
-            description="Standard user with basic permissions",
-            status="active",
-            type=RoleType.SYSTEM,
-            permissions={
-                "agents": ["read", "execute"],
-                "llms": ["read"],
-                "mcp-tools": ["read"],
-                "rag": ["read"],
-                "workflows": ["read", "execute"],
-                "rest-apis": ["read"],
-                "intent-data": ["read"],
-                "metrics": ["read"]
-            }
-        )
-        
-        # Create VIEWER role with read-only permissions
-        role_repo.create(
-            name="VIEWER",
-            description="Read-only access to system resources",
-            status="active",
-            type=RoleType.SYSTEM,
-            permissions={
-                "agents": ["read"],
-                "llms": ["read"],
-                "mcp-tools": ["read"],
-                "rag": ["read"],
-                "workflows": ["read"],
-                "rest-apis": ["read"],
-                "intent-data": ["read"],
-                "metrics": ["read"]
-            }
-        )
-        
-        db.commit()
-        logger.info("System security roles seeded successfully!")
+        if inserted:
+            logger.info(f"Seeded {inserted} system security roles")
+        else:
+            logger.info("Security roles already exist, skipping security role initialization")
         
     except Exception as e:
         logger.error(f"Error seeding security roles: {e}")
-        db.rollback()
         raise e
     finally:
         db.close()